@@ -1,7 +1,9 @@
 import numpy as np
 from .model import AssignmentProblem, Assignment, NormalizedAssignmentProblem
 from ..simplex.model import Model
-from ..simplex.expressions.expression import Expression
+from ..simplex.solver import Solver as LinearSolver
+from ..simplex.crash import TriangularCrash
+from ..simplex.sparse import CSCMatrix
 from dataclasses import dataclass
 from typing import List
 from collections import defaultdict
@@ -25,32 +27,28 @@ class Solver:
     def solve(self) -> Assignment:
         model = Model("assignment")
 
-        objective_expression = Expression()
-        vars_dict = {}
-        for i in range(len(self.problem.costs)):
-            for j in range(len(self.problem.costs[0])):
-                variable = model.create_variable(f"cost{i}{j}")
-                model.add_constraint(variable <= 1)
-                objective_expression += self.problem.costs[i][j] * variable
-                vars_dict.setdefault(f"row{i}", []).append(variable)
-                vars_dict.setdefault(f"col{j}", []).append(variable)
-
-        model.minimize(objective_expression)
-        for i in range(len(self.problem.costs)):
-            model.add_constraint(sum(vars_dict[f"row{i}"], Expression()) == 1)
-        for i in range(len(self.problem.costs[0])):
-            model.add_constraint(sum(vars_dict[f"col{i}"], Expression()) == 1)
+        costs = np.asarray(self.problem.costs, dtype=float)
+        rows_n, cols_n = costs.shape
+        # the variables are the flattened assignment matrix, cost{i}_{j} is at i * cols_n + j
+        xs = model.create_variables(rows_n * cols_n, [f"cost{i}_{j}" for i in range(rows_n) for j in range(cols_n)], upper=1)
+        positions = np.arange(rows_n * cols_n)
+
+        model.minimize(costs.flatten() @ xs)
+        row_sums = CSCMatrix.from_triplets((rows_n, rows_n * cols_n), positions // cols_n, positions, np.ones(len(positions)))
+        col_sums = CSCMatrix.from_triplets((cols_n, rows_n * cols_n), positions % cols_n, positions, np.ones(len(positions)))
+        model.add_constraints(row_sums @ xs == 1)
+        model.add_constraints(col_sums @ xs == 1)
 
-        result = model.solve()
+        # the row and column sums are covered by the crash basis, instead of the first phase
+        result = model.solve(LinearSolver(crash=TriangularCrash()))
+        values = xs.values(result.assignment).reshape(rows_n, cols_n)
 
         assign = []
         for i in range(len(self.problem.costs)):
             assign.append(-1)
 
         for i in range(len(self.problem.original_problem.costs)):
-            r_val = []
-            for var in vars_dict[f"row{i}"]:
-                r_val.append(result.value(var))
+            r_val = values[i].tolist()
             if len(self.problem.original_problem.costs[0]) > r_val.index(1):
                 assign[i] = r_val.index(1)
 
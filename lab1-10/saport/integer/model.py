@@ -1,4 +1,3 @@
-from copy import deepcopy
 from ..simplex import model as lpmodel
 from . import solver as s
 
@@ -11,6 +10,12 @@ class Model(lpmodel.Model):
         ----------
         solver: Solver
         solver used to solve the model. Useful when one wants to check some statistics, solving time, etc. 
+
+        Methods:
+        --------
+        solve(timelimit: float = inf, relaxation_solver: Solver | None = None, cancellation: CancellationToken | None = None) -> Solution:
+            solves the model with branch and bound, the root relaxation with the given LP solver (the simplex by default),
+            the solving stopped by the timelimit or the cancellation returns the best solution found, marked with its interruption
     """
 
     def __str__(self):
@@ -22,12 +27,12 @@ class Model(lpmodel.Model):
 '''
         return text
 
-    def solve(self, timelimit = float('inf')):
+    def solve(self, timelimit = float('inf'), relaxation_solver = None, cancellation = None):
         if len(self.variables) == 0:
             raise Exception("Can't solve a model without any variables")
 
         if self.objective == None:
             raise Exception("Can't solve a model without an objective")
 
-        self.solver = s.Solver()
+        self.solver = s.Solver(relaxation_solver, cancellation)
         return self.solver.solve(self.translate_to_standard_form(), timelimit)
\ No newline at end of file
@@ -1,5 +1,8 @@
-from copy import deepcopy
 from ..simplex import solver as lpsolver
+from ..simplex import dual_solver as dlpsolver
+from ..simplex import limits as lm
+from ..simplex import solution as lpsolution
+from copy import copy
 import math
 import time 
 
@@ -19,10 +22,21 @@ class Solver:
         start_time: float
             when the solving started
         interrupted: bool
-            whether solving has been interrupted (by timeout)
+            whether solving has been interrupted (by timeout or cancellation)
+        interruption: Status | None
+            why the solving has been interrupted (TIME_LIMIT or CANCELLED), the returned solution is marked with it as well,
+            the LP solves get the remaining time too, so a slow relaxation can't overrun the timelimit
+        relaxation_solver: Solver
+            LP solver of the root relaxation (the simplex by default), e.g. InteriorPointSolver for the large models,
+            the relaxations of the branches are reoptimized from the parent's tableaux anyway,
+            so the root is solved without the presolve and in the primal formulation (they leave no tableaux of the model)
+        cancellation: CancellationToken | None
+            token stopping the solving (and the current LP solve) when cancelled, e.g. from another thread
 
         Methods
         -------
+        __init__(relaxation_solver: Solver | None = None, cancellation: CancellationToken | None = None) -> Solver:
+            constructs a new solver using the given LP solver for the root relaxation
         start_timer():
             remember the starting time for the solver
         stop_timer():
@@ -30,37 +44,57 @@ class Solver:
         wall_time() -> float:
             returns how long solver has been working
         timeout() -> bool:
-            whether solver should stop working due to the timeout
+            whether solver should stop working due to the timeout or the cancellation
 
         solve(model: Model, timelimit: int) -> Solution:
             solves the given model within a specified timelimit
-        branch_and_bound(model: Model):
-            processes given model in branch and bound fashion (recursively)
+        branch_and_bound(relaxed_solution: Solution):
+            processes given solution of the relaxed model in branch and bound fashion (recursively)
         find_float_assignment(solution: Solution):
             finds a variable with non-integer value in the current solution
             returns None if the solution is a correct integer solution
-        model_with_new_constraint(self, model, constraint):
-            creates a new model with an additional constraint
+        solution_with_new_constraint(relaxed_solution: Solution, constraint: Constraint) -> Solution:
+            solves the relaxed model with an additional constraint,
+            instead of solving it from scratch the parent's tableaux is reoptimized with the dual simplex
     """  
 
+    def __init__(self, relaxation_solver = None, cancellation = None):
+        self.relaxation_solver = lpsolver.Solver() if relaxation_solver == None else relaxation_solver
+        self.cancellation = cancellation
+
     def solve(self, model, timelimit):
         self.timelimit = timelimit
         self.total_time = None
         self.start_time = None
         self.interrupted = False
+        self.interruption = None
 
         self.model = model
         self.lower_bound = float('-inf')
         self.best_solution = None
 
         self.start_timer()
-        self.branch_and_bound(model)
+        relaxation_solver = copy(self.relaxation_solver)
+        relaxation_solver.limits = self._lp_limits(relaxation_solver.limits)
+        relaxation_solver.presolver = None
+        relaxation_solver.formulation = lpsolver.Formulation.PRIMAL
+        self.branch_and_bound(relaxation_solver.solve(model))
         self.stop_timer()
 
+        if self.interrupted and self.best_solution != None:
+            self.best_solution.interruption = self.interruption
         return self.best_solution
            
-    def branch_and_bound(self, model):
-        relaxed_solution = lpsolver.Solver().solve(model)
+    def branch_and_bound(self, relaxed_solution):
+        if relaxed_solution.is_interrupted():
+            # the LP solve has hit the deadline or has been cancelled, its basis proves nothing about the branch
+            self.interrupted = True
+            self.interruption = relaxed_solution.interruption
+            if self.best_solution == None:
+                # the assignment of the relaxation isn't integer, so it's not kept
+                self.best_solution = lpsolution.Solution.interrupted(relaxed_solution.model, self.interruption, None, None,
+                                                                     relaxed_solution.tableaux, relaxed_solution.normal_model)
+            return
 
         if relaxed_solution.assignment == None:
             if self.best_solution == None:
@@ -81,13 +115,14 @@ class Solver:
 
         if self.timeout():
             self.interrupted = True
+            self.interruption = lpsolution.Status.CANCELLED if self._is_cancelled() else lpsolution.Status.TIME_LIMIT
             return 
 
         current_value = relaxed_solution.value(var_to_branch)
-        new_model = self.model_with_new_constraint(model, var_to_branch >= math.ceil(current_value))
-        self.branch_and_bound(new_model)
-        new_model = self.model_with_new_constraint(model, var_to_branch <= math.floor(current_value))
-        self.branch_and_bound(new_model)
+        new_solution = self.solution_with_new_constraint(relaxed_solution, var_to_branch >= math.ceil(current_value))
+        self.branch_and_bound(new_solution)
+        new_solution = self.solution_with_new_constraint(relaxed_solution, var_to_branch <= math.floor(current_value))
+        self.branch_and_bound(new_solution)
 
         
     def find_float_assignment(self, solution):
@@ -98,10 +133,22 @@ class Solver:
                 return var
         return None
 
-    def model_with_new_constraint(self, model, constraint):
-        new_model = deepcopy(model)
-        new_model.add_constraint(constraint)
-        return new_model
+    def solution_with_new_constraint(self, relaxed_solution, constraint):
+        return dlpsolver.DualSimplexSolver(limits=self._lp_limits()).reoptimize(relaxed_solution, constraint)
+
+    def _lp_limits(self, limits = None):
+        """
+            _lp_limits(limits: SolveLimits | None = None) -> SolveLimits | None:
+                returns the limits of an LP solve: the time left and the cancellation token of this solver,
+                the iteration limit of the given ones (e.g. of the relaxation solver) is kept
+        """
+        if self.timelimit == float('inf') and self.cancellation == None:
+            return limits
+        iteration_limit = None if limits == None else limits.iteration_limit
+        return lm.SolveLimits(max(self.timelimit - self.wall_time(), 0.0), iteration_limit, self.cancellation)
+
+    def _is_cancelled(self):
+        return self.cancellation != None and self.cancellation.is_cancelled()
 
     def start_timer(self):
         self.start_time = time.time()
@@ -113,4 +160,4 @@ class Solver:
         return time.time() - self.start_time
 
     def timeout(self) -> bool:
-        return self.wall_time() > self.timelimit
+        return self.wall_time() > self.timelimit or self._is_cancelled()
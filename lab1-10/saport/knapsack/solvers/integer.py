@@ -16,13 +16,11 @@ class IntegerSolver(AbstractSolver):
 
     def create_model(self) -> Model:
         m = Model('knapsack')
-        vars = [m.create_variable(f"x{i}") for i in self.problem.items]
+        vars = [m.create_variable(f"x{i}", upper=1) for i in self.problem.items]
         weights = [item.weight for item in self.problem.items]
         values = [item.value for item in self.problem.items]
         m.maximize(Expression.from_vectors(vars, values))
         m.add_constraint(Expression.from_vectors(vars, weights) <= self.problem.capacity)
-        for v in vars:
-            m.add_constraint(v <= 1)
         return m
     
     def solve(self) -> Solution:
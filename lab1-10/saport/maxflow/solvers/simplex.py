@@ -1,5 +1,7 @@
 from .solver import AbstractSolver
 from ...simplex.model import Model as LinearModel
+from ...simplex.solver import Solver as LinearSolver
+from ...simplex.crash import TriangularCrash
 from ...simplex.expressions.expression import Expression as LinearExpression
 from ..model import Network 
 
@@ -7,10 +9,7 @@ class SimplexSolver(AbstractSolver):
 
     def solve(self) -> int:
         m = LinearModel(self.network.name)
-        vars = {(u,v) : m.create_variable(f"f({u},{v})") for u,v in self.network.digraph.edges()}
-
-        for (u,v), var in vars.items():
-            m.add_constraint(var <= Network.capacity(self.network.digraph, u, v))
+        vars = {(u,v) : m.create_variable(f"f({u},{v})", upper=Network.capacity(self.network.digraph, u, v)) for u,v in self.network.digraph.edges()}
 
         for u in self.network.digraph.nodes():
             if u in { self.network.sink_node, self.network.source_node }:
@@ -29,7 +28,8 @@ class SimplexSolver(AbstractSolver):
         expression = LinearExpression.from_vectors(source_vars, [1.0] * len(source_vars))
         m.maximize(expression)
 
-        solution = m.solve()
+        # the flow conservation rows are covered by the crash basis (zero flows), instead of the first phase
+        solution = m.solve(LinearSolver(crash=TriangularCrash()))
         return int(solution.objective_value())
 
 
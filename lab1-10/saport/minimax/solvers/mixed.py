@@ -3,7 +3,7 @@ from .solver import AbstractSolver
 from ..model import Game, Equilibrium, Strategy
 from ...simplex import model as lpmodel
 from ...simplex import solution as lpsolution
-from ...simplex.expressions import expression as expr
+from ...simplex import solver as lpsolver
 import numpy as np
 from typing import Tuple, List
 
@@ -17,8 +17,10 @@ class MixedSolver(AbstractSolver):
 
         a_model = self.create_max_model(shifted_game)
         b_model = self.create_min_model(shifted_game)       
-        a_solution = a_model.solve()
-        b_solution = b_model.solve()
+        # the models have a constraint per action of the opponent, so for the wide games their duals are much smaller
+        solver = lpsolver.Solver(formulation=lpsolver.Formulation.AUTO)
+        a_solution = a_model.solve(solver)
+        b_solution = b_model.solve(solver)
 
         a_probabilities = self.extract_probabilities(a_solution)
         b_probabilities = self.extract_probabilities(b_solution)
@@ -32,32 +34,30 @@ class MixedSolver(AbstractSolver):
         return Game(self.game.reward_matrix + shift), shift
 
     def create_max_model(self, game: Game) -> lpmodel.Model:
-        a_num_actions, _ = game.reward_matrix.shape
-        a_actions = range(a_num_actions)
+        a_num_actions, b_num_actions = game.reward_matrix.shape
         a_model = lpmodel.Model("A")
 
-        v = a_model.create_variable("v")
-        xs = [a_model.create_variable(f"x{i}") for i in a_actions]
-        
-        a_model.add_constraint(expr.Expression.from_vectors(xs, [1 for _ in xs]) == 1)
-        for col in game.reward_matrix.T:
-            a_model.add_constraint(expr.Expression.from_vectors([v] + xs, [1] + list(-1 * col)) <= 0)
-        a_model.maximize(v)
+        v = a_model.create_variables(1, ["v"])
+        xs = a_model.create_variables(a_num_actions, "x")
+
+        a_model.add_constraints(np.ones((1, a_num_actions)) @ xs == 1)
+        # v can't exceed the expected reward against any of B's actions
+        a_model.add_constraints(np.ones((b_num_actions, 1)) @ v - game.reward_matrix.T @ xs <= 0)
+        a_model.maximize(v[0])
 
         return a_model
 
     def create_min_model(self, game: Game) -> lpmodel.Model:
-        _, b_num_actions = game.reward_matrix.shape
-        b_actions = range(b_num_actions)
-
+        a_num_actions, b_num_actions = game.reward_matrix.shape
         b_model = lpmodel.Model("B")
-        v = b_model.create_variable("v")
-        ys = [b_model.create_variable(f"y{i}") for i in b_actions]
-        
-        b_model.add_constraint(expr.Expression.from_vectors(ys, [1 for _ in ys]) == 1)
-        for row in game.reward_matrix:
-            b_model.add_constraint(expr.Expression.from_vectors([v] + ys, [1] + list(-1 * row)) >= 0)
-        b_model.minimize(v)
+
+        v = b_model.create_variables(1, ["v"])
+        ys = b_model.create_variables(b_num_actions, "y")
+
+        b_model.add_constraints(np.ones((1, b_num_actions)) @ ys == 1)
+        # v can't be lower than the expected loss against any of A's actions
+        b_model.add_constraints(np.ones((a_num_actions, 1)) @ v - game.reward_matrix @ ys >= 0)
+        b_model.minimize(v[0])
 
         return b_model
 
@@ -1,4 +1,5 @@
 from .analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from .analysis_tools.rhs_sensitivity import RHSSensitivityAnalyser
 
 class Analyser:
     """
@@ -13,13 +14,14 @@ class Analyser:
         Methods
         -------
         analyse(solution: Solution) -> List:
-            returns list of various analysis results for the given solution
+            returns list of various analysis results for the given solution,
+            None for the tools that can't analyse it (e.g. the solution's tableaux refers to the model reduced by the presolve)
         interpret_results(solution: Solution, results : List, print_function : Callable = print):
             prints an interpretation of the given analysis results via given print function
     """
     
     def __init__(self):
-        self.tools = [ObjectiveSensitivityAnalyser()]
+        self.tools = [ObjectiveSensitivityAnalyser(), RHSSensitivityAnalyser()]
 
     def analyse(self, solution):
         result = dict()
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class ObjectiveSensitivityAnalyser:
     """
         A class used to analyse sensitivity to changes of the cost factors.
@@ -13,7 +16,9 @@ class ObjectiveSensitivityAnalyser:
         analyse(solution: Solution) -> List[(float, float)]
             analyses the solution and returns list of tuples containing acceptable bounds for every objective coefficient, i.e.
             if the results contain tuple (-inf, 5.0) at index 1, it means that objective coefficient at index 1 should have value >= -inf and <= 5.0
-            to keep the current solution an optimum
+            to keep the current solution an optimum,
+            returns None if the columns of the solution's tableaux don't correspond to the variables of the model
+            (e.g. some variables have been removed by the presolve or the solution has been found via the dual formulation)
 
          interpret_results(solution: Solution, results : List(float, float), print_function : Callable = print):
             prints an interpretation of the given analysis results via given print function
@@ -27,34 +32,45 @@ class ObjectiveSensitivityAnalyser:
         self.name = ObjectiveSensitivityAnalyser.name()
     
     def analyse(self, solution):
-        obj_coeffs = solution.normal_model.objective.expression.factors(solution.model)
-        final_obj_coeffs = solution.tableaux.table[0,:-1]
-        obj_coeffs_ranges = []
-
-        basis = solution.tableaux.extract_basis()
-        for (i, obj_coeff) in enumerate(obj_coeffs):
-            left_side, right_side = None, None
-            if i in basis:
-                row = basis.index(i)
-                row_coeffs = solution.tableaux.table[row + 1, :-1]
-                
-                left_side_bounds = [final_obj_coeffs[j] / a for (j, a) in enumerate(row_coeffs) if a > 0 and j != i]
-                left_side = float('-inf') if len(left_side_bounds) == 0 else obj_coeff - min(left_side_bounds)
-                right_side_bounds = [final_obj_coeffs[j] / a for (j, a) in enumerate(row_coeffs) if a < 0 and j != i]
-                right_side = float('inf') if len(right_side_bounds) == 0 else obj_coeff - max(right_side_bounds)           
-            else:
-                left_side = float('-inf')
-                right_side = obj_coeff + solution.tableaux.table[0,i]
-
-            obj_coeffs_ranges.append((left_side, right_side))
-        
-        return obj_coeffs_ranges
+        report = solution.presolve_report
+        if solution.tableaux == None or (report != None and report.columns_removed() > 0):
+            return None
+        tableaux = solution.tableaux
+        variables_n = len(solution.model.variables)
+        obj_coeffs = solution.normal_model.compile().c[:variables_n]
+        final_obj_coeffs = tableaux.cost_factors()
 
+        # nonbasic variables: only the own reduced cost limits the range (from the side depending on the variable's bound)
+        reduced_costs = final_obj_coeffs[:variables_n]
+        complemented = tableaux.complemented[:variables_n]
+        left_side = np.where(complemented, obj_coeffs - reduced_costs, -np.inf)
+        right_side = np.where(complemented, np.inf, obj_coeffs + reduced_costs)
 
-    def interpret_results(self, solution, obj_coeffs_ranges, print_function):        
-        org_coeffs = solution.normal_model.objective.expression.factors(solution.model)
+        # basic variables: the change of the cost factor is spread over the whole row of the tableaux,
+        # the closest ratio of the reduced cost to the row factor (from both sides) limits the range
+        rows = np.flatnonzero((tableaux.basis >= 0) & (tableaux.basis < variables_n))
+        cols = tableaux.basis[rows]
+        row_coeffs = tableaux.table[rows + 1, :-1].copy()
+        row_coeffs[np.arange(len(rows)), cols] = 0.0
+        # the row of a basic variable at its upper bound is the row of (upper_bound - x), so it changes with the opposite sign
+        row_coeffs[complemented[cols]] *= -1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = final_obj_coeffs / row_coeffs
+        left_ratios = np.where(row_coeffs > 0, ratios, np.inf).min(axis=1, initial=np.inf)
+        right_ratios = np.where(row_coeffs < 0, ratios, -np.inf).max(axis=1, initial=-np.inf)
+        left_side[cols] = obj_coeffs[cols] - left_ratios
+        right_side[cols] = obj_coeffs[cols] - right_ratios
 
+        return list(zip(left_side.tolist(), right_side.tolist()))
+
+
+    def interpret_results(self, solution, obj_coeffs_ranges, print_function):        
         print_function("* Cost Coefficients Sensitivity Analysis:")
+        if obj_coeffs_ranges == None:
+            print_function("-> Not available, the solution has no tableaux with the columns of the model's variables")
+            return
+        org_coeffs = solution.normal_model.compile().c[:len(solution.model.variables)]
+
         print_function("-> To keep the the current optimum, the cost coefficients should stay in following ranges:")
         col_width = max([max(len(f'{r[0]:.3f}'), len(f'{r[1]:.3f}')) for r in obj_coeffs_ranges])
         for (i, r) in enumerate(obj_coeffs_ranges):
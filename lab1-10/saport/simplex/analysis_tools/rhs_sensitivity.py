@@ -0,0 +1,70 @@
+import numpy as np
+
+from .. import tableaux as t
+from ..scenarios import ScenarioSolver
+
+
+class RHSSensitivityAnalyser:
+    """
+        A class used to analyse sensitivity to changes of the constraints' bounds (right hand sides).
+        Everything is computed from the final basis with a few matrix operations:
+        shadow prices are c_B B^-1, a change of the i-th bound moves the basic variables along the i-th column of B^-1,
+        so the range of the bound is given by the closest basic variable reaching its lower or upper bound.
+
+
+        Attributes
+        ----------
+        name : str
+            unique name of the analysis tool
+
+        Methods
+        -------
+        analyse(solution: Solution) -> List[(float, float, float)]
+            analyses the solution and returns list of tuples (shadow price, lower bound, upper bound) for every constraint, i.e.
+            if the results contain tuple (2.0, 10.0, 40.0) at index 1, it means that every unit added to the bound of the constraint 1
+            changes the objective value by 2.0, as long as the bound stays in the range [10.0, 40.0] (the basis stays optimal),
+            returns None if the solution has no tableaux of the model (e.g. it's been reduced by the presolve or found via the dual formulation)
+
+        interpret_results(solution: Solution, results : List(float, float, float), print_function : Callable = print):
+            prints an interpretation of the given analysis results via given print function
+    """
+
+    @classmethod
+    def name(self):
+        return "Right Hand Side Sensitivity Analysis"
+
+    def __init__(self):
+        self.name = RHSSensitivityAnalyser.name()
+
+    def analyse(self, solution):
+        if solution.tableaux == None or solution.is_reduced():
+            return None
+        basis = ScenarioSolver(solution)
+        bounds = solution.model.compile().b
+        shadow_prices = basis.shadow_prices()
+        values = np.linalg.solve(basis.B, bounds - basis.nonbasic_activity)
+        directions = np.linalg.inv(basis.B)
+        lower, upper = basis.basic_bounds()
+
+        # values + delta * directions[:, i] has to stay within [lower, upper] for every basic variable
+        with np.errstate(divide='ignore', invalid='ignore'):
+            to_lower = (lower - values)[:, np.newaxis] / directions
+            to_upper = (upper - values)[:, np.newaxis] / directions
+        # the round-off left in B^-1 shouldn't produce huge (but finite) ranges
+        positive, negative = directions > t.eps, directions < -t.eps
+        max_increase = np.where(positive, to_upper, np.where(negative, to_lower, np.inf)).min(axis=0)
+        max_decrease = np.where(positive, to_lower, np.where(negative, to_upper, -np.inf)).max(axis=0)
+
+        return list(zip(shadow_prices.tolist(), (bounds + max_decrease).tolist(), (bounds + max_increase).tolist()))
+
+    def interpret_results(self, solution, rhs_ranges, print_function):
+        print_function("* Right Hand Side Sensitivity Analysis:")
+        if rhs_ranges == None:
+            print_function("-> Not available, the solution has no tableaux of the model (e.g. it's been reduced by the presolve)")
+            return
+        bounds = solution.model.compile().b
+
+        print_function("-> Shadow prices are valid, as long as the constraints' bounds stay in following ranges:")
+        col_width = max([max(len(f'{r[1]:.3f}'), len(f'{r[2]:.3f}')) for r in rhs_ranges])
+        for (i, r) in enumerate(rhs_ranges):
+            print_function(f"\t {r[1]:{col_width}.3f} <= b{i} <= {r[2]:{col_width}.3f}, shadow price: {r[0]:.3f} (originally: {bounds[i]:.3f})")
@@ -0,0 +1,153 @@
+import copy
+from collections import OrderedDict
+import numpy as np
+
+from . import solver as sv
+
+
+class SolutionCache:
+    """
+        A class to represent a least recently used cache of the solutions, keyed by the fingerprints of the models
+        (see CompiledModel.fingerprint), so a model identical to an already solved one (up to the order of the constraints
+        or the names of the variables) gets the solution without running the simplex, e.g. model.solve(cache=cache).
+        The solutions are cached separately for the solver settings changing their form (the presolve, the formulation
+        and whether the tableaux are kept), so e.g. a lean solution isn't returned to the solver keeping the tableaux.
+        The cached solution is returned as a shallow copy bound to the given model, its tableaux and normal model stay
+        the ones of the model solved originally, unless the constraints of the given model are in another order,
+        then its basis is permuted and the tableaux is rebuilt for the given model (see Solution.for_permuted_constraints),
+        or dropped, if it's a tableaux of the model reduced by the presolve.
+
+        Attributes
+        ----------
+        max_entries : int
+            maximal number of the cached solutions
+        max_bytes : int
+            maximal (estimated) memory of the cached solutions, the solutions larger than that aren't cached at all
+        nbytes : int
+            estimated memory of the currently cached solutions (assignments, tableaux and compiled normal models of the released ones)
+        hits : int
+            number of the lookups that found a solution
+        misses : int
+            number of the lookups that didn't find a solution
+        evictions : int
+            number of the solutions removed to keep the limits
+
+        Methods
+        -------
+        __init__(max_entries: int = 128, max_bytes: int = 64 MB) -> SolutionCache:
+            constructs an empty cache with the given limits
+        get(model: Model, solver: Solver | None = None) -> Solution | None:
+            returns the cached solution of the model found by a solver with the settings of the given one (the default one if None)
+            bound to the model, or None, counts the hit or the miss
+        put(model: Model, solution: Solution, solver: Solver | None = None):
+            stores the solution of the model found by the given solver (the default one if None),
+            evicts the least recently used ones if the limits are exceeded,
+            the interrupted solutions (see Solution.is_interrupted) aren't stored, they depend on the limits of the solver
+        solve(model: Model, solver: Solver) -> Solution:
+            returns the cached solution or solves the model with the given solver and caches the result
+        clear():
+            removes all the solutions, the counters stay
+        __len__() -> int:
+            returns number of the cached solutions
+    """
+
+    def __init__(self, max_entries = 128, max_bytes = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, model, solver = None):
+        key = (model.compile().fingerprint, _solver_settings(solver))
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        solution, _, order = self._entries[key]
+        return _bound_to(solution, order, model)
+
+    def put(self, model, solution, solver = None):
+        if solution.is_interrupted():
+            return
+        compiled = model.compile()
+        key = (compiled.fingerprint, _solver_settings(solver))
+        size = _estimated_bytes(solution)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (solution, size, compiled.canonical_order)
+        self.nbytes += size
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.nbytes -= evicted_size
+            self.evictions += 1
+
+    def solve(self, model, solver):
+        solution = self.get(model, solver)
+        if solution == None:
+            solution = solver.solve(model)
+            self.put(model, solution, solver)
+        return solution
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __str__(self):
+        return f"{len(self)} solutions ({self.nbytes} B), hits: {self.hits}, misses: {self.misses}, evictions: {self.evictions}"
+
+
+def _solver_settings(solver):
+    """
+        _solver_settings(solver: Solver | None) -> tuple:
+            returns the settings of the solver changing the form of its solutions: whether it presolves the model,
+            its formulation and whether it keeps the tableaux, None stands for the default solver (see Model.solve)
+    """
+    solver = sv.Solver() if solver == None else solver
+    return (solver.presolver != None, solver.formulation, solver.keep_tableaux)
+
+
+def _bound_to(solution, order, model):
+    """
+        _bound_to(solution: Solution, order: numpy.Array, model: Model) -> Solution:
+            returns a shallow copy of the solution referring to the given model, with its own list of values,
+            order is the canonical order of the constraints of the solved model (see CompiledModel.canonical_order)
+    """
+    rows = np.empty(len(order), dtype=np.int64)
+    rows[model.compile().canonical_order] = order
+    if (rows == np.arange(len(rows))).all():
+        bound = copy.copy(solution)
+        bound.model = model
+    else:
+        bound = solution.for_permuted_constraints(model, rows)
+    if solution.assignment != None:
+        bound.assignment = list(solution.assignment)
+    return bound
+
+
+def _estimated_bytes(solution):
+    """
+        _estimated_bytes(solution: Solution) -> int:
+            returns approximate memory kept alive by the solution: its values, tables of its tableaux (and of the dual solution)
+            and the sparse factors of the compiled normal model kept by the released tableaux (see Solution.release_tableaux)
+    """
+    size = 0 if solution.assignment == None else 8 * len(solution.assignment)
+    # the released tableaux would be rebuilt just to be measured
+    final_tableaux = solution.tableaux if solution.keeps_tableaux() else None
+    tables = {id(tableaux): tableaux.table for tableaux in [solution.initial_tableaux, final_tableaux] if tableaux != None}
+    size += sum(table.nbytes for table in tables.values())
+    if solution._normal_compiled != None:
+        compiled = solution._normal_compiled[1]
+        arrays = [compiled.rows, compiled.cols, compiled.values, compiled.b, compiled.sense, compiled.c, compiled.lower_bounds, compiled.upper_bounds]
+        size += sum(np.asarray(array).nbytes for array in arrays)
+    if solution.dual_solution != None:
+        size += _estimated_bytes(solution.dual_solution)
+    return size
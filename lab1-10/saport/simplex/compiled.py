@@ -0,0 +1,180 @@
+from functools import cached_property
+import hashlib
+import numpy as np
+
+from .sparse import CSCMatrix
+
+
+class CompiledModel:
+    """
+        A class to represent a linear programming model in the matrix form: objective c x, constraints A x (sense) b, bounds on x.
+        It's built in a single pass over the expressions' coefficients (no simplify / sorting needed),
+        and cached by the model until it changes (see Model.compile).
+        The constraint matrix is kept as (row, col, value) triplets, the dense and the sparse version are built on the first use.
+
+        Attributes
+        ----------
+        shape : (int, int)
+            number of constraints and variables
+        rows : numpy.Array
+            row index of every constraint atom
+        cols : numpy.Array
+            column (variable) index of every constraint atom
+        values : numpy.Array
+            factor of every constraint atom
+        A : numpy.Array
+            dense constraint matrix, A[i, j] is the factor of the j-th variable in the i-th constraint
+        sparse_A : CSCMatrix
+            the same constraint matrix stored by columns
+        b : numpy.Array
+            bounds of the constraints
+        sense : numpy.Array
+            types of the constraints, values of the ConstraintType (LE = -1, EQ = 0, GE = 1)
+        c : numpy.Array
+            objective factors (as given, without changing the objective direction)
+        objective_type : ObjectiveType | None
+            direction of the objective, None if the model has no objective yet
+        lower_bounds : numpy.Array
+            lower bound of every variable
+        upper_bounds : numpy.Array
+            upper bound of every variable
+        fingerprint : str
+            hash of the canonical form of the model: zeros dropped, repeated entries summed up and constraints sorted by their content,
+            so the models differing only in the order of the constraints (or of the atoms in the expressions) share the fingerprint,
+            the order of the variables matters (the assignment of the solution depends on it), their names don't
+        canonical_order : numpy.Array
+            indexes of the constraints sorted by their content, the i-th constraints in this order of the models sharing
+            the fingerprint are the same
+
+        Methods
+        -------
+        @staticmethod from_model(model: Model) -> CompiledModel:
+            compiles the given model
+        with_variables(lower_bounds: numpy.Array, upper_bounds: numpy.Array) -> CompiledModel:
+            returns the matrix form extended by the new variables (empty columns with zero objective factors)
+        with_constraints(rows: numpy.Array, cols: numpy.Array, values: numpy.Array, b: numpy.Array, sense: numpy.Array) -> CompiledModel:
+            returns the matrix form extended by a block of the new constraints, rows are numbered from 0 within the block
+        with_objective(objective: Objective) -> CompiledModel:
+            returns the matrix form with the objective replaced
+    """
+
+    def __init__(self, shape, rows, cols, values, b, sense, c, objective_type, lower_bounds, upper_bounds):
+        self.shape = shape
+        self.rows = rows
+        self.cols = cols
+        self.values = values
+        self.b = b
+        self.sense = sense
+        self.c = c
+        self.objective_type = objective_type
+        self.lower_bounds = lower_bounds
+        self.upper_bounds = upper_bounds
+
+    @staticmethod
+    def from_model(model):
+        rows, cols, values = [], [], []
+        for (row, constraint) in enumerate(model.constraints):
+            coefficients = constraint.expression.coefficients
+            rows.extend([row] * len(coefficients))
+            cols.extend(coefficients.keys())
+            values.extend(coefficients.values())
+
+        shape = (len(model.constraints), len(model.variables))
+        c, objective_type = _objective_factors(model.objective, shape[1])
+
+        return CompiledModel(shape,
+                             np.array(rows, dtype=np.int64),
+                             np.array(cols, dtype=np.int64),
+                             np.array(values, dtype=float),
+                             np.array([constraint.bound for constraint in model.constraints], dtype=float),
+                             np.array([constraint.type.value for constraint in model.constraints], dtype=int),
+                             c,
+                             objective_type,
+                             np.array([var.lower for var in model.variables], dtype=float),
+                             np.array([var.upper for var in model.variables], dtype=float))
+
+    def with_variables(self, lower_bounds, upper_bounds):
+        rows_n, cols_n = self.shape
+        return CompiledModel((rows_n, cols_n + len(lower_bounds)), self.rows, self.cols, self.values, self.b, self.sense,
+                             np.concatenate([self.c, np.zeros(len(lower_bounds))]),
+                             self.objective_type,
+                             np.concatenate([self.lower_bounds, lower_bounds]),
+                             np.concatenate([self.upper_bounds, upper_bounds]))
+
+    def with_constraints(self, rows, cols, values, b, sense):
+        rows_n, cols_n = self.shape
+        return CompiledModel((rows_n + len(b), cols_n),
+                             np.concatenate([self.rows, rows_n + rows]),
+                             np.concatenate([self.cols, cols]),
+                             np.concatenate([self.values, values]),
+                             np.concatenate([self.b, b]),
+                             np.concatenate([self.sense, sense]),
+                             self.c, self.objective_type, self.lower_bounds, self.upper_bounds)
+
+    def with_objective(self, objective):
+        c, objective_type = _objective_factors(objective, self.shape[1])
+        return CompiledModel(self.shape, self.rows, self.cols, self.values, self.b, self.sense,
+                             c, objective_type, self.lower_bounds, self.upper_bounds)
+
+    @cached_property
+    def A(self):
+        dense = np.zeros(self.shape)
+        np.add.at(dense, (self.rows, self.cols), self.values)
+        return dense
+
+    @cached_property
+    def sparse_A(self):
+        return CSCMatrix.from_triplets(self.shape, self.rows, self.cols, self.values)
+
+    @cached_property
+    def canonical_order(self):
+        matrix = self.sparse_A
+        b, sense = self.b + 0.0, self.sense.astype(np.int64)
+
+        # a signature of every constraint, independent of the order of the rows, orders them canonically
+        entries = _mix(matrix.entry_columns.astype(np.uint64) ^ _mix((matrix.data + 0.0).view(np.uint64)))
+        signatures = np.zeros(self.shape[0], dtype=np.uint64)
+        np.add.at(signatures, matrix.indices, entries)
+        signatures = _mix(signatures ^ _mix(b.view(np.uint64)) ^ sense.astype(np.uint64))
+        return np.lexsort((sense, b, signatures))
+
+    @cached_property
+    def fingerprint(self):
+        rows_n, cols_n = self.shape
+        matrix = self.sparse_A
+        b, sense = self.b + 0.0, self.sense.astype(np.int64)
+        order = self.canonical_order
+        canonical_rows = np.empty(rows_n, dtype=np.int64)
+        canonical_rows[order] = np.arange(rows_n)
+        entry_rows = canonical_rows[matrix.indices]
+        entries_order = np.lexsort((entry_rows, matrix.entry_columns))
+
+        digest = hashlib.blake2b(digest_size=16)
+        objective_type = 0 if self.objective_type == None else self.objective_type.value
+        for array in [np.array([rows_n, cols_n, objective_type], dtype=np.int64), self.c + 0.0, self.lower_bounds + 0.0, self.upper_bounds + 0.0,
+                      b[order], sense[order], matrix.entry_columns[entries_order], entry_rows[entries_order], matrix.data[entries_order] + 0.0]:
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+
+def _objective_factors(objective, variables_n):
+    """
+        _objective_factors(objective: Objective | None, variables_n: int) -> (numpy.Array, ObjectiveType | None):
+            returns the dense vector of the objective factors and the objective direction
+    """
+    c = np.zeros(variables_n)
+    if objective == None:
+        return (c, None)
+    coefficients = objective.expression.coefficients
+    c[np.fromiter(coefficients.keys(), dtype=np.int64, count=len(coefficients))] = list(coefficients.values())
+    return (c, objective.type)
+
+
+def _mix(x):
+    """
+        _mix(x: numpy.Array) -> numpy.Array:
+            returns well mixed 64-bit hashes of the given unsigned integers (splitmix64 finalizer)
+    """
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
@@ -0,0 +1,89 @@
+import numpy as np
+
+from . import tableaux as t
+
+
+class TriangularCrash:
+    """
+        A class to represent the crash procedure of the tableaux solver: the starting basis of the first phase is built
+        from the structural columns instead of the artificial variables, wherever it keeps the basis triangular and feasible.
+        The rows without a slack variable are covered one by one, the most constrained ones (with the fewest candidate columns) first.
+        A column covering a row can't have nonzero factors in the rows covered before, so the basis stays triangular
+        (the basic values follow by substitution, in the order of covering), and after covering a row the columns with nonzero
+        factors in it are no longer candidates. Among the candidates the column touching the fewest uncovered rows is chosen,
+        provided its value (and the values left for the slack and artificial variables of the uncovered rows) stays within the bounds.
+        Only the rows that couldn't be covered get the artificial variables, so e.g. the zero right hand side equalities
+        (flow conservation) are covered by degenerate basic variables and the first phase needs much fewer pivots.
+
+        Attributes
+        ----------
+        pivot_tolerance : float
+            a column can cover a row only if its factor is at least that fraction of the largest candidate factor in the row
+        covered_rows : int
+            number of the rows covered by the structural columns during the last crash
+        artificial_rows : int
+            number of the rows left with the artificial variables during the last crash
+
+        Methods
+        -------
+        __init__(pivot_tolerance: float = 0.01) -> TriangularCrash:
+            constructs a new crash procedure
+        find_basis(A: numpy.Array, b: numpy.Array, upper_bounds: numpy.Array, rows: list[int], excluded_columns: list[int]) -> dict[int, int]:
+            returns the structural columns covering the given rows (row -> column) of the constraints A x = b, b >= 0, 0 <= x <= upper_bounds,
+            the excluded columns (e.g. slack variables, already basic) can't be chosen
+    """
+
+    def __init__(self, pivot_tolerance = 0.01):
+        self.pivot_tolerance = pivot_tolerance
+        self.covered_rows = 0
+        self.artificial_rows = 0
+
+    def find_basis(self, A, b, upper_bounds, rows, excluded_columns):
+        nonzero = np.abs(A) > t.eps
+        candidates = np.ones(A.shape[1], dtype=bool)
+        candidates[list(excluded_columns)] = False
+        uncovered = np.ones(A.shape[0], dtype=bool)
+        residual = np.array(b, dtype=float)
+        remaining = list(rows)
+        covering = dict()
+
+        while len(remaining) > 0:
+            counts = nonzero[remaining][:, candidates].sum(axis=1)
+            row = remaining.pop(int(np.argmin(counts)))
+            col = self._choose_column(A, nonzero, residual, upper_bounds, uncovered, np.flatnonzero(candidates & nonzero[row]), row)
+            if col == None:
+                continue
+
+            residual -= A[:, col] * (residual[row] / A[row, col])
+            residual[row] = 0.0
+            covering[row] = col
+            uncovered[row] = False
+            candidates &= ~nonzero[row]
+
+        self.covered_rows = len(covering)
+        self.artificial_rows = len(rows) - len(covering)
+        return covering
+
+    def _choose_column(self, A, nonzero, residual, upper_bounds, uncovered, columns, row):
+        """
+            _choose_column(A: numpy.Array, nonzero: numpy.Array, residual: numpy.Array, upper_bounds: numpy.Array, uncovered: numpy.Array, columns: numpy.Array, row: int) -> int | None:
+                returns the candidate column covering the row with the fewest nonzero factors in the uncovered rows,
+                such that all the basic values stay within their bounds, None if there is no such column
+        """
+        if len(columns) == 0:
+            return None
+        factors = A[row, columns]
+        stable = np.abs(factors) >= self.pivot_tolerance * np.abs(factors).max()
+        values = residual[row] / factors
+        feasible = stable & (values >= -t.eps) & (values <= upper_bounds[columns] + t.eps)
+        others = uncovered.copy()
+        others[row] = False
+        left = residual[others, None] - A[others][:, columns] * values
+        feasible &= np.all(left >= -t.eps, axis=0)
+        if not feasible.any():
+            return None
+
+        columns, factors = columns[feasible], factors[feasible]
+        touched = nonzero[uncovered][:, columns].sum(axis=0)
+        # the sparsest columns first, the ties are broken by the largest pivot
+        return int(columns[np.lexsort((-np.abs(factors), touched))[0]])
@@ -0,0 +1,156 @@
+import numpy as np
+
+from . import tableaux as t
+
+
+class AntiDegeneracy:
+    """
+        A class to represent the anti-stalling mode of the tableaux solver, for the highly degenerate models (assignment, flows).
+        It combines two techniques:
+        - Harris two-pass ratio test: the first pass finds the largest step keeping the basic variables within their bounds
+          relaxed by the feasibility tolerance, the second one picks the largest pivot among the rows blocking within that step,
+          so the ties of the degenerate rows are broken in the numerically safest way, the tiny violations are cut back to the bounds,
+        - bound perturbation: after a run of degenerate pivots the values of the basic variables are moved away from their bounds
+          by small random amounts, which makes the ties (and the zero steps) disappear.
+        Every change of the right hand sides (perturbation or cut violation) is tracked in a separate column, pivoted together
+        with the tableaux, so when the perturbed problem is optimal the exact right hand sides are restored by a single subtraction.
+        The optimal basis stays dual feasible, if the exact values break the bounds, a few dual simplex pivots restore the feasibility.
+
+        Attributes
+        ----------
+        degenerate_pivots_trigger : int
+            number of degenerate pivots in a row, after which the values are perturbed
+        perturbation : float
+            relative size of the perturbation, the values are moved by (0.5..1) * perturbation * (1 + |value|)
+        feasibility_tolerance : float
+            how much the Harris ratio test may violate the bounds of the basic variables
+        seed : int
+            seed of the random perturbations
+        perturbations : int
+            number of perturbations applied during the last optimization
+        cleanup_pivots : int
+            number of dual simplex pivots made after removing the perturbations
+
+        Methods
+        -------
+        __init__(degenerate_pivots_trigger: int = 5, perturbation: float = 1e-5, feasibility_tolerance: float = 1e-9, seed: int = 0) -> AntiDegeneracy:
+            constructs a new anti-stalling mode
+        reset(tableaux: Tableaux):
+            called once before the optimization of the given tableaux starts
+        ratio_test(tableaux: Tableaux, col: int) -> (int | None, float):
+            Harris ratio test, with the same results as Tableaux.bounded_ratio_test
+        pivot(tableaux: Tableaux, row: int, col: int):
+            pivots the tableaux and the tracked changes, cuts the basic values back to their bounds
+        complement_basic(tableaux: Tableaux, row: int):
+            complements the basic variable of the row in the tableaux and the tracked changes
+        perturb(tableaux: Tableaux):
+            moves the basic variables away from their bounds
+        is_modified() -> bool:
+            checks whether the right hand sides differ from the exact ones
+        remove(tableaux: Tableaux):
+            puts the exact right hand sides back to the tableaux (they may be slightly unfeasible)
+        restore(tableaux: Tableaux) -> int:
+            puts the exact right hand sides back to the optimal tableaux,
+            returns the number of dual simplex pivots needed to make them feasible again
+    """
+
+    def __init__(self, degenerate_pivots_trigger = 5, perturbation = 1e-5, feasibility_tolerance = 1e-9, seed = 0):
+        self.degenerate_pivots_trigger = degenerate_pivots_trigger
+        self.perturbation = perturbation
+        self.feasibility_tolerance = feasibility_tolerance
+        self.seed = seed
+        self.perturbations = 0
+        self.cleanup_pivots = 0
+
+    def reset(self, tableaux):
+        self._generator = np.random.default_rng(self.seed)
+        self._changes = np.zeros(tableaux.table.shape[0])
+        self.perturbations = 0
+        self.cleanup_pivots = 0
+
+    def ratio_test(self, tableaux, col):
+        column = tableaux.table[1:, col]
+        values = tableaux.table[1:, -1]
+        upper_bounds = self._basic_upper_bounds(tableaux)
+
+        decreasing = column > t.eps
+        increasing = (column < -t.eps) & np.isfinite(upper_bounds)
+        slack = np.full(len(column), np.inf)
+        slack[decreasing] = values[decreasing]
+        slack[increasing] = upper_bounds[increasing] - values[increasing]
+        magnitudes = np.abs(column)
+
+        # first pass: the largest step within the relaxed bounds
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relaxed = np.where(decreasing | increasing, (slack + self.feasibility_tolerance) / magnitudes, np.inf)
+        max_step = relaxed.min()
+        if tableaux.upper_bounds[col] <= max_step:
+            return (None, tableaux.upper_bounds[col])
+
+        # second pass: the largest pivot among the rows blocking within that step
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quotients = np.where(decreasing | increasing, slack / magnitudes, np.inf)
+        blocking = quotients <= max_step
+        row = np.argmax(np.where(blocking, magnitudes, -1.0))
+        return (row + 1, max(quotients[row], 0.0))
+
+    def pivot(self, tableaux, row, col):
+        pivot_column = tableaux.table[:, col].copy()
+        tableaux.pivot(row, col)
+        changes = self._changes
+        factor = changes[row] / pivot_column[row]
+        changes -= factor * pivot_column
+        changes[row] = factor
+        self._cut_to_bounds(tableaux)
+
+    def complement_basic(self, tableaux, row):
+        tableaux.complement_basic(row)
+        self._changes[row] *= -1
+
+    def perturb(self, tableaux):
+        values = tableaux.table[1:, -1]
+        upper_bounds = self._basic_upper_bounds(tableaux)
+        amounts = self._generator.uniform(0.5, 1.0, len(values)) * self.perturbation * (1 + np.abs(values))
+        # towards the middle of the bounds, the (almost) fixed variables aren't perturbed
+        amounts[values > upper_bounds / 2] *= -1
+        amounts[(tableaux.basis < 0) | (upper_bounds < 4 * np.abs(amounts))] = 0.0
+        values += amounts
+        self._changes[1:] += amounts
+        self.perturbations += 1
+
+    def is_modified(self):
+        return bool(self._changes.any())
+
+    def remove(self, tableaux):
+        tableaux.table[:, -1] -= self._changes
+        self._changes[:] = 0.0
+
+    def restore(self, tableaux):
+        # imported here, the dual solver is built on top of the primal one
+        from .dual_solver import DualSimplexSolver
+
+        self.remove(tableaux)
+        solver = DualSimplexSolver()
+        if not solver.optimize(tableaux):
+            raise Exception("Removing the perturbation made the tableaux unfeasible, it should never happen")
+        self.cleanup_pivots += solver.iterations
+        return solver.iterations
+
+    def _basic_upper_bounds(self, tableaux):
+        """
+            _basic_upper_bounds(tableaux: Tableaux) -> numpy.Array:
+                returns upper bounds of the basic variables (inf for the rows without a basic variable)
+        """
+        return np.where(tableaux.basis >= 0, tableaux.upper_bounds[tableaux.basis], np.inf)
+
+    def _cut_to_bounds(self, tableaux):
+        """
+            _cut_to_bounds(tableaux: Tableaux):
+                moves the basic values violating their bounds (within the tolerance, after the Harris step) back to the bounds
+        """
+        values = tableaux.table[1:, -1]
+        has_basic = tableaux.basis >= 0
+        cut = np.clip(values, 0.0, self._basic_upper_bounds(tableaux))
+        cut[~has_basic] = values[~has_basic]
+        self._changes[1:] += cut - values
+        values[:] = cut
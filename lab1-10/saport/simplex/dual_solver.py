@@ -0,0 +1,234 @@
+from copy import copy
+import numpy as np
+import time
+
+from . import solver as sv
+from . import solution as s
+from . import tableaux as t
+from . import limits as lm
+from .expressions import constraint as c
+
+
+class DualSimplexSolver(sv.Solver):
+    """
+        A class to represent a dual simplex solver.
+        It starts from a dual feasible tableaux (all cost factors nonnegative) and pivots until the basic solution
+        becomes primal feasible as well. The row with the largest infeasibility leaves the basis,
+        the entering variable is chosen by the bound flipping ratio test: boxed variables (with finite upper bounds)
+        passed by the ratio test are moved to their opposite bound as long as the leaving row stays infeasible,
+        so a single pivot can replace many ordinary dual iterations.
+        The main use case is the reoptimization: an optimal tableaux with a new constraint appended
+        stays dual feasible, so usually a few dual pivots restore the optimality, instead of solving the model from scratch.
+
+        Attributes
+        ----------
+        iterations : int
+            number of pivots made during the last solve / reoptimization (the bound flips are not counted)
+        statistics : SolveStatistics | None
+            statistics of the last solve, the dual iterations are reported in the "dual" phase,
+            choosing the leaving row counts as the pricing, the bound flipping test as the ratio test
+
+        Methods
+        -------
+        solve(model: Model) -> Solution:
+            solves the given model, with the dual simplex if the slack basis is dual feasible, otherwise with the primal one
+            (boxed variables with the wrong sign of the cost factor start at their upper bounds, so they don't break the dual feasibility)
+        optimize(tableaux: Tableaux) -> bool:
+            runs the dual simplex on the given dual feasible tableaux (in place)
+            returns False if the problem turns out to be unfeasible
+        reoptimize(solution: Solution, constraint: Constraint) -> Solution:
+            returns the solution of the solution's model with an additional constraint, starting from the solution's tableaux,
+            the reoptimization stopped by the limits returns an interrupted solution without assignment,
+            if the solution has no optimal tableaux of its model (e.g. it's presolved, interrupted or found via the dual formulation),
+            the extended model is solved from scratch
+    """
+
+    def _solve(self, model):
+        normal_model = model.translate_to_standard_form()
+        if any(constraint.type == c.ConstraintType.EQ for constraint in normal_model.constraints):
+            return super()._solve(model)
+
+        # the bounds can stay negative, dual simplex doesn't need a feasible starting basis
+        self._shift_by_lower_bounds(normal_model)
+        self.slack_variables = self._add_slack_variables(normal_model)
+        self.surplus_variables = dict()
+        tableaux = self._basic_initial_tableaux(normal_model)
+        # variables with finite upper bounds and the wrong sign of the cost factor start at their upper bounds
+        for col in np.flatnonzero((tableaux.cost_factors() < -t.eps) & np.isfinite(tableaux.upper_bounds)):
+            tableaux.complement(col)
+        if tableaux.cost_factors().min() < -t.eps:
+            return super()._solve(model)
+
+        initial_tableaux = self._initial_copy(tableaux)
+        if not self.optimize(tableaux):
+            return s.Solution.unfeasible(model, initial_tableaux, tableaux, normal_model)
+
+        assignment = tableaux.extract_assignment()
+        return self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model)
+
+    def optimize(self, tableaux):
+        self._phase = "dual"
+        self._active_tableaux = tableaux
+        instrumented = self._is_instrumented()
+        while True:
+            self._check_limits()
+            started = time.perf_counter() if instrumented else 0.0
+            row = self._choose_leaving_row(tableaux)
+            if row == None:
+                # round-off left by the pivots on the degenerate rows, the primal solver keeps such values exactly zero
+                values = tableaux.table[1:, -1]
+                values[np.abs(values) <= t.eps] = 0.0
+                return True
+            priced = time.perf_counter() if instrumented else 0.0
+
+            if tableaux.table[row, -1] > 0:
+                # basic variable exceeds its upper bound, after complementing it's just a negative one
+                tableaux.complement_basic(row)
+
+            col, flipped = self._choose_entering_variable(tableaux, row)
+            if col == None:
+                return False
+            tested = time.perf_counter() if instrumented else 0.0
+
+            for flipped_col in flipped:
+                tableaux.complement(flipped_col)
+            if instrumented:
+                leaving = tableaux.basis[row - 1]
+                step = tableaux.table[row, -1] / tableaux.table[row, col]
+                is_degenerate = tableaux.table[0, col] <= t.eps
+            tableaux.pivot(row, col)
+            self.iterations += 1
+            if instrumented:
+                self._record(col, leaving, row - 1, step, tableaux.table[0, -1], is_degenerate, False, (started, priced, tested))
+
+    def reoptimize(self, solution, constraint):
+        return self._solve_with_statistics(self._reoptimize, solution, constraint)
+
+    def _reoptimize(self, solution, constraint):
+        """
+            _reoptimize(solution: Solution, constraint: Constraint) -> Solution:
+                see reoptimize
+        """
+        model = copy(solution.model)
+        model.constraints = solution.model.constraints + [constraint]
+        # the copy shares the matrix form of the original model, which doesn't have the new constraint
+        model.invalidate()
+
+        if not solution.is_feasible:
+            return s.Solution.unfeasible(model, solution.initial_tableaux, solution.tableaux, solution.normal_model)
+        if not solution.is_bounded or not self._is_reoptimizable(solution):
+            return self.solve(model)
+
+        normal_model = copy(solution.normal_model)
+        normal_model.variables = list(normal_model.variables)
+        normal_model.constraints = list(normal_model.constraints)
+        normal_model.invalidate()
+        tableaux = self._tableaux_with_new_constraint(solution.tableaux, normal_model, constraint)
+
+        initial_tableaux = self._initial_copy(tableaux)
+        try:
+            if not self.optimize(tableaux):
+                return s.Solution.unfeasible(model, initial_tableaux, tableaux, normal_model)
+        except lm.SolveInterrupted as interruption:
+            return self._interrupted_solution(model, interruption.status)
+
+        assignment = tableaux.extract_assignment()
+        return self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model)
+
+    def _is_reoptimizable(self, solution):
+        """
+            _is_reoptimizable(solution: Solution) -> bool:
+                checks whether the solution has an optimal tableaux of its own model, i.e. of its normal model
+                with the same variables and constraints (not reduced by the presolve) and not interrupted
+        """
+        if solution.is_interrupted() or solution.is_reduced() or solution.normal_model == None:
+            return False
+        tableaux = solution.tableaux
+        return tableaux != None and tableaux.model is solution.normal_model
+
+    def _tableaux_with_new_constraint(self, tableaux, normal_model, constraint):
+        """
+            _tableaux_with_new_constraint(tableaux: Tableaux, normal_model: Model, constraint: Constraint) -> Tableaux:
+                returns a new tableaux with rows (and slack variables) of the constraint appended to the given one,
+                the normal model is extended in place, the given tableaux stays untouched
+        """
+        constraint = constraint.simplify()
+        if constraint.type == c.ConstraintType.GE:
+            constraint.invert()
+        parts = [constraint]
+        if constraint.type == c.ConstraintType.EQ:
+            parts = [c.Constraint(constraint.expression, constraint.bound, c.ConstraintType.LE),
+                     c.Constraint(constraint.expression * -1, -constraint.bound, c.ConstraintType.LE)]
+
+        rows_n, cols_n = tableaux.table.shape
+        factors = np.array([part.expression.factors(normal_model) for part in parts])
+        bounds = np.array([part.bound for part in parts], dtype=float)
+
+        # the variables are shifted by their lower bounds, the complemented ones are substituted with (upper_bound - x)
+        bounds -= factors @ tableaux.lower_bounds
+        # the normal model keeps the shifted bounds, like its other constraints (so the tableaux can be rebuilt from it)
+        shifted_bounds = bounds.tolist()
+        complemented = tableaux.complemented
+        bounds -= factors[:, complemented] @ tableaux.upper_bounds[complemented]
+        factors[:, complemented] *= -1
+
+        table = np.zeros((rows_n + len(parts), cols_n + len(parts)))
+        table[:rows_n, :cols_n - 1] = tableaux.table[:, :-1]
+        table[:rows_n, -1] = tableaux.table[:, -1]
+        table[rows_n:, :cols_n - 1] = factors
+        table[rows_n:, -1] = bounds
+
+        for (i, part) in enumerate(parts):
+            slack_var = normal_model.create_variable(f"s{len(normal_model.constraints)}")
+            part.expression = part.expression + slack_var
+            part.bound = shifted_bounds[i]
+            part.type = c.ConstraintType.EQ
+            normal_model.add_constraint(part)
+            table[rows_n + i, slack_var.index] = 1.0
+
+        # new rows have to be expressed in terms of the nonbasic variables
+        basic_rows = np.flatnonzero(tableaux.basis >= 0)
+        basic_cols = tableaux.basis[basic_rows]
+        table[rows_n:] -= table[rows_n:, basic_cols] @ table[basic_rows + 1]
+
+        basis = np.concatenate([tableaux.basis, np.arange(cols_n - 1, cols_n - 1 + len(parts))])
+        new_tableaux = t.Tableaux(normal_model, table, basis)
+        new_tableaux.inherit_bounds(tableaux)
+        return new_tableaux
+
+    def _choose_leaving_row(self, tableaux):
+        """
+            _choose_leaving_row(tableaux: Tableaux) -> int | None:
+                returns the row with the most infeasible basic variable (below zero or above its upper bound),
+                None if the basic solution is feasible
+        """
+        values = tableaux.table[1:, -1]
+        has_basic = tableaux.basis >= 0
+        upper_bounds = np.where(has_basic, tableaux.upper_bounds[tableaux.basis], np.inf)
+        infeasibility = np.maximum(-values, values - upper_bounds)
+        infeasibility[~has_basic] = 0.0
+        row = np.argmax(infeasibility)
+        return row + 1 if infeasibility[row] > t.eps else None
+
+    def _choose_entering_variable(self, tableaux, row):
+        """
+            _choose_entering_variable(tableaux: Tableaux, row: int) -> (int | None, numpy.Array):
+                bound flipping ratio test for the given (negative) leaving row,
+                returns the entering column and the columns that should be flipped to their opposite bounds,
+                entering column is None if the row can't become feasible, i.e. the problem is unfeasible
+        """
+        pivot_row = tableaux.table[row, :-1]
+        candidates = np.flatnonzero(pivot_row < -t.eps)
+        if len(candidates) == 0:
+            return (None, candidates)
+
+        ratios = np.maximum(tableaux.cost_factors(candidates), 0.0) / -pivot_row[candidates]
+        candidates = candidates[np.argsort(ratios, kind='stable')]
+
+        # the slope of the dual objective drops by (upper_bound * |a|) with every passed breakpoint,
+        # the candidate that would make it nonpositive enters, the previous ones are flipped
+        slopes = -tableaux.table[row, -1] - np.cumsum(tableaux.upper_bounds[candidates] * -pivot_row[candidates])
+        entering = np.argmax(slopes <= t.eps)
+        if slopes[entering] > t.eps:
+            return (None, candidates)
+        return (candidates[entering], candidates[:entering])
@@ -4,6 +4,7 @@ class Atom(e.Expression):
     """
         A class to represent an atom of the linear programming expression, i.e. variable and it's factor (e.g. 4x, -5.3x, etc.)
         It derives from the Expression class and can be intepreted as a expression containing only single atom, itself
+        Atoms are immutable, so adding to an atom in place (+=) creates a new expression.
 
         Attributes
         ----------
@@ -22,10 +23,23 @@ class Atom(e.Expression):
             return new atom with a multiplied factor
     """
 
+    __slots__ = ('var', 'factor')
+
     def __init__(self, var, factor):
         self.var = var 
         self.factor = float(factor)
-        super().__init__(self)
+
+    @property
+    def coefficients(self):
+        return {self.var.index: self.factor}
+
+    @property
+    def variables(self):
+        return {self.var.index: self.var}
+
+    @property
+    def atoms(self):
+        return (self,)
 
     def evaluate_with_value(self, assigned_value):
         return self.factor * assigned_value
@@ -33,6 +47,20 @@ class Atom(e.Expression):
     def evaluate(self, assignment):
         return super().evaluate(assignment)
 
+    def _add_to(self, coefficients, variables):
+        index = self.var.index
+        coefficients[index] = coefficients.get(index, 0.0) + self.factor
+        variables[index] = self.var
+
+    def _snapshot(self):
+        return self
+
+    def _chain(self):
+        return [self]
+
+    def __iadd__(self, other):
+        return self.__add__(other)
+
     def __mul__(self, factor):
         return Atom(self.var, self.factor * factor)
 
@@ -1,17 +1,25 @@
-from . import constraint as co
+from itertools import islice
 
-from itertools import groupby
-from functools import reduce
+from . import constraint as co
 
 
 class Expression:
     """
         A class to represent a linear polynomial in the linear programming, i.e. a sum of atom (e.g. 4x + 5y - 0.4z)
+        The polynomial is stored as a dictionary mapping index of the variable to its factor,
+        so the like terms are merged on insert and the expression can be built in place (+=) in a linear time.
+        A sum (+) doesn't copy the dictionary, it's a chain of the summed terms, merged on the first read of the coefficients,
+        the sums built one on another (e.g. sum(variables, Expression()) or e = e + x) share and extend one chain,
+        so they take a linear time as well.
 
         Attributes
         ----------
-        atoms : list[Atom]
-            list of the atoms in the polynomial
+        coefficients : dict[int, float]
+            factor of every variable in the polynomial, by the index of the variable (in the order of insertion)
+        variables : dict[int, Variable]
+            variables of the polynomial, by their index
+        atoms : tuple[Atom]
+            atoms of the polynomial, created on demand (one per variable)
 
         Methods
         -------
@@ -19,18 +27,22 @@ class Expression:
             constructs an expression with atoms given in the paremeter list
         @classmethod from_vectors(variables : Iterable[Variable], factors: Iterable[float]) -> Expression:
             constructs an expression with collections of factors and corresponding variables
+        @classmethod from_indexes(variables : list[Variable], indexes: Iterable[int], factors: Iterable[float]) -> Expression:
+            constructs an expression with factors of the variables[index] (unique indexes), without creating any atoms
         evaluate(assignment: list[float]) -> float:
             returns value of the expression for the given assignment
             assignment is just a list of values with order corresponding to the variables in the model
         simplify() -> Expression:
-            returns a new expression with sorted and atoms and reduced factors 
+            returns a new expression with atoms sorted by the variable index
         factors(model: Model) -> list[float]:
             return list of factors corresponding to the variables in the model
         __add__(other: Expression) -> Expression:
-            returns sum of the two polynomials
+            returns sum of the two polynomials (in a constant time, the terms are merged when they're read)
+        __iadd__(other: Expression) -> Expression:
+            adds the other polynomial to this one in place (in time proportional to the size of the other one)
         __sub__(other: Expression) -> Expression:
             returns sum of the two polynomials, inverting the first atom in the second polynomial
-            useful for expressions like 3*x - 4y, otherwise one would have to write 3*x + -4*y 
+            useful for expressions like 3*x - 4y, otherwise one would have to write 3*x + -4*y
         __mul__(factor: float) -> Expression:
             return a new polynomial with all factors multiplied by the given number
         __eq__(bound: float) -> Constraint:
@@ -41,61 +53,156 @@ class Expression:
             returns a new "greater than or equal" constraint
     """
 
+    __slots__ = ('_coefficients', '_variables', '_terms', '_terms_n', '_shared')
+
     def __init__(self, *atoms):
-        self.atoms = atoms 
+        self._coefficients = dict()
+        self._variables = dict()
+        self._terms = None
+        self._terms_n = 0
+        self._shared = False
+        for atom in atoms:
+            self._add_terms(atom)
 
     @classmethod
     def from_vectors(self, variables, factors):
-        from .atom import Atom
         assert len(variables) == len(factors), f"number of factors should correspond to variables in the expression"
-        atoms = [Atom(v,f) for (v,f) in zip(variables, factors)]
-        return Expression(*atoms)
+        expression = Expression()
+        coefficients = expression._coefficients
+        for (var, factor) in zip(variables, factors):
+            index = var.index
+            coefficients[index] = coefficients.get(index, 0.0) + float(factor)
+            expression._variables[index] = var
+        return expression
+
+    @classmethod
+    def from_indexes(self, variables, indexes, factors):
+        expression = Expression()
+        expression._coefficients = dict(zip(indexes, factors))
+        expression._variables = {index: variables[index] for index in expression._coefficients}
+        return expression
+
+    @property
+    def coefficients(self):
+        self._merge_terms()
+        return self._coefficients
+
+    @property
+    def variables(self):
+        self._merge_terms()
+        return self._variables
+
+    @property
+    def atoms(self):
+        from .atom import Atom
+        variables = self.variables
+        return tuple(Atom(variables[index], factor) for (index, factor) in self.coefficients.items())
 
     def evaluate(self, assignment):
-        adder = lambda val, a: val + a.evaluate_with_value(assignment[a.var.index])
-        return reduce(adder, self.atoms, 0) 
+        return sum(factor * assignment[index] for (index, factor) in self.coefficients.items())
 
     def simplify(self):
-        from . import atom
-        projection = lambda a: a.var.index
-        reduce_atoms = lambda a1, a2: atom.Atom(a1.var, a1.factor + a2.factor)
-        reduce_group = lambda g: reduce(reduce_atoms, g[1:], g[0])
-    
-        sorted_atoms = sorted(self.atoms, key=projection)
-        grouped_atoms = [list(g[1]) for g in groupby(sorted_atoms, key=projection)]
- 
-        new_atoms = (reduce_group(g) for g in grouped_atoms) 
-        return Expression(*new_atoms)
+        coefficients, variables = self.coefficients, self.variables
+        expression = Expression()
+        for index in sorted(coefficients):
+            expression._coefficients[index] = coefficients[index]
+            expression._variables[index] = variables[index]
+        return expression
 
     def factors(self, model):
-        simplified_expression = self.simplify()
         factors = [0.0 for _ in model.variables]
-        for a in simplified_expression.atoms:
-            factors[a.var.index] = a.factor
+        for (index, factor) in self.coefficients.items():
+            factors[index] = factor
         return factors
 
+    def _add_terms(self, other):
+        self._merge_terms()
+        if self._shared:
+            # the dictionaries are the first term of the sums built from this expression, they have to stay intact
+            self._coefficients, self._variables = dict(self._coefficients), dict(self._variables)
+            self._shared = False
+        other._add_to(self._coefficients, self._variables)
+
+    def _add_to(self, coefficients, variables):
+        for (index, factor) in self.coefficients.items():
+            coefficients[index] = coefficients.get(index, 0.0) + factor
+        variables.update(self._variables)
+
+    def _merge_terms(self):
+        """
+            _merge_terms():
+                merges the terms of the sum (see __add__) into the dictionaries, once
+        """
+        if self._terms == None:
+            return
+        coefficients, variables = dict(), dict()
+        for term in islice(self._terms, self._terms_n):
+            term._add_to(coefficients, variables)
+        self._coefficients, self._variables = coefficients, variables
+        self._terms = None
+
+    def _snapshot(self):
+        """
+            _snapshot() -> Expression:
+                returns an expression sharing the current dictionaries, never modified, used as a term of the sums
+        """
+        self._merge_terms()
+        self._shared = True
+        snapshot = Expression()
+        snapshot._coefficients, snapshot._variables = self._coefficients, self._variables
+        return snapshot
+
+    def _chain(self):
+        """
+            _chain() -> list[Expression]:
+                returns the list of terms to be extended by a sum with this expression as the first operand
+        """
+        if self._terms == None:
+            return [self._snapshot()]
+        if self._terms_n == len(self._terms):
+            # the last sum of the chain extends it in place, the earlier ones read only their own prefix of the terms
+            return self._terms
+        return self._terms[:self._terms_n]
+
+    def _copy(self):
+        expression = Expression()
+        expression._coefficients = dict(self.coefficients)
+        expression._variables = dict(self.variables)
+        return expression
+
     def __add__(self, other):
-        new_atoms = list(self.atoms)
-        new_atoms += other.atoms;
-        return Expression(*new_atoms)
+        terms = self._chain()
+        terms.append(other._snapshot())
+        # the dictionaries are created when the terms are merged
+        expression = Expression.__new__(Expression)
+        expression._terms, expression._terms_n, expression._shared = terms, len(terms), False
+        return expression
+
+    def __iadd__(self, other):
+        self._add_terms(other)
+        return self
 
     def __sub__(self, other):
         return self.__add__(other._invert())
 
     def _invert(self):
-        new_atoms = list(self.atoms)
-        new_atoms[0] = new_atoms[0] * -1
-        return Expression(*new_atoms)
+        expression = self._copy()
+        for index in expression._coefficients:
+            expression._coefficients[index] *= -1
+            break
+        return expression
 
     def __mul__(self, factor):
-        new_atoms = [a * factor for a in self.atoms]
-        return Expression(*new_atoms)
+        expression = Expression()
+        expression._coefficients = {index: float(f * factor) for (index, f) in self.coefficients.items()}
+        expression._variables = dict(self.variables)
+        return expression
 
     __rmul__ = __mul__
 
     def __eq__(self, bound):
         return co.Constraint(self, bound, co.ConstraintType.EQ)
-    
+
     def __ge__(self, bound):
         return co.Constraint(self, bound, co.ConstraintType.GE)
 
@@ -103,10 +210,13 @@ class Expression:
         return co.Constraint(self, bound, co.ConstraintType.LE)
 
     def __str__(self):
-        text = str(self.atoms[0])
-        
-        for atom in self.atoms[1:]:
+        atoms = self.atoms
+        if len(atoms) == 0:
+            return "0"
+        text = str(atoms[0])
+
+        for atom in atoms[1:]:
             text += ' + ' if atom.factor >= 0 else ' - '
             factor = "" if abs(atom.factor) == 1.0 else f"{abs(atom.factor)}*"
             text += f'{factor}{atom.var.name}'
-        return text
\ No newline at end of file
+        return text
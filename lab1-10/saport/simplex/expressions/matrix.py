@@ -0,0 +1,233 @@
+import numpy as np
+
+from . import constraint as co
+from . import expression as ex
+from ..sparse import CSCMatrix
+
+
+class VariableArray:
+    """
+        A class to represent a block of variables created at once (see Model.create_variables),
+        it can be used like a vector in the matrix expressions, e.g. model.add_constraints(A @ x <= b) or model.maximize(c @ x).
+
+        Attributes
+        ----------
+        variables : list[Variable]
+            variables of the block
+        indexes : numpy.Array
+            indexes of the variables in the model
+
+        Methods
+        -------
+        __init__(variables: list[Variable]) -> VariableArray:
+            constructs a block of the given variables
+        __len__() -> int:
+            returns number of the variables
+        __getitem__(key: int | slice | Iterable[int]) -> Variable | VariableArray:
+            returns a single variable or a block of the selected ones
+        sum() -> Expression:
+            returns sum of the variables
+        values(assignment: list[float]) -> numpy.Array:
+            returns values of the variables in the given assignment (e.g. solution.assignment)
+        __rmatmul__(factors: numpy.Array | CSCMatrix) -> Expression | MatrixExpression:
+            returns an expression for a vector of factors (e.g. c @ x), a block of expressions, one per row, for a matrix (e.g. A @ x)
+    """
+
+    # numpy has to leave A @ x to __rmatmul__, instead of treating the array as a sequence of objects
+    __array_ufunc__ = None
+
+    def __init__(self, variables):
+        self.variables = list(variables)
+        self.indexes = np.fromiter((var.index for var in self.variables), dtype=np.int64, count=len(self.variables))
+
+    def __len__(self):
+        return len(self.variables)
+
+    def __iter__(self):
+        return iter(self.variables)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.variables[key]
+        if isinstance(key, slice):
+            return VariableArray(self.variables[key])
+        return VariableArray([self.variables[i] for i in np.asarray(key).tolist()])
+
+    def sum(self):
+        return ex.Expression.from_indexes(self._lookup(), self.indexes.tolist(), [1.0] * len(self))
+
+    def values(self, assignment):
+        return np.asarray(assignment, dtype=float)[self.indexes]
+
+    def __rmatmul__(self, factors):
+        if not isinstance(factors, CSCMatrix):
+            factors = np.asarray(factors, dtype=float)
+            if factors.ndim == 1:
+                if len(factors) != len(self):
+                    raise Exception(f"Number of factors ({len(factors)}) doesn't match number of the variables ({len(self)})")
+                return ex.Expression.from_indexes(self._lookup(), self.indexes.tolist(), factors.tolist())
+        return MatrixExpression.from_matrix(factors, self)
+
+    def _lookup(self):
+        """
+            _lookup() -> dict[int, Variable]:
+                returns the variables by their index in the model
+        """
+        return dict(zip(self.indexes.tolist(), self.variables))
+
+    def __str__(self):
+        return f"[{', '.join(var.name for var in self.variables)}]"
+
+
+class MatrixExpression:
+    """
+        A class to represent a block of linear expressions, one per row of a matrix, e.g. A @ x.
+        The factors are kept as (row, variable index, factor) triplets, so the block can go straight to the matrix form
+        of the model (see Model.add_constraints), the expressions of the rows are created only for the model's constraints.
+
+        Attributes
+        ----------
+        rows_n : int
+            number of the expressions (rows)
+        rows : numpy.Array
+            row of every factor
+        indexes : numpy.Array
+            index of the variable of every factor
+        factors : numpy.Array
+            the factors, the repeated (row, variable) pairs are summed up
+        variables : dict[int, Variable] | list[Variable]
+            variables of the block by their index
+
+        Methods
+        -------
+        __init__(rows_n: int, rows: numpy.Array, indexes: numpy.Array, factors: numpy.Array, variables: dict[int, Variable] | list[Variable]) -> MatrixExpression:
+            constructs a block from the triplets
+        @staticmethod from_matrix(matrix: numpy.Array | CSCMatrix, variables: VariableArray) -> MatrixExpression:
+            constructs the block A @ x, with a column of the matrix per variable
+        compressed() -> (numpy.Array, numpy.Array, numpy.Array):
+            returns the triplets sorted by row and variable index, with the repeated entries summed up
+        expressions() -> list[Expression]:
+            returns the expression of every row
+        __add__(other: MatrixExpression) -> MatrixExpression:
+            returns sum of the blocks with the same number of rows
+        __sub__(other: MatrixExpression) -> MatrixExpression:
+            returns difference of the blocks with the same number of rows
+        __mul__(factor: float) -> MatrixExpression:
+            returns a new block with all factors multiplied by the given number
+        __le__(bounds: float | Iterable[float]) -> MatrixConstraint:
+            returns a block of "less than or equal" constraints, the bound is shared or given for every row
+        __ge__(bounds: float | Iterable[float]) -> MatrixConstraint:
+            returns a block of "greater than or equal" constraints
+        __eq__(bounds: float | Iterable[float]) -> MatrixConstraint:
+            returns a block of equality constraints
+    """
+
+    def __init__(self, rows_n, rows, indexes, factors, variables):
+        self.rows_n = rows_n
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.indexes = np.asarray(indexes, dtype=np.int64)
+        self.factors = np.asarray(factors, dtype=float)
+        self.variables = variables
+        self._compressed = None
+
+    @staticmethod
+    def from_matrix(matrix, variables):
+        if isinstance(matrix, CSCMatrix):
+            rows, positions, factors = matrix.indices, matrix.entry_columns, matrix.data
+        else:
+            matrix = np.asarray(matrix, dtype=float)
+            if matrix.ndim != 2:
+                raise Exception("Block of expressions needs a 2d-matrix of factors")
+            rows, positions = np.nonzero(matrix)
+            factors = matrix[rows, positions]
+        if matrix.shape[1] != len(variables):
+            raise Exception(f"Number of the matrix columns ({matrix.shape[1]}) doesn't match number of the variables ({len(variables)})")
+        return MatrixExpression(matrix.shape[0], rows, variables.indexes[positions], factors, variables._lookup())
+
+    def compressed(self):
+        if self._compressed != None:
+            return self._compressed
+        rows, indexes, factors = self.rows, self.indexes, self.factors
+        order = np.lexsort((indexes, rows))
+        rows, indexes, factors = rows[order], indexes[order], factors[order]
+        if len(factors) > 0:
+            starts = np.flatnonzero(np.r_[True, (rows[1:] != rows[:-1]) | (indexes[1:] != indexes[:-1])])
+            factors = np.add.reduceat(factors, starts)
+            rows, indexes = rows[starts], indexes[starts]
+        self._compressed = (rows, indexes, factors)
+        return self._compressed
+
+    def expressions(self):
+        rows, indexes, factors = self.compressed()
+        starts = np.searchsorted(rows, np.arange(self.rows_n + 1)).tolist()
+        indexes, factors = indexes.tolist(), factors.tolist()
+        return [ex.Expression.from_indexes(self.variables, indexes[start:end], factors[start:end])
+                for (start, end) in zip(starts[:-1], starts[1:])]
+
+    def __add__(self, other):
+        if self.rows_n != other.rows_n:
+            raise Exception(f"Can't add blocks with different numbers of rows ({self.rows_n} and {other.rows_n})")
+        variables = self.variables
+        if variables is not other.variables:
+            variables = dict(enumerate(variables)) if isinstance(variables, list) else dict(variables)
+            variables.update(other.variables if isinstance(other.variables, dict) else enumerate(other.variables))
+        return MatrixExpression(self.rows_n,
+                                np.concatenate([self.rows, other.rows]),
+                                np.concatenate([self.indexes, other.indexes]),
+                                np.concatenate([self.factors, other.factors]),
+                                variables)
+
+    def __sub__(self, other):
+        return self + other * -1
+
+    def __mul__(self, factor):
+        return MatrixExpression(self.rows_n, self.rows, self.indexes, self.factors * float(factor), self.variables)
+
+    def __rmul__(self, factor):
+        return self * factor
+
+    def __neg__(self):
+        return self * -1
+
+    def __le__(self, bounds):
+        return MatrixConstraint(self, bounds, co.ConstraintType.LE)
+
+    def __ge__(self, bounds):
+        return MatrixConstraint(self, bounds, co.ConstraintType.GE)
+
+    def __eq__(self, bounds):
+        return MatrixConstraint(self, bounds, co.ConstraintType.EQ)
+
+    # comparisons create constraints, so the blocks can't be hashed
+    __hash__ = None
+
+
+class MatrixConstraint:
+    """
+        A class to represent a block of constraints of the same type, e.g. A @ x <= b.
+
+        Attributes
+        ----------
+        expression : MatrixExpression
+            left sides of the constraints
+        bounds : numpy.Array
+            bound of every constraint
+        type : ConstraintType
+            type of all the constraints: LE, EQ, GE
+
+        Methods
+        -------
+        __init__(expression: MatrixExpression, bounds: float | Iterable[float], type: ConstraintType) -> MatrixConstraint:
+            constructs a block of constraints, a single bound is shared by all of them
+        constraints() -> list[Constraint]:
+            returns the constraint of every row
+    """
+
+    def __init__(self, expression, bounds, type):
+        self.expression = expression
+        self.bounds = np.broadcast_to(np.asarray(bounds, dtype=float), (expression.rows_n,))
+        self.type = type
+
+    def constraints(self):
+        return [co.Constraint(expression, bound, self.type)
+                for (expression, bound) in zip(self.expression.expressions(), self.bounds.tolist())]
@@ -12,19 +12,34 @@ class Variable(a.Atom):
             name of the variable
         index : int
             index of the variable used in the model
-        type : VariableType
-            type of the variable
+        lower : float
+            lower bound of the variable (0 by default), has to be finite
+        upper : float
+            upper bound of the variable (inf by default)
+            the bounds are handled by the simplex implicitly, they don't need the constraint rows
 
         Methods
         -------
-        __init__(name: str, index: int) -> Variable:
-            constructs new variable with a specified name and index
+        __init__(name: str, index: int, lower: float = 0.0, upper: float = inf) -> Variable:
+            constructs new variable with a specified name, index and bounds
+        bounds_str() -> str:
+            returns the bounds in a readable form, e.g. "x >= 0" or "0 <= x <= 1"
     """
-    def __init__(self, name, index):
+
+    __slots__ = ('name', 'index', 'lower', 'upper')
+
+    def __init__(self, name, index, lower = 0.0, upper = float('inf')):
         self.name = name
         self.index = index
+        self.lower = float(lower)
+        self.upper = float(upper)
         super().__init__(self, 1)
 
+    def bounds_str(self):
+        if self.upper == float('inf'):
+            return f"{self.name} >= {self.lower:g}"
+        return f"{self.lower:g} <= {self.name} <= {self.upper:g}"
+
     def __str__(self):
         return self.name
 
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class SingularBasisError(Exception):
+    pass
+
+
+class BasisFactorization:
+    """
+        A class to represent a factorized simplex basis, i.e. an LU decomposition (with partial pivoting)
+        of the basis matrix followed by a product-form file of eta vectors, one per basis change since the last refactorization.
+        Numpy has no triangular solver, so the triangular factors are inverted once per refactorization
+        and applied as two matrix-vector products, instead of the substitution loops running in python.
+
+
+        Attributes
+        ----------
+        refactorization_frequency : int
+            how many basis changes are kept as eta vectors before the LU decomposition is recomputed
+        lu : numpy.Array
+            2d-array with L (strictly below the diagonal, unit diagonal implied) and U (diagonal and above) factors
+        lower_inverse : numpy.Array
+            inverse of the L factor
+        upper_inverse : numpy.Array
+            inverse of the U factor
+        permutation : numpy.Array
+            row permutation applied by the partial pivoting, i.e. (B[permutation] = LU)
+        etas : list[(int, numpy.Array)]
+            product-form updates, pairs of pivot row and the entering column expressed in the previous basis
+
+        Methods
+        -------
+        __init__(matrix: numpy.Array, refactorization_frequency: int = 64) -> BasisFactorization:
+            factorizes the given (square, nonsingular) basis matrix
+        refactorize(matrix: numpy.Array):
+            discards the eta file and computes a fresh LU decomposition of the given basis matrix
+        needs_refactorization() -> bool:
+            checks whether the eta file got long enough to recompute the decomposition
+        ftran(rhs: numpy.Array) -> numpy.Array:
+            solves B x = rhs (rhs can be a vector or a matrix with one right-hand side per column)
+        btran(rhs: numpy.Array) -> numpy.Array:
+            solves B^T y = rhs
+        update(row: int, column: numpy.Array):
+            replaces the basic column at the given row, column has to be the entering column already transformed by ftran
+    """
+
+    def __init__(self, matrix, refactorization_frequency = 64):
+        self.refactorization_frequency = refactorization_frequency
+        self.refactorize(matrix)
+
+    def refactorize(self, matrix):
+        lu = np.array(matrix, dtype=float)
+        rows_n = lu.shape[0]
+        permutation = np.arange(rows_n)
+
+        for k in range(rows_n):
+            p = k + np.argmax(np.abs(lu[k:, k]))
+            if abs(lu[p, k]) < 1e-12:
+                raise SingularBasisError("Basis matrix is singular")
+            if p != k:
+                lu[[k, p]] = lu[[p, k]]
+                permutation[[k, p]] = permutation[[p, k]]
+            if not lu[k+1:, k].any():
+                # nothing to eliminate, e.g. a slack column
+                continue
+            lu[k+1:, k] /= lu[k, k]
+            lu[k+1:, k+1:] -= np.multiply.outer(lu[k+1:, k], lu[k, k+1:])
+
+        self.lu = lu
+        self.permutation = permutation
+        self.lower_inverse = np.linalg.inv(np.tril(lu, -1) + np.eye(rows_n))
+        self.upper_inverse = np.linalg.inv(np.triu(lu))
+        self.etas = []
+
+    def needs_refactorization(self):
+        return len(self.etas) >= self.refactorization_frequency
+
+    def ftran(self, rhs):
+        x = self.upper_inverse @ (self.lower_inverse @ np.asarray(rhs, dtype=float)[self.permutation])
+        for (row, column) in self.etas:
+            pivot_value = x[row] / column[row]
+            x -= np.multiply.outer(column, pivot_value)
+            x[row] = pivot_value
+        return x
+
+    def btran(self, rhs):
+        y = np.array(rhs, dtype=float)
+        for (row, column) in reversed(self.etas):
+            pivot_value = y[row]
+            y[row] = 0.0
+            y[row] = (pivot_value - column @ y) / column[row]
+
+        y = self.lower_inverse.T @ (self.upper_inverse.T @ y)
+
+        result = np.empty_like(y)
+        result[self.permutation] = y
+        return result
+
+    def update(self, row, column):
+        self.etas.append((row, np.array(column, dtype=float)))
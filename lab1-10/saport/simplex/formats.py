@@ -0,0 +1,691 @@
+import array
+import contextlib
+import gzip
+import os
+import re
+import numpy as np
+
+from . import model as m
+from . import compiled as cm
+from .expressions import objective as ob
+from .expressions import constraint as co
+
+# values at least that big are treated as infinite bounds (the usual MPS convention)
+INFINITY = 1e30
+
+_SENSES = {'L': co.ConstraintType.LE.value, 'E': co.ConstraintType.EQ.value, 'G': co.ConstraintType.GE.value}
+_SENSE_NAMES = {value: name for (name, value) in _SENSES.items()}
+_LP_OPERATORS = {'<': co.ConstraintType.LE.value, '<=': co.ConstraintType.LE.value, '=<': co.ConstraintType.LE.value,
+                 '=': co.ConstraintType.EQ.value,
+                 '>': co.ConstraintType.GE.value, '>=': co.ConstraintType.GE.value, '=>': co.ConstraintType.GE.value}
+_LP_NAME = r"""[A-Za-z!"#$%&()/,;?@_`'{}|~][A-Za-z0-9!"#$%&()/,.;?@_`'{}|~]*"""
+_LP_VALID_NAME = re.compile(f"^{_LP_NAME}$")
+_LP_TOKEN = re.compile(r"\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|(?P<operator><=|>=|=<|=>|<|>|=)|(?P<sign>[+-])"
+                       r"|(?P<label>" + _LP_NAME + r")\s*:|(?P<name>" + _LP_NAME + r"))\s*")
+_LP_SECTIONS = [(re.compile(r"^\s*(maximize|maximise|maximum|max)(?=\s|$)", re.IGNORECASE), 'max'),
+                (re.compile(r"^\s*(minimize|minimise|minimum|min)(?=\s|$)", re.IGNORECASE), 'min'),
+                (re.compile(r"^\s*(subject\s+to|such\s+that|st|s\.t\.)(?=\s|$)", re.IGNORECASE), 'constraints'),
+                (re.compile(r"^\s*(bounds|bound)(?=\s|$)", re.IGNORECASE), 'bounds'),
+                (re.compile(r"^\s*(generals|general|gen|integers|integer)(?=\s|$)", re.IGNORECASE), 'generals'),
+                (re.compile(r"^\s*(binaries|binary|bin)(?=\s|$)", re.IGNORECASE), 'binaries'),
+                (re.compile(r"^\s*(semi-continuous|semis|semi|sos)(?=\s|$)", re.IGNORECASE), 'unsupported'),
+                (re.compile(r"^\s*end(?=\s|$)", re.IGNORECASE), 'end')]
+
+
+def format_of(path, fixed = False):
+    """
+        format_of(path: str, fixed: bool = False) -> MPSFormat | LPFormat:
+            returns the format of the file chosen by its extension (.mps or .lp, optionally followed by .gz)
+    """
+    base = path[:-3] if path.endswith('.gz') else path
+    extension = os.path.splitext(base)[1].lower()
+    if extension == '.mps':
+        return MPSFormat(fixed)
+    if extension == '.lp':
+        return LPFormat()
+    raise Exception(f"Unknown format of the model file {path}, expected .mps or .lp (optionally gzipped)")
+
+
+class MPSFormat:
+    """
+        A class to represent the MPS file format, in its fixed (fields in the fixed columns) or free (whitespace separated) variant.
+        The reader streams the file line by line and collects the matrix as (row, col, value) triplets in compact arrays,
+        so no per-term Python objects are created while reading, the model is built from the resulting matrix form at the end.
+        The model doesn't know the integrality, semi-continuous variables or the objective constant,
+        so the integer markers and the right hand side of the objective row are ignored, the semi-continuous bounds raise an exception.
+        Only the first objective row and the first RHS / RANGES / BOUNDS sets are used, the ranged rows become two constraints.
+        The variables need finite lower bounds (see Model.create_variable), so the free ones (FR, MI) raise an exception.
+
+        Attributes
+        ----------
+        fixed : bool
+            whether the fixed (e.g. allowing spaces in the names) or the free format is used
+
+        Methods
+        -------
+        __init__(fixed: bool = False) -> MPSFormat:
+            constructs a reader / writer of the given variant
+        read(source: str | Iterable[str]) -> Model:
+            reads a model from the file with the given path (gzipped if it ends with .gz) or from the given lines (e.g. an open file)
+        write(model: Model, target: str | TextIO):
+            writes the model to the file with the given path or to the given file object,
+            constraints are named R0, R1, ..., the objective row - OBJ, the maximization is stored in the OBJSENSE section
+    """
+
+    def __init__(self, fixed = False):
+        self.fixed = fixed
+
+    def read(self, source):
+        with _opened(source, 'r') as lines:
+            return self._read(lines, _name_of(source))
+
+    def write(self, model, target):
+        with _opened(target, 'w') as file:
+            self._write(model, file)
+
+    def _read(self, lines, name):
+        """
+            _read(lines: Iterable[str], name: str) -> Model:
+                reads the model section by section, the name from the NAME section replaces the given one
+        """
+        builder = _ModelBuilder(name)
+        rows = dict()
+        objective_name = None
+        sets = {'RHS': None, 'RANGES': None, 'BOUNDS': None}
+        ranges = dict()
+        explicit_lower = set()
+        section = None
+        last_column, column = None, None
+        rows_append, cols_append, values_append, c = builder.rows.append, builder.cols.append, builder.values.append, builder.c
+
+        for line in lines:
+            if line == '' or line[0] == '*' or line.isspace():
+                continue
+            if line[0] not in ' \t':
+                header = line.split()
+                section = header[0].upper()
+                if section == 'NAME':
+                    builder.name = (line[14:].strip() if self.fixed else ' '.join(header[1:])) or builder.name
+                elif section == 'OBJSENSE' and len(header) > 1:
+                    builder.objective_type = _mps_objective_type(header[1])
+                elif section == 'ENDATA':
+                    break
+                elif section not in ('ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'OBJSENSE', 'OBJNAME'):
+                    raise Exception(f"Unsupported MPS section {section}")
+                continue
+
+            if section == 'COLUMNS' and "'MARKER'" in line:
+                continue
+            fields = self._fields(line, section) if self.fixed else line.split()
+            if section == 'COLUMNS':
+                if fields[0] != last_column:
+                    last_column, column = fields[0], builder.column(fields[0])
+                for k in range(1, len(fields) - 1, 2):
+                    row = rows.get(fields[k])
+                    if row == None:
+                        raise Exception(f"Unknown row {fields[k]} of the column {last_column}")
+                    if row >= 0:
+                        rows_append(row)
+                        cols_append(column)
+                        values_append(float(fields[k + 1]))
+                    elif row == -1:
+                        c[column] += float(fields[k + 1])
+            elif section == 'ROWS':
+                (kind, row_name) = (fields[0].upper(), fields[1])
+                if kind == 'N':
+                    is_objective = objective_name == None or objective_name == row_name
+                    rows[row_name] = -1 if is_objective and -1 not in rows.values() else -2
+                elif kind in _SENSES:
+                    rows[row_name] = builder.add_row(_SENSES[kind])
+                else:
+                    raise Exception(f"Unknown type {kind} of the row {row_name}")
+            elif section in ('RHS', 'RANGES'):
+                start = len(fields) % 2
+                if not self._is_first_set(sets, section, fields[0] if start == 1 else ''):
+                    continue
+                for k in range(start, len(fields) - 1, 2):
+                    row = rows.get(fields[k])
+                    if row == None:
+                        raise Exception(f"Unknown row {fields[k]} in the {section} section")
+                    if row < 0:
+                        continue
+                    if section == 'RHS':
+                        builder.b[row] = float(fields[k + 1])
+                    else:
+                        ranges[row] = float(fields[k + 1])
+            elif section == 'BOUNDS':
+                self._read_bound(builder, fields, sets, explicit_lower)
+            elif section == 'OBJSENSE':
+                builder.objective_type = _mps_objective_type(fields[0])
+            elif section == 'OBJNAME':
+                objective_name = fields[0]
+            else:
+                raise Exception(f"Unexpected MPS data outside of the sections: {line.strip()}")
+
+        # an upper bound below zero without an explicit lower bound makes the variable unbounded below
+        for index in np.flatnonzero(np.frombuffer(builder.upper) < 0).tolist():
+            if index not in explicit_lower:
+                builder.lower[index] = -np.inf
+        builder.add_ranges(ranges)
+        return builder.build()
+
+    def _fields(self, line, section):
+        """
+            _fields(line: str, section: str) -> list[str]:
+                splits the fixed format line into fields, the first field is used only by the ROWS and BOUNDS sections
+        """
+        fields = [line[1:3], line[4:12], line[14:22], line[24:36], line[39:47], line[49:61]]
+        fields = [field.strip() for field in (fields if section in ('ROWS', 'BOUNDS') else fields[1:])]
+        if section in ('ROWS', 'BOUNDS') and fields[0] == '':
+            # the type may start in the first column
+            fields[0] = line[0:3].strip()
+        while len(fields) > 0 and fields[-1] == '':
+            fields.pop()
+        return fields
+
+    def _is_first_set(self, sets, section, set_name):
+        """
+            _is_first_set(sets: dict[str, str | None], section: str, set_name: str) -> bool:
+                checks whether the data belongs to the first set of the section (e.g. the first RHS vector)
+        """
+        if sets[section] == None:
+            sets[section] = set_name
+        return sets[section] == set_name
+
+    def _read_bound(self, builder, fields, sets, explicit_lower):
+        """
+            _read_bound(builder: _ModelBuilder, fields: list[str], sets: dict[str, str | None], explicit_lower: set[int]):
+                applies a single line of the BOUNDS section, the bound set name may be omitted in the free format
+        """
+        kind = fields[0].upper()
+        if kind in ('FR', 'MI', 'PL', 'BV'):
+            with_set = len(fields) >= 3
+            (set_name, column_name) = (fields[1], fields[2]) if with_set else ('', fields[1])
+            value = float(fields[3]) if kind == 'BV' and len(fields) > 3 else None
+        elif kind in ('UP', 'LO', 'FX', 'UI', 'LI'):
+            with_set = len(fields) >= 4
+            (set_name, column_name, value) = (fields[1], fields[2], fields[3]) if with_set else ('', fields[1], fields[2])
+            value = float(value)
+            value = np.inf if value >= INFINITY else -np.inf if value <= -INFINITY else value
+        else:
+            raise Exception(f"Unsupported bound type {kind}, only UP, LO, FX, FR, MI, PL, BV, UI and LI are supported")
+
+        if not self._is_first_set(sets, 'BOUNDS', set_name):
+            return
+        column = builder.column(column_name)
+        if kind in ('UP', 'UI'):
+            builder.upper[column] = value
+        elif kind in ('LO', 'LI'):
+            builder.lower[column] = value
+            explicit_lower.add(column)
+        elif kind == 'FX':
+            builder.lower[column] = builder.upper[column] = value
+            explicit_lower.add(column)
+        elif kind == 'BV':
+            (builder.lower[column], builder.upper[column]) = (0.0, 1.0)
+            explicit_lower.add(column)
+        elif kind == 'PL':
+            builder.upper[column] = np.inf
+        else:
+            builder.lower[column] = -np.inf
+            explicit_lower.add(column)
+            if kind == 'FR':
+                builder.upper[column] = np.inf
+
+    def _write(self, model, file):
+        """
+            _write(model: Model, file: TextIO):
+                writes the model column by column (the MPS order), every entry in a separate line
+        """
+        compiled = model.compile()
+        names = [var.name for var in model.variables]
+        self._check_names(names)
+        line = self._line
+        number = _fixed_number if self.fixed else _number
+
+        file.write(f"NAME          {model.name}\n" if self.fixed else f"NAME {model.name}\n")
+        if compiled.objective_type == ob.ObjectiveType.MAX:
+            file.write("OBJSENSE\n    MAX\n")
+        file.write("ROWS\n")
+        file.write(line('N', 'OBJ'))
+        file.write(''.join(line(_SENSE_NAMES[sense], f"R{i}") for (i, sense) in enumerate(compiled.sense.tolist())))
+
+        file.write("COLUMNS\n")
+        matrix = compiled.sparse_A
+        indptr, indices, data, c = matrix.indptr.tolist(), matrix.indices.tolist(), matrix.data.tolist(), compiled.c.tolist()
+        for (j, name) in enumerate(names):
+            start, end = indptr[j], indptr[j + 1]
+            # a column without any entry is still listed, so the variables keep their order
+            entries = [line('', name, 'OBJ', number(c[j]))] if c[j] != 0.0 or start == end else []
+            entries.extend(line('', name, f"R{indices[k]}", number(data[k])) for k in range(start, end))
+            file.write(''.join(entries))
+
+        file.write("RHS\n")
+        file.write(''.join(line('', 'RHS', f"R{i}", number(bound)) for (i, bound) in enumerate(compiled.b.tolist()) if bound != 0.0))
+
+        file.write("BOUNDS\n")
+        for (name, lower, upper) in zip(names, compiled.lower_bounds.tolist(), compiled.upper_bounds.tolist()):
+            if lower == upper:
+                file.write(line('FX', 'BND', name, number(lower)))
+                continue
+            if lower != 0.0:
+                file.write(line('LO', 'BND', name, number(lower)))
+            if upper != np.inf:
+                file.write(line('UP', 'BND', name, number(upper)))
+        file.write("ENDATA\n")
+
+    def _line(self, kind, *fields):
+        """
+            _line(kind: str, *fields: str) -> str:
+                returns a data line with the given type (first field) and the following fields
+        """
+        if not self.fixed:
+            return f" {kind} {' '.join(fields)}\n" if kind else f"    {' '.join(fields)}\n"
+        widths = [(8, '<'), (8, '<'), (12, '>'), (8, '<'), (12, '>')]
+        gaps = ['', '  ', '  ', '   ', '  ']
+        text = f" {kind:<2} " + ''.join(f"{gap}{field:{align}{width}}" for (field, gap, (width, align)) in zip(fields, gaps, widths))
+        return text.rstrip() + "\n"
+
+    def _check_names(self, names):
+        """
+            _check_names(names: list[str]):
+                raises an exception if a variable name can't be stored in the format
+        """
+        for name in names:
+            if self.fixed and (len(name) > 8 or name != name.strip()):
+                raise Exception(f"Variable name '{name}' doesn't fit the fixed MPS format (up to 8 characters)")
+            if not self.fixed and (len(name.split()) != 1 or name[0] == '*'):
+                raise Exception(f"Variable name '{name}' can't be stored in the free MPS format")
+
+
+class LPFormat:
+    """
+        A class to represent the CPLEX LP file format (Maximize / Minimize, Subject To, Bounds, Binaries, General, End sections).
+        The reader streams the file line by line and collects the matrix as (row, col, value) triplets in compact arrays,
+        like the MPS reader, the model is built from the resulting matrix form at the end.
+        The constraint labels are optional and ignored, a constraint may span many lines (or share one), but every bound has to fit in one line.
+        The integrality (General section) and the objective constant are ignored, the binaries become variables bounded by [0, 1],
+        the semi-continuous variables and SOS raise an exception, like the free variables (see MPSFormat).
+
+        Methods
+        -------
+        read(source: str | Iterable[str]) -> Model:
+            reads a model from the file with the given path (gzipped if it ends with .gz) or from the given lines (e.g. an open file)
+        write(model: Model, target: str | TextIO):
+            writes the model to the file with the given path or to the given file object, constraints are named R0, R1, ...
+    """
+
+    def read(self, source):
+        with _opened(source, 'r') as lines:
+            return self._read(lines, _name_of(source))
+
+    def write(self, model, target):
+        with _opened(target, 'w') as file:
+            self._write(model, file)
+
+    def _read(self, lines, name):
+        """
+            _read(lines: Iterable[str], name: str) -> Model:
+                reads the model section by section, the name may be given in the "\\ Problem name: ..." comment
+        """
+        builder = _ModelBuilder(name)
+        section = None
+        statement = _LinearStatement(builder)
+        for line in lines:
+            (line, _, comment) = line.partition('\\')
+            if comment.strip().lower().startswith('problem name:'):
+                builder.name = comment.strip()[len('problem name:'):].strip() or builder.name
+            for (pattern, new_section) in _LP_SECTIONS:
+                match = pattern.match(line)
+                if match != None:
+                    statement.finish(section)
+                    section = new_section
+                    line = line[match.end():]
+                    if section in ('max', 'min'):
+                        builder.objective_type = ob.ObjectiveType.MAX if section == 'max' else ob.ObjectiveType.MIN
+                    break
+            if section == 'end':
+                break
+            if line.strip() == '':
+                continue
+
+            if section in ('max', 'min', 'constraints'):
+                statement.parse(line, section == 'constraints')
+            elif section == 'bounds':
+                self._read_bound(builder, line)
+            elif section == 'binaries':
+                for name in line.split():
+                    column = builder.column(name)
+                    (builder.lower[column], builder.upper[column]) = (0.0, 1.0)
+            elif section == 'generals':
+                for name in line.split():
+                    builder.column(name)
+            elif section == 'unsupported':
+                raise Exception("Semi-continuous variables and SOS aren't supported by the model")
+            else:
+                raise Exception(f"Unexpected LP data outside of the sections: {line.strip()}")
+
+        statement.finish(section)
+        return builder.build()
+
+    def _read_bound(self, builder, line):
+        """
+            _read_bound(builder: _ModelBuilder, line: str):
+                applies a single bound: "x free", "x <= u", "l <= x", "x = v" or "l <= x <= u" (or with >=)
+        """
+        items = []
+        sign = 1.0
+        for (kind, value) in _lp_tokens(line):
+            if kind == 'sign':
+                sign *= -1.0 if value == '-' else 1.0
+            elif kind == 'number' or (kind == 'name' and value.lower() in ('inf', 'infinity')):
+                items.append(('value', sign * float(value)))
+                sign = 1.0
+            else:
+                items.append((kind, value))
+        pattern = [kind for (kind, _) in items]
+        values = [value for (_, value) in items]
+
+        if pattern == ['name', 'name'] and values[1].lower() == 'free':
+            column = builder.column(values[0])
+            (builder.lower[column], builder.upper[column]) = (-np.inf, np.inf)
+        elif pattern == ['value', 'operator', 'name', 'operator', 'value']:
+            column = builder.column(values[2])
+            self._apply_bound(builder, column, _LP_OPERATORS[values[1]] * -1, values[0])
+            self._apply_bound(builder, column, _LP_OPERATORS[values[3]], values[4])
+        elif pattern == ['name', 'operator', 'value']:
+            self._apply_bound(builder, builder.column(values[0]), _LP_OPERATORS[values[1]], values[2])
+        elif pattern == ['value', 'operator', 'name']:
+            self._apply_bound(builder, builder.column(values[2]), _LP_OPERATORS[values[1]] * -1, values[0])
+        else:
+            raise Exception(f"Can't read the bound: {line.strip()}")
+
+    def _apply_bound(self, builder, column, sense, value):
+        """
+            _apply_bound(builder: _ModelBuilder, column: int, sense: int, value: float):
+                applies "x (sense) value" to the bounds of the variable
+        """
+        if sense != co.ConstraintType.GE.value:
+            builder.upper[column] = value
+        if sense != co.ConstraintType.LE.value:
+            builder.lower[column] = value
+
+    def _write(self, model, file):
+        """
+            _write(model: Model, file: TextIO):
+                writes the model row by row, up to 10 terms in a line
+        """
+        compiled = model.compile()
+        names = [var.name for var in model.variables]
+        for name in names:
+            if _LP_VALID_NAME.match(name) == None or name.lower() in ('inf', 'infinity', 'free'):
+                raise Exception(f"Variable name '{name}' can't be stored in the LP format")
+
+        file.write(f"\\ Problem name: {model.name}\n")
+        file.write("Maximize\n" if compiled.objective_type == ob.ObjectiveType.MAX else "Minimize\n")
+        objective_cols = np.flatnonzero(compiled.c)
+        file.write(f" obj: {self._terms(names, objective_cols.tolist(), compiled.c[objective_cols].tolist())}\n")
+
+        file.write("Subject To\n")
+        order = np.argsort(compiled.rows, kind='stable')
+        rows, cols, values = compiled.rows[order], compiled.cols[order].tolist(), compiled.values[order].tolist()
+        row_starts = np.searchsorted(rows, np.arange(compiled.shape[0] + 1)).tolist()
+        for (i, (bound, sense)) in enumerate(zip(compiled.b.tolist(), compiled.sense.tolist())):
+            start, end = row_starts[i], row_starts[i + 1]
+            file.write(f" R{i}: {self._terms(names, cols[start:end], values[start:end])} {co.ConstraintType(sense)} {_number(bound)}\n")
+
+        file.write("Bounds\n")
+        for (name, lower, upper) in zip(names, compiled.lower_bounds.tolist(), compiled.upper_bounds.tolist()):
+            if lower == upper:
+                file.write(f" {name} = {_number(lower)}\n")
+            elif lower != 0.0 and upper != np.inf:
+                file.write(f" {_number(lower)} <= {name} <= {_number(upper)}\n")
+            elif lower != 0.0:
+                file.write(f" {name} >= {_number(lower)}\n")
+            elif upper != np.inf:
+                file.write(f" {name} <= {_number(upper)}\n")
+        file.write("End\n")
+
+    def _terms(self, names, cols, values):
+        """
+            _terms(names: list[str], cols: list[int], values: list[float]) -> str:
+                returns the linear expression in the LP syntax, an empty expression is written as a zero term
+        """
+        terms = [f"{'-' if value < 0 else '+'} {'' if abs(value) == 1.0 else _number(abs(value)) + ' '}{names[col]}"
+                 for (col, value) in zip(cols, values) if value != 0.0]
+        if len(terms) == 0:
+            return f"0 {names[0]}" if len(names) > 0 else ""
+        if terms[0][0] == '+':
+            terms[0] = terms[0][2:]
+        lines = [' '.join(terms[k:k + 10]) for k in range(0, len(terms), 10)]
+        return '\n   '.join(lines)
+
+
+class _LinearStatement:
+    """
+        A class to represent the objective or a constraint of the LP file being read, term by term across the lines.
+        The terms go straight to the builder: the objective factors or the triplets of the next row.
+    """
+
+    def __init__(self, builder):
+        self.builder = builder
+        self._reset()
+
+    def _reset(self):
+        self.sign = 1.0
+        self.coefficient = None
+        self.constant = 0.0
+        self.sense = None
+        self.terms_n = 0
+
+    def parse(self, line, is_constraint):
+        builder = self.builder
+        row = len(builder.b)
+        for (kind, value) in _lp_tokens(line):
+            if kind == 'number':
+                if self.coefficient != None:
+                    raise Exception(f"Two numbers in a row in the LP expression: {line.strip()}")
+                self.coefficient = float(value)
+                if self.sense != None:
+                    builder.add_row(self.sense, self.sign * self.coefficient - self.constant)
+                    self._reset()
+                    row += 1
+            elif kind == 'name':
+                if self.sense != None:
+                    raise Exception(f"Variables on the right hand side aren't supported: {line.strip()}")
+                factor = self.sign * (1.0 if self.coefficient == None else self.coefficient)
+                column = builder.column(value)
+                if is_constraint:
+                    builder.rows.append(row)
+                    builder.cols.append(column)
+                    builder.values.append(factor)
+                else:
+                    builder.c[column] += factor
+                (self.sign, self.coefficient) = (1.0, None)
+                self.terms_n += 1
+            elif kind == 'label':
+                if self.terms_n > 0 or self.sense != None or self.coefficient != None:
+                    raise Exception(f"Label {value} inside of the LP expression: {line.strip()}")
+            elif kind == 'sign':
+                self._move_constant()
+                self.sign *= -1.0 if value == '-' else 1.0
+            else:
+                if not is_constraint or self.sense != None:
+                    raise Exception(f"Unexpected operator {value} in the LP expression: {line.strip()}")
+                self._move_constant()
+                self.sense = _LP_OPERATORS[value]
+
+    def finish(self, section):
+        """
+            finish(section: str | None):
+                called when the section ends, a constraint has to be complete, the objective constant is dropped
+        """
+        if section == 'constraints' and (self.terms_n > 0 or self.sense != None):
+            raise Exception("Incomplete constraint at the end of the Subject To section")
+        self._reset()
+
+    def _move_constant(self):
+        """
+            _move_constant():
+                a number not followed by a variable is a constant of the left hand side
+        """
+        if self.coefficient != None:
+            self.constant += self.sign * self.coefficient
+            (self.sign, self.coefficient) = (1.0, None)
+
+
+class _ModelBuilder:
+    """
+        A class to represent a model being read from a file, columns are indexed by their names in the order of appearance,
+        the matrix and the bounds are kept in compact arrays (array.array) until the whole file is read.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.columns = dict()
+        self.column_names = []
+        self.c = array.array('d')
+        self.lower = array.array('d')
+        self.upper = array.array('d')
+        self.rows = array.array('q')
+        self.cols = array.array('q')
+        self.values = array.array('d')
+        self.b = array.array('d')
+        self.sense = array.array('b')
+        self.objective_type = ob.ObjectiveType.MIN
+
+    def column(self, name):
+        index = self.columns.get(name)
+        if index == None:
+            index = len(self.column_names)
+            self.columns[name] = index
+            self.column_names.append(name)
+            self.c.append(0.0)
+            self.lower.append(0.0)
+            self.upper.append(np.inf)
+        return index
+
+    def add_row(self, sense, bound = 0.0):
+        self.b.append(bound)
+        self.sense.append(sense)
+        return len(self.b) - 1
+
+    def add_ranges(self, ranges):
+        """
+            add_ranges(ranges: dict[int, float]):
+                turns the ranged rows into pairs of constraints: the row keeps its right hand side, the new one gets the other end
+        """
+        if len(ranges) == 0:
+            return
+        ranged = np.array(list(ranges.keys()), dtype=np.int64)
+        mapping = np.full(len(self.b), -1, dtype=np.int64)
+        mapping[ranged] = np.arange(len(self.b), len(self.b) + len(ranged))
+        rows = np.frombuffer(self.rows, dtype=np.int64)
+        copied = np.flatnonzero(mapping[rows] >= 0)
+        new_rows = mapping[rows[copied]]
+        new_cols = np.frombuffer(self.cols, dtype=np.int64)[copied]
+        new_values = np.frombuffer(self.values)[copied]
+        del rows
+        self.rows.extend(new_rows.tolist())
+        self.cols.extend(new_cols.tolist())
+        self.values.extend(new_values.tolist())
+
+        for (row, value) in ranges.items():
+            (bound, sense) = (self.b[row], self.sense[row])
+            if sense == co.ConstraintType.EQ.value:
+                self.sense[row] = co.ConstraintType.GE.value if value > 0 else co.ConstraintType.LE.value
+                sense = -self.sense[row]
+            else:
+                sense = -sense
+            self.add_row(sense, bound - abs(value) if sense == co.ConstraintType.GE.value else bound + abs(value))
+
+    def build(self):
+        shape = (len(self.b), len(self.column_names))
+        compiled = cm.CompiledModel(shape,
+                                    np.frombuffer(self.rows, dtype=np.int64),
+                                    np.frombuffer(self.cols, dtype=np.int64),
+                                    np.frombuffer(self.values),
+                                    np.array(self.b, dtype=float),
+                                    np.array(self.sense, dtype=int),
+                                    np.array(self.c, dtype=float),
+                                    self.objective_type,
+                                    np.array(self.lower, dtype=float),
+                                    np.array(self.upper, dtype=float))
+        return m.Model.from_compiled(self.name, compiled, self.column_names)
+
+
+def _lp_tokens(line):
+    """
+        _lp_tokens(line: str) -> Iterator[(str, str)]:
+            yields (kind, text) of the tokens of the LP line: number, operator, sign, label (name followed by a colon) or name
+    """
+    position = 0
+    line = line.rstrip()
+    for match in _LP_TOKEN.finditer(line):
+        if match.start() != position:
+            break
+        position = match.end()
+        yield (match.lastgroup, match.group(match.lastgroup))
+    if position != len(line):
+        raise Exception(f"Can't read the LP line: {line.strip()}")
+
+
+def _mps_objective_type(text):
+    """
+        _mps_objective_type(text: str) -> ObjectiveType:
+            reads the direction of the OBJSENSE section
+    """
+    text = text.upper()
+    if text in ('MAX', 'MAXIMIZE'):
+        return ob.ObjectiveType.MAX
+    if text in ('MIN', 'MINIMIZE'):
+        return ob.ObjectiveType.MIN
+    raise Exception(f"Unknown objective sense {text}")
+
+
+def _number(value):
+    """
+        _number(value: float) -> str:
+            returns the shortest text representing the value exactly, e.g. "3" instead of "3.0"
+    """
+    text = repr(float(value))
+    return text[:-2] if text.endswith('.0') else text
+
+
+def _fixed_number(value):
+    """
+        _fixed_number(value: float) -> str:
+            returns the value rounded to fit the 12 characters of the fixed MPS field
+    """
+    text = _number(value)
+    precision = 12
+    while len(text) > 12:
+        precision -= 1
+        text = f"{value:.{precision}g}"
+    return text
+
+
+def _name_of(source):
+    """
+        _name_of(source: str | Iterable[str]) -> str:
+            returns the default name of the model read from the source: name of the file without the extensions
+    """
+    if not isinstance(source, str):
+        return _name_of(source.name) if isinstance(getattr(source, 'name', None), str) else 'model'
+    name = os.path.basename(source)
+    name = name[:-3] if name.endswith('.gz') else name
+    return os.path.splitext(name)[0]
+
+
+@contextlib.contextmanager
+def _opened(target, mode):
+    """
+        _opened(target: str | TextIO, mode: str) -> ContextManager[TextIO]:
+            opens the file with the given path (gzipped if it ends with .gz), the file objects are used as they are (not closed)
+    """
+    if not isinstance(target, str):
+        yield target
+        return
+    file = gzip.open(target, mode + 't') if target.endswith('.gz') else open(target, mode)
+    with file:
+        yield file
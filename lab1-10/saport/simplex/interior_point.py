@@ -0,0 +1,328 @@
+import numpy as np
+
+from . import solver as sv
+from . import solution as s
+from . import tableaux as t
+from .dual_solver import DualSimplexSolver
+
+# the largest weight of a variable in the normal equations (see _scaling)
+max_scaling = 1e20
+
+
+class InteriorPointSolver(sv.Solver):
+    """
+        A class to represent a primal-dual interior point solver (Mehrotra's predictor-corrector method).
+        The normal model (max c x, A x = b, 0 <= x <= upper, see Solver._normalize_model) is solved by Newton steps
+        on the perturbed optimality conditions, every iteration factorizes the dense normal equations matrix A D A^T once
+        (Cholesky) and uses it twice: for the affine (predictor) direction and for the centered (corrector) one.
+        The number of iterations barely depends on the size of the model, so for the large dense models
+        (e.g. the mixed strategies of the big games) it's much faster than pivoting.
+        The interior solution is then crossed over to a basic one: the linearly independent columns farthest from their bounds
+        form the basis (the tableaux is computed with a single solve), the nonbasic variables go to their nearest bound
+        and a few (dual, then primal) simplex pivots clean up the basis, so the solution has the usual optimal tableaux (sensitivity analysis,
+        reoptimization of the integer solver, etc. keep working).
+        If the iterations don't converge (e.g. for the unfeasible or unbounded models) the model is solved with the simplex.
+
+        Attributes
+        ----------
+        tolerance : float
+            relative tolerance of the primal and dual residuals and of the duality gap
+        max_iterations : int
+            limit of the interior point iterations, after which the simplex takes over
+        interior_iterations : int
+            number of the interior point iterations made during the last solve
+        crossover_pivots : int
+            number of the simplex pivots (dual and primal) cleaning up the basis found by the crossover
+        used_simplex : bool
+            whether the last solve fell back to the simplex
+
+        Methods
+        -------
+        __init__(tolerance: float = 1e-6, max_iterations: int = 100, pricing: PricingRule = DantzigPricing(), presolver: Presolver | None = None, statistics: bool = False, hooks: list[Callable] | None = None, formulation: Formulation = Formulation.PRIMAL, limits: SolveLimits | None = None, keep_tableaux: bool = True) -> InteriorPointSolver:
+            constructs a new solver, the pricing rule is used by the simplex pivots of the crossover,
+            the iteration limit counts both the interior point iterations and the pivots, a solve interrupted before the crossover has no basis
+        solve(model: Model) -> Solution:
+            solves the given model and return the first solution
+    """
+
+    def __init__(self, tolerance = 1e-6, max_iterations = 100, pricing = None, presolver = None, statistics = False, hooks = None, formulation = sv.Formulation.PRIMAL, limits = None, keep_tableaux = True):
+        super().__init__(pricing, presolver=presolver, statistics=statistics, hooks=hooks, formulation=formulation, limits=limits, keep_tableaux=keep_tableaux)
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.interior_iterations = 0
+        self.crossover_pivots = 0
+        self.used_simplex = False
+
+    def _solve(self, model):
+        self.interior_iterations = 0
+        self.crossover_pivots = 0
+        self.used_simplex = False
+
+        normal_model = self._normalize_model(model)
+        self._phase = "interior point"
+        compiled = normal_model.compile()
+        upper = compiled.upper_bounds - compiled.lower_bounds
+        x = None if compiled.shape[0] == 0 else self._interior_point(compiled.A, compiled.b, compiled.c, upper)
+        tableaux = None if x is None else self._crossover(normal_model, x)
+        if tableaux == None:
+            self.used_simplex = True
+            return super()._solve(model)
+
+        initial_tableaux = self._initial_copy(tableaux)
+        pivots = self.iterations
+        self._phase = "phase two"
+        is_bounded = self._optimize(tableaux)
+        self.crossover_pivots += self.iterations - pivots
+        if not is_bounded:
+            return s.Solution.unbounded(model, initial_tableaux, tableaux, normal_model)
+
+        assignment = tableaux.extract_assignment()
+        return self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model)
+
+    def _check_limits(self, iterations = None):
+        """
+            _check_limits(iterations: int | None = None):
+                see Solver._check_limits, the iterations default to the interior point iterations and the pivots made so far
+        """
+        super()._check_limits(self.iterations + self.interior_iterations if iterations == None else iterations)
+
+    def _interior_point(self, A, b, c, upper):
+        """
+            _interior_point(A: numpy.Array, b: numpy.Array, c: numpy.Array, upper: numpy.Array) -> numpy.Array | None:
+                returns an (almost) optimal x of max c x, A x = b, 0 <= x <= upper, or None if the iterations don't converge,
+                the finite upper bounds get their own slacks w (x + w = upper) with the dual variables v
+        """
+        rows_n, cols_n = A.shape
+        q = -c
+        bounded = np.isfinite(upper)
+        u = np.where(bounded, upper, 0.0)
+        x, y, z, w, v = self._starting_point(A, b, q, bounded, u)
+        scale = 1.0 + max(np.abs(b).max(initial=0.0), np.abs(q).max(initial=0.0), np.abs(u).max(initial=0.0))
+        complementarity_n = cols_n + int(bounded.sum())
+
+        for iteration in range(self.max_iterations):
+            self._check_limits()
+            rb = b - A @ x
+            ru = np.where(bounded, u - x - w, 0.0)
+            rc = q - A.T @ y - z + v
+            mu = (x @ z + w @ v) / complementarity_n
+            primal_objective = q @ x
+            dual_objective = b @ y - u @ v
+            if (np.linalg.norm(rb) <= self.tolerance * (1.0 + np.linalg.norm(b))
+                    and np.linalg.norm(ru) <= self.tolerance * (1.0 + np.linalg.norm(u))
+                    and np.linalg.norm(rc) <= self.tolerance * (1.0 + np.linalg.norm(q))
+                    and abs(primal_objective - dual_objective) <= self.tolerance * (1.0 + abs(primal_objective))):
+                return x
+            if not np.isfinite(mu) or max(np.abs(x).max(), np.abs(y).max(initial=0.0)) > 1e12 * scale:
+                # the iterates diverge, the model is most likely unfeasible or unbounded
+                return None
+            self.interior_iterations += 1
+
+            theta = _scaling(x, z, w, v)
+            normal_matrix = (A * theta) @ A.T
+            factor = (normal_matrix, self._factorize(normal_matrix))
+            residuals = (rb, ru, rc)
+
+            # the complementarity terms are divided by the vanishing x and w, near the optimum of a degenerate model
+            # the directions may not be representable, then the crossover starts from the current point
+            with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+                # predictor: the pure Newton (affine scaling) direction
+                dx, dy, dz, dw, dv = self._direction(A, theta, factor, residuals, (x, z, w, v), -x * z, -w * v, bounded)
+                primal_step = min(_max_step(x, dx), _max_step(w, dw))
+                dual_step = min(_max_step(z, dz), _max_step(v, dv))
+                affine_mu = ((x + primal_step * dx) @ (z + dual_step * dz) + (w + primal_step * dw) @ (v + dual_step * dv)) / complementarity_n
+                sigma = (affine_mu / mu) ** 3
+
+                # corrector: centered towards sigma * mu, with the second order term of the predictor
+                dx, dy, dz, dw, dv = self._direction(A, theta, factor, residuals, (x, z, w, v),
+                                                     sigma * mu - x * z - dx * dz,
+                                                     np.where(bounded, sigma * mu - w * v - dw * dv, 0.0), bounded)
+                primal_step = min(1.0, 0.9995 * min(_max_step(x, dx, np.inf), _max_step(w, dw, np.inf)))
+                dual_step = min(1.0, 0.9995 * min(_max_step(z, dz, np.inf), _max_step(v, dv, np.inf)))
+            if not all(np.isfinite(direction).all() for direction in (dx, dy, dz, dw, dv)) or not np.isfinite([primal_step, dual_step]).all():
+                return x
+            x = x + primal_step * dx
+            w = np.where(bounded, w + primal_step * dw, 1.0)
+            y = y + dual_step * dy
+            z = z + dual_step * dz
+            v = np.where(bounded, v + dual_step * dv, 0.0)
+        return None
+
+    def _starting_point(self, A, b, q, bounded, u):
+        """
+            _starting_point(A: numpy.Array, b: numpy.Array, q: numpy.Array, bounded: numpy.Array, u: numpy.Array) -> (numpy.Array, ...):
+                returns the Mehrotra's starting point (x, y, z, w, v): the least squares solutions of the primal and dual equalities
+                shifted to the strictly positive values, the slacks w of the unbounded variables are kept at 1 (and their v at 0)
+        """
+        normal_matrix = A @ A.T
+        factor = (normal_matrix, self._factorize(normal_matrix))
+        x = A.T @ _solve(factor, b)
+        y = _solve(factor, A @ q)
+        z = q - A.T @ y
+        w = np.where(bounded, u - x, 1.0)
+        v = np.where(bounded, np.maximum(-z, 0.0), 0.0)
+        z = np.where(bounded, np.maximum(z, 0.0), z)
+
+        primal_shift = max(-1.5 * min(x.min(), w.min()), 0.0)
+        dual_shift = max(-1.5 * min(z.min(), np.where(bounded, v, np.inf).min(initial=np.inf)), 0.0)
+        x, z = x + primal_shift, z + dual_shift
+        w = np.where(bounded, w + primal_shift, 1.0)
+        v = np.where(bounded, v + dual_shift, 0.0)
+
+        products = x @ z + w @ v
+        x_sum, z_sum = x.sum() + np.where(bounded, w, 0.0).sum(), z.sum() + v.sum()
+        primal_shift = 0.5 * products / z_sum if z_sum > 0 else 1.0
+        dual_shift = 0.5 * products / x_sum if x_sum > 0 else 1.0
+        x, z = x + max(primal_shift, 1e-2), z + max(dual_shift, 1e-2)
+        w = np.where(bounded, w + max(primal_shift, 1e-2), 1.0)
+        v = np.where(bounded, v + max(dual_shift, 1e-2), 0.0)
+        return (x, y, z, w, v)
+
+    def _direction(self, A, theta, factor, residuals, point, rxz, rwv, bounded):
+        """
+            _direction(A, theta, factor: (numpy.Array, numpy.Array), residuals: (rb, ru, rc), point: (x, z, w, v), rxz: numpy.Array, rwv: numpy.Array, bounded: numpy.Array) -> (dx, dy, dz, dw, dv):
+                solves the Newton system with the given right hand sides of the complementarity equations (x z and w v),
+                reduced to the normal equations A theta A^T dy = rb + A theta r, with the factorized matrix
+        """
+        rb, ru, rc = residuals
+        x, z, w, v = point
+        reduced = rc - rxz / x + np.where(bounded, (rwv - v * ru) / w, 0.0)
+        dy = _solve(factor, rb + A @ (theta * reduced))
+        dx = theta * (A.T @ dy - reduced)
+        dz = (rxz - z * dx) / x
+        dw = np.where(bounded, ru - dx, 0.0)
+        dv = np.where(bounded, (rwv - v * dw) / w, 0.0)
+        return (dx, dy, dz, dw, dv)
+
+    def _factorize(self, matrix):
+        """
+            _factorize(matrix: numpy.Array) -> numpy.Array:
+                returns the inverse of the Cholesky factor of the symmetric (semi)definite matrix,
+                regularized when the constraints are linearly dependent (or the matrix is badly conditioned)
+        """
+        identity = np.eye(len(matrix))
+        regularization = 1e-14 * (1.0 + np.abs(np.diag(matrix)).max(initial=0.0))
+        while True:
+            try:
+                return np.linalg.inv(np.linalg.cholesky(matrix + regularization * identity))
+            except np.linalg.LinAlgError:
+                regularization *= 100
+
+    def _crossover(self, normal_model, x):
+        """
+            _crossover(normal_model: Model, x: numpy.Array) -> Tableaux | None:
+                returns an optimal tableaux of the normal model built from the interior solution x,
+                or None if the basis couldn't be cleaned up (then the simplex solves the model from scratch)
+        """
+        tableaux = self._basic_initial_tableaux(normal_model)
+        table, upper = tableaux.table, tableaux.upper_bounds
+        rows_n = len(tableaux.basis)
+
+        # the columns far from their bounds are the most likely basic ones, the chosen columns have to be linearly independent,
+        # if there are less of them than rows (dependent constraints), the basis is completed with unit columns
+        basis_cols, orthonormal = _independent_columns(table[1:, :-1], np.argsort(-np.minimum(x, upper - x), kind='stable'))
+        unit_rows, _ = _independent_columns(np.eye(rows_n), range(rows_n), orthonormal)
+        basic_n = len(basis_cols)
+        try:
+            table[1:] = np.linalg.solve(np.column_stack([table[1:, basis_cols], np.eye(rows_n)[:, unit_rows]]), table[1:])
+        except np.linalg.LinAlgError:
+            return None
+        table[1:, basis_cols] = 0.0
+        table[1 + np.arange(basic_n), basis_cols] = 1.0
+        table[0] -= table[0, basis_cols] @ table[1:1 + basic_n]
+        table[0, basis_cols] = 0.0
+        tableaux.basis[:] = -1
+        tableaux.basis[:basic_n] = basis_cols
+
+        # the rows completed with the unit columns are combinations of the other ones, they can't have a basic variable
+        dependent = table[1 + basic_n:]
+        if (np.abs(dependent[:, -1]) > np.sqrt(self.tolerance) * (1.0 + np.abs(table[1:, -1]).max())).any():
+            return None
+        dependent[:] = 0.0
+        nonbasic = np.ones(tableaux.columns_n(), dtype=bool)
+        nonbasic[tableaux.basis[tableaux.basis >= 0]] = False
+        for col in np.flatnonzero(nonbasic & np.isfinite(upper) & (x > upper / 2)):
+            tableaux.complement(col)
+
+        values = tableaux.table[1:, -1]
+        values[np.abs(values) <= t.eps] = 0.0
+        basic_upper = np.where(tableaux.basis >= 0, upper[tableaux.basis], np.inf)
+        if (values < 0).any() or (values > basic_upper + t.eps).any():
+            # the costs are shifted to make the basis dual feasible, the dual simplex restores the primal feasibility
+            costs = tableaux.table[0, :-1]
+            costs[costs < 0] = 0.0
+            dual_solver = DualSimplexSolver()
+            feasible = dual_solver.optimize(tableaux)
+            self.iterations += dual_solver.iterations
+            self.crossover_pivots += dual_solver.iterations
+            if not feasible:
+                return None
+            tableaux = self._restore_original_objective_row(tableaux, normal_model)
+            tableaux = self._fix_objective_row_to_the_basis(tableaux)
+        return tableaux
+
+
+def _scaling(x, z, w, v):
+    """
+        _scaling(x: numpy.Array, z: numpy.Array, w: numpy.Array, v: numpy.Array) -> numpy.Array:
+            returns the weights theta = 1 / (z / x + v / w) of the normal equations, computed as x w / (z w + v x),
+            so the vanishing x and w aren't divided by, and capped by max_scaling (the basic variables near the optimum
+            have the weights growing without any limit), the variables at their bounds get the weights close to zero
+    """
+    products = x * w
+    return products / np.maximum(z * w + v * x, np.maximum(products / max_scaling, np.finfo(float).tiny))
+
+
+def _max_step(values, directions, limit = 1.0):
+    """
+        _max_step(values: numpy.Array, directions: numpy.Array, limit: float = 1.0) -> float:
+            returns the largest step (at most the limit) keeping values + step * directions nonnegative
+    """
+    decreasing = directions < 0
+    if not decreasing.any():
+        return limit
+    return min(limit, (-values[decreasing] / directions[decreasing]).min())
+
+
+def _solve(factor, rhs, refinements = 2):
+    """
+        _solve(factor: (numpy.Array, numpy.Array), rhs: numpy.Array, refinements: int = 2) -> numpy.Array:
+            solves the system with the matrix M = L L^T, given M and the inverse of its Cholesky factor L,
+            near the optimum M is very badly conditioned, so the solution is iteratively refined (each step costs a product with M)
+    """
+    matrix, inverse = factor
+    solution = inverse.T @ (inverse @ rhs)
+    for _ in range(refinements):
+        solution += inverse.T @ (inverse @ (rhs - matrix @ solution))
+    return solution
+
+
+def _independent_columns(matrix, candidates, orthonormal = None):
+    """
+        _independent_columns(matrix: numpy.Array, candidates: Iterable[int], orthonormal: numpy.Array | None = None) -> (list[int], numpy.Array):
+            returns the candidate columns (in their order) linearly independent of the previously chosen ones
+            and of the given orthonormal columns, and the orthonormal basis of all of them (Gram-Schmidt, orthogonalized twice)
+    """
+    rows_n = matrix.shape[0]
+    basis = np.empty((rows_n, rows_n))
+    found_n = 0 if orthonormal is None else orthonormal.shape[1]
+    if found_n > 0:
+        basis[:, :found_n] = orthonormal
+    chosen = []
+    for col in candidates:
+        if found_n == rows_n:
+            break
+        column = matrix[:, col]
+        norm = np.linalg.norm(column)
+        if norm == 0.0:
+            continue
+        found = basis[:, :found_n]
+        residual = column - found @ (found.T @ column)
+        residual -= found @ (found.T @ residual)
+        residual_norm = np.linalg.norm(residual)
+        if residual_norm <= t.eps * norm:
+            continue
+        basis[:, found_n] = residual / residual_norm
+        found_n += 1
+        chosen.append(col)
+    return (chosen, basis[:, :found_n])
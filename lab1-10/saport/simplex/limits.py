@@ -0,0 +1,94 @@
+import threading
+import time
+
+from . import solution as s
+
+
+class CancellationToken:
+    """
+        A class to represent a request to stop the solves using it (see SolveLimits), it can be triggered from another thread,
+        the solvers check it once per iteration, so the solve stops after the current pivot.
+
+        Methods
+        -------
+        __init__() -> CancellationToken:
+            constructs a new, not cancelled token
+        cancel():
+            asks the solves to stop
+        is_cancelled() -> bool:
+            checks whether the token has been cancelled
+        reset():
+            makes the token usable again
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def reset(self):
+        self._event.clear()
+
+
+class SolveLimits:
+    """
+        A class to represent the limits of a single solve, checked by the solvers at every iteration (pivot, bound flip,
+        interior point step). The interrupted solve doesn't raise, it returns a solution with the status saying why it has stopped
+        (see Status in saport.simplex.solution) and the basis reached so far.
+
+        Attributes
+        ----------
+        time_limit : float
+            seconds the solve may take (measured from its start), inf by default
+        iteration_limit : int | None
+            number of the iterations the solve may make (both phases), unlimited by default
+        cancellation : CancellationToken | None
+            token stopping the solve when cancelled, e.g. from another thread
+
+        Methods
+        -------
+        __init__(time_limit: float = inf, iteration_limit: int | None = None, cancellation: CancellationToken | None = None) -> SolveLimits:
+            constructs the limits
+        start():
+            called by the solver when the solve starts, sets the deadline
+        reached(iterations: int) -> Status | None:
+            returns the status of the exceeded limit (TIME_LIMIT, ITERATION_LIMIT or CANCELLED), None if the solve can go on
+        remaining_time() -> float:
+            returns seconds left until the deadline
+    """
+
+    def __init__(self, time_limit = float('inf'), iteration_limit = None, cancellation = None):
+        self.time_limit = time_limit
+        self.iteration_limit = iteration_limit
+        self.cancellation = cancellation
+        self._deadline = float('inf')
+
+    def start(self):
+        self._deadline = time.perf_counter() + self.time_limit
+
+    def reached(self, iterations):
+        if self.cancellation != None and self.cancellation.is_cancelled():
+            return s.Status.CANCELLED
+        if self.iteration_limit != None and iterations >= self.iteration_limit:
+            return s.Status.ITERATION_LIMIT
+        if self._deadline != float('inf') and time.perf_counter() >= self._deadline:
+            return s.Status.TIME_LIMIT
+        return None
+
+    def remaining_time(self):
+        return max(self._deadline - time.perf_counter(), 0.0)
+
+
+class SolveInterrupted(Exception):
+    """
+        Raised inside the solvers when a limit is reached, it unwinds the iterations up to the method building the solution,
+        it never leaves the solver.
+    """
+
+    def __init__(self, status):
+        super().__init__(status.name)
+        self.status = status
@@ -1,12 +1,14 @@
-from copy import deepcopy
 import enum
 from itertools import permutations
 
 from . import solver as s
+from . import compiled as cm
+from . import formats as fo
 from .expressions import expression as ex
 from .expressions import variable as va
 from .expressions import objective as ob
 from .expressions import constraint as co
+from .expressions import matrix as mx
 import numpy as np
 
 class Model:
@@ -29,24 +31,52 @@ class Model:
         -------
         __init__(name: str) -> Model:
             constructs new model with a specified name
-        create_variable(name: str) -> Variable
+        @staticmethod from_compiled(name: str, compiled: CompiledModel, variable_names: list[str]) -> Model:
+            constructs a model from its matrix form (e.g. read from a file) in a time linear in its size,
+            the repeated entries of the matrix are summed up, the matrix form is cached as if the model had been compiled
+        @staticmethod from_file(path: str, fixed: bool = False) -> Model:
+            reads a model from the MPS (.mps, fixed or free format) or CPLEX LP (.lp) file, optionally gzipped (.gz), see saport.simplex.formats
+        to_file(path: str, fixed: bool = False)
+            writes the model to the MPS or CPLEX LP file, chosen by the extension like in from_file
+        create_variable(name: str, lower: float = 0.0, upper: float = inf) -> Variable
             returns a new variable with a specified named, the variable is automatically indexed and added to the variables list
+            the bounds are handled by the solvers implicitly, so e.g. binary relaxations don't need the "x <= 1" constraints
+        create_variables(n: int, name: str | list[str] = "x", lower: float | Iterable[float] = 0.0, upper: float | Iterable[float] = inf) -> VariableArray
+            returns a block of n new variables, named with the given prefix and their position in the block (x0, x1, ...) or with the given names,
+            the block can be used in the matrix expressions, e.g. model.add_constraints(A @ xs <= b), see saport.simplex.expressions.matrix
+        variable(name: str) -> Variable
+            returns the variable with the given name
         add_constraint(constraint: Constraint)
             add a new constraint to the model
+        add_constraints(constraints: MatrixConstraint)
+            adds a block of constraints (e.g. A @ xs <= b, with a dense or a sparse matrix) to the model,
+            the block extends the matrix form directly, without compiling the model again
         maximize(expression: Expression)
             sets objective to maximize the specified Expression
         minimize(expression: Expression)
             sets objective to minimize the specified Expression
         translate_to_standard_form() -> Model
             creates a new equivalent model in a standard form (max objective and <= / = constraints)
+            the variables are shared with the original model, only the changed constraints and objective are new objects
         is_equivalent(other: Model) -> bool
             checks whether the model is equivalent to another one (ignores variables' names, etc.), useful when writing tests
         dual() -> Model
-            creates a dual model 
+            creates a dual model directly from the matrix form, the dual variable y{i} belongs to the i-th constraint,
+            the next ones to the finite upper bounds of the variables (in their order), the last ones to the mirrored halves
+            of the equality constraints (a x = b is split into a x <= b and -a x <= -b, so the free dual variable is a difference)
+        compile() -> CompiledModel
+            returns the model in the matrix form (A, b, c, constraint types and variable bounds as numpy arrays)
+            the result is cached until the model is changed via its methods
+        invalidate()
+            drops the cached matrix form, has to be called after modifying the constraints or the objective in place
 
-        solve() -> Solution
+        solve(solver: Solver | None = None, cache: SolutionCache | None = None) -> Solution
             solves the current model using Simplex solver and returns the result
+            the default tableaux solver can be replaced, e.g. with RevisedSolver from saport.simplex.revised_solver
+            or InteriorPointSolver from saport.simplex.interior_point (for the large dense models)
+            with a cache (see saport.simplex.cache) the solution of an identical model solved before (by a solver with the same settings) is returned immediately
             when called, the model should already contain at least one variable and objective
+            the model isn't copied, so the solution refers to the model itself
     """
     
     def __init__(self, name):
@@ -54,125 +84,245 @@ class Model:
         self.variables = []
         self.constraints = []
         self.objective = None
+        self._compiled = None
+        self._names = {}
+        self._indexed_variables = self.variables
+        self._indexed_n = 0
 
-    def create_variable(self, name):
-        for var in self.variables:
-            if (var.name == name):
-                raise Exception(f"There is already a variable named {name}")
+    @staticmethod
+    def from_compiled(name, compiled, variable_names):
+        rows_n, cols_n = compiled.shape
+        lower_bounds, upper_bounds = compiled.lower_bounds, compiled.upper_bounds
+        if not np.isfinite(lower_bounds).all():
+            raise Exception(f"Lower bound of the variable {variable_names[np.flatnonzero(~np.isfinite(lower_bounds))[0]]} has to be finite")
+        if (lower_bounds > upper_bounds).any():
+            raise Exception(f"Lower bound of the variable {variable_names[np.flatnonzero(lower_bounds > upper_bounds)[0]]} is greater than its upper bound")
+
+        model = Model(name)
+        model.variables = [va.Variable(var_name, index, lower, upper) for (index, (var_name, lower, upper))
+                           in enumerate(zip(variable_names, lower_bounds.tolist(), upper_bounds.tolist()))]
+        if len(set(variable_names)) != cols_n:
+            raise Exception("There are variables with the same name")
+
+        # sorted by row (and column), so every constraint is a slice, the repeated entries are summed up
+        block = mx.MatrixExpression(rows_n, compiled.rows, compiled.cols, compiled.values, model.variables)
+        rows, cols, values = block.compressed()
+        for (expression, bound, sense) in zip(block.expressions(), compiled.b.tolist(), compiled.sense.tolist()):
+            model.constraints.append(co.Constraint(expression, bound, co.ConstraintType(sense)))
+
+        if compiled.objective_type != None:
+            objective_cols = np.flatnonzero(compiled.c)
+            expression = ex.Expression.from_indexes(model.variables, objective_cols.tolist(), compiled.c[objective_cols].tolist())
+            model.objective = ob.Objective(expression, compiled.objective_type)
+
+        model._compiled = cm.CompiledModel(compiled.shape, rows, cols, values, compiled.b, compiled.sense, compiled.c,
+                                           compiled.objective_type, lower_bounds, upper_bounds)
+        return model
+
+    @staticmethod
+    def from_file(path, fixed = False):
+        return fo.format_of(path, fixed).read(path)
+
+    def to_file(self, path, fixed = False):
+        fo.format_of(path, fixed).write(self, path)
+
+    def create_variable(self, name, lower = 0.0, upper = float('inf')):
+        names = self._name_index()
+        if name in names:
+            raise Exception(f"There is already a variable named {name}")
+        if not np.isfinite(lower):
+            raise Exception(f"Lower bound of the variable {name} has to be finite")
+        if lower > upper:
+            raise Exception(f"Lower bound of the variable {name} is greater than its upper bound")
 
         new_index = len(self.variables)
-        variable = va.Variable(name, new_index)
+        variable = va.Variable(name, new_index, lower, upper)
         self.variables.append(variable)
+        names[name] = variable
+        self._indexed_n += 1
+        self.invalidate()
         return variable 
 
+    def create_variables(self, n, name = "x", lower = 0.0, upper = float('inf')):
+        var_names = [f"{name}{i}" for i in range(n)] if isinstance(name, str) else list(name)
+        if len(var_names) != n:
+            raise Exception(f"Expected {n} names of the variables, got {len(var_names)}")
+        lower_bounds = np.broadcast_to(np.asarray(lower, dtype=float), (n,))
+        upper_bounds = np.broadcast_to(np.asarray(upper, dtype=float), (n,))
+        if not np.isfinite(lower_bounds).all():
+            raise Exception(f"Lower bound of the variable {var_names[np.flatnonzero(~np.isfinite(lower_bounds))[0]]} has to be finite")
+        if (lower_bounds > upper_bounds).any():
+            raise Exception(f"Lower bound of the variable {var_names[np.flatnonzero(lower_bounds > upper_bounds)[0]]} is greater than its upper bound")
+        names = self._name_index()
+        clashes = [var_name for var_name in var_names if var_name in names]
+        if len(clashes) > 0:
+            raise Exception(f"There is already a variable named {clashes[0]}")
+        if len(set(var_names)) != n:
+            raise Exception("There are variables with the same name")
+
+        first_index = len(self.variables)
+        variables = [va.Variable(var_name, first_index + i, var_lower, var_upper) for (i, (var_name, var_lower, var_upper))
+                     in enumerate(zip(var_names, lower_bounds.tolist(), upper_bounds.tolist()))]
+        self.variables.extend(variables)
+        names.update(zip(var_names, variables))
+        self._indexed_n += n
+        if self._compiled != None:
+            self._compiled = self._compiled.with_variables(lower_bounds.copy(), upper_bounds.copy())
+        return mx.VariableArray(variables)
+
+    def variable(self, name):
+        names = self._name_index()
+        if name not in names:
+            raise Exception(f"There is no variable named {name}")
+        return names[name]
+
     def add_constraint(self, constraint):
         self.constraints.append(constraint)
+        self.invalidate()
+
+    def add_constraints(self, constraints):
+        compiled = self.compile()
+        rows, cols, values = constraints.expression.compressed()
+        self.constraints.extend(constraints.constraints())
+        self._compiled = compiled.with_constraints(rows, cols, values, constraints.bounds.copy(),
+                                                   np.full(len(constraints.bounds), constraints.type.value))
          
     def maximize(self, expression):
         self.objective = ob.Objective(expression, ob.ObjectiveType.MAX)
+        self._update_objective()
     
     def minimize(self, expression):
         self.objective = ob.Objective(expression, ob.ObjectiveType.MIN)
+        self._update_objective()
+
+    def _update_objective(self):
+        """
+            _update_objective():
+                puts the new objective to the cached matrix form, the constraints part stays valid
+        """
+        if self._compiled != None:
+            self._compiled = self._compiled.with_objective(self.objective)
+
+    def _name_index(self):
+        """
+            _name_index() -> dict[str, Variable]:
+                returns the variables by their names, the index is rebuilt when the variables list has been replaced or changed directly
+        """
+        if self._indexed_variables is not self.variables or self._indexed_n != len(self.variables):
+            self._names = {var.name: var for var in self.variables}
+            self._indexed_variables = self.variables
+            self._indexed_n = len(self.variables)
+        return self._names
+
+    def compile(self):
+        if self._compiled == None:
+            self._compiled = cm.CompiledModel.from_model(self)
+        return self._compiled
+
+    def invalidate(self):
+        self._compiled = None
         
     def _simplify(self):
         self.constraints = [c.simplify() for c in self.constraints]
         self.objective = self.objective.simplify()
+        self.invalidate()
 
     def is_equivalent(self, other):
         if not isinstance(other, Model):
             return False
 
-        m1 = self.translate_to_standard_form()
-        m2 = other.translate_to_standard_form()
+        m1 = self.translate_to_standard_form().compile()
+        m2 = other.translate_to_standard_form().compile()
 
-        if len(m1.variables) != len(m1.variables):
-            return False 
-        
-        if len(m1.constraints) != len(m2.constraints):
+        if m1.shape != m2.shape:
             return False 
 
-        if m1.objective.type != m2.objective.type:
+        if m1.objective_type != m2.objective_type:
             return False
 
-        if m1.objective.expression.factors(self) != m2.objective.expression.factors(other):
-            return False 
-
-        for (i, c) in enumerate(m1.constraints):
-            oc = m2.constraints[i]
-            
-            if c.bound != oc.bound:
-                return False 
-
-            if c.type != oc.type:
-                return False
-
-            fs = c.expression.factors(self)
-            ofs = oc.expression.factors(other)
-            if fs != ofs:
-                return False
-
-        return True
+        return (np.array_equal(m1.c, m2.c) 
+                and np.array_equal(m1.b, m2.b) 
+                and np.array_equal(m1.lower_bounds, m2.lower_bounds) 
+                and np.array_equal(m1.upper_bounds, m2.upper_bounds) 
+                and np.array_equal(m1.sense, m2.sense) 
+                and np.array_equal(m1.A, m2.A))
         
     def dual(self):
         self._check_if_creating_dual_is_possible()
+        compiled = self.compile()
+        rows_n, cols_n = compiled.shape
+
+        # the primal in the standard form: max c x, A x <= b (the equalities stay for now), x <= upper
+        signs = np.where(compiled.sense == co.ConstraintType.GE.value, -1.0, 1.0)
+        values = signs[compiled.rows] * compiled.values
+        bounds = signs * compiled.b
+        c = compiled.c * compiled.objective_type.value
 
-        primal = self.translate_to_standard_form()
-        dual = Model(f"{primal.name} (dual)")
-        self._create_dual_variables(primal, dual)
-        self._create_dual_objective(primal, dual)
-        self._create_dual_constraints(primal, dual)
-        return dual
+        # the dual needs a variable for every finite upper bound and the mirrored (-A x <= -b) half of every equality
+        bounded = np.flatnonzero(np.isfinite(compiled.upper_bounds))
+        equalities = np.flatnonzero(compiled.sense == co.ConstraintType.EQ.value)
+        mirrors = np.full(rows_n, -1)
+        mirrors[equalities] = rows_n + len(bounded) + np.arange(len(equalities))
+        mirrored = mirrors[compiled.rows] >= 0
+        dual_variables_n = rows_n + len(bounded) + len(equalities)
+
+        dual = cm.CompiledModel((cols_n, dual_variables_n),
+                                np.concatenate([compiled.cols, bounded, compiled.cols[mirrored]]),
+                                np.concatenate([compiled.rows, rows_n + np.arange(len(bounded)), mirrors[compiled.rows[mirrored]]]),
+                                np.concatenate([values, np.ones(len(bounded)), -values[mirrored]]),
+                                c,
+                                np.full(cols_n, co.ConstraintType.GE.value),
+                                np.concatenate([bounds, compiled.upper_bounds[bounded], -bounds[equalities]]),
+                                ob.ObjectiveType.MIN,
+                                np.zeros(dual_variables_n),
+                                np.full(dual_variables_n, np.inf))
+        return Model.from_compiled(f"{self.name} (dual)", dual, [f"y{i}" for i in range(dual_variables_n)])
 
     def translate_to_standard_form(self):
-        standard = deepcopy(self)
+        standard = type(self)(self.name)
+        standard.variables = list(self.variables)
+        standard.constraints = self.constraints
+        standard.objective = self.objective
         standard._simplify()
         standard._change_constraints_to_LE()
         standard._change_objective_to_max()
         return standard
         
     def _check_if_creating_dual_is_possible(self):
-        for constraint in self.constraints:
-            if constraint.type == co.ConstraintType.EQ:
-                raise Exception("Model doesn't support (yet) duals for problems with equality constraints")
-
-    def _create_dual_constraints(self, primal, dual):
-        factors_matrix = np.array([c.expression.factors(primal) for c in primal.constraints])
-        dual_factors_matrix = factors_matrix.T
-        for (i, f) in enumerate(primal.objective.expression.factors(primal)):
-            e = ex.Expression.from_vectors(dual.variables, dual_factors_matrix[i])
-            dual.add_constraint(e >= f)
-
-    def _create_dual_objective(self, primal, dual):
-        dual_obj_factors = [c.bound for c in primal.constraints]
-        dual.minimize(ex.Expression.from_vectors(dual.variables, dual_obj_factors))
-
-    def _create_dual_variables(self, primal, dual):
-        for (i, _) in enumerate(primal.constraints):
-            dual.create_variable(f"y{i}")
+        if self.objective == None:
+            raise Exception("Can't create a dual of a model without an objective")
+        for var in self.variables:
+            if var.lower != 0.0:
+                # the dual objective would need a constant term
+                raise Exception("Model doesn't support (yet) duals for problems with nonzero lower bounds")
 
     def _change_objective_to_max(self):
         if self.objective.type == ob.ObjectiveType.MIN:
             self.objective.invert()
+            self.invalidate()
 
     def _change_constraints_to_LE(self):
         for constraint in self.constraints:
             if constraint.type == co.ConstraintType.GE:
                 constraint.invert()
+        self.invalidate()
 
-    def solve(self):
+    def solve(self, solver = None, cache = None):
         if len(self.variables) == 0:
             raise Exception("Can't solve a model without any variables")
 
         if self.objective == None:
             raise Exception("Can't solve a model without an objective")
 
-        solver = s.Solver()
-        return solver.solve(deepcopy(self))
+        solver = s.Solver() if solver == None else solver
+        if cache != None:
+            return cache.solve(self, solver)
+        return solver.solve(self)
 
     def __str__(self):
         separator = '\n\t'
         text = f'''- name: {self.name}
-- variables:{separator}{separator.join([f"{v.name} >= 0" for v in self.variables])}
+- variables:{separator}{separator.join([v.bounds_str() for v in self.variables])}
 - constraints:{separator}{separator.join([str(c) for c in self.constraints])}
 - objective:{separator}{self.objective}
 '''
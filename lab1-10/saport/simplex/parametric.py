@@ -0,0 +1,261 @@
+from enum import Enum
+import numpy as np
+
+from . import tableaux as t
+from . import dual_solver as dsv
+from .scenarios import ScenarioSolver
+from .expressions import objective as o
+
+
+class SweepEnd(Enum):
+    """
+        An enum to represent why the parametric sweep stopped at one of its ends:
+        - REACHED = the requested value of the parameter has been reached
+        - UNFEASIBLE = the model is unfeasible beyond this point
+        - UNBOUNDED = the model is unbounded beyond this point
+        - LIMIT = the maximal number of pivots has been reached
+    """
+    REACHED = 0
+    UNFEASIBLE = 1
+    UNBOUNDED = 2
+    LIMIT = 3
+
+
+class ParametricResult:
+    """
+        A class to represent the optimal objective value as a (piecewise linear) function of a single parameter.
+
+        Attributes
+        ----------
+        breakpoints : numpy.Array
+            increasing values of the parameter where the slope changes, including both ends of the sweep
+        values : numpy.Array
+            optimal objective value at every breakpoint
+        slopes : numpy.Array
+            slope of the objective value between consecutive breakpoints (one less than the breakpoints)
+        lower_end : SweepEnd
+            why the sweep stopped at the first breakpoint
+        upper_end : SweepEnd
+            why the sweep stopped at the last breakpoint
+
+        Methods
+        -------
+        value(parameter: float) -> float:
+            returns the optimal objective value for the given parameter (within the swept range, nan outside of it)
+    """
+
+    def __init__(self, breakpoints, values, slopes, lower_end, upper_end):
+        self.breakpoints = breakpoints
+        self.values = values
+        self.slopes = slopes
+        self.lower_end = lower_end
+        self.upper_end = upper_end
+
+    def value(self, parameter):
+        if parameter < self.breakpoints[0] - t.eps or parameter > self.breakpoints[-1] + t.eps:
+            return np.nan
+        return float(np.interp(parameter, self.breakpoints, self.values))
+
+    def __str__(self):
+        text = f"- breakpoints: {self.lower_end.name} "
+        text += " ".join(f"{b:.3f}" for b in self.breakpoints)
+        text += f" {self.upper_end.name}\n- slopes: " + " ".join(f"{s:.3f}" for s in self.slopes)
+        return text
+
+
+class ParametricAnalyser:
+    """
+        A class to compute the optimal objective value as a function of a single constraint bound or objective factor.
+        Instead of solving the model for every sampled value, it starts from the final tableaux of an optimal solution
+        and moves the parameter straight to the next value where the basis stops being feasible (bound) or optimal (factor).
+        There a single pivot is made (dual simplex for the bounds, primal for the factors) and the walk continues,
+        so every breakpoint of the piecewise linear value function costs one pivot.
+
+        Attributes
+        ----------
+        max_pivots : int
+            maximal number of pivots made in each direction of the sweep
+        iterations : int
+            number of pivots made during the last sweep
+
+        Methods
+        -------
+        __init__(max_pivots: int = 1000) -> ParametricAnalyser:
+            constructs a new analyser
+        bound_sweep(solution: Solution, constraint_index: int, lower: float, upper: float) -> ParametricResult:
+            returns the optimal objective value as a function of the bound of the given constraint, within [lower, upper]
+        objective_sweep(solution: Solution, var: Variable, lower: float, upper: float) -> ParametricResult:
+            returns the optimal objective value as a function of the objective factor of the given variable, within [lower, upper]
+    """
+
+    def __init__(self, max_pivots = 1000):
+        self.max_pivots = max_pivots
+        self.iterations = 0
+
+    def bound_sweep(self, solution, constraint_index, lower, upper):
+        self.iterations = 0
+        basis = ScenarioSolver(solution)
+        tableaux = solution.tableaux
+        start = float(solution.model.constraints[constraint_index].bound)
+
+        # column of the parameter: how the basic values (relative to their bounds, as in the tableaux) and the objective
+        # change with the bound, it's pivoted together with the tableaux
+        unit = np.zeros(len(basis.basis))
+        unit[constraint_index] = 1.0
+        change = np.linalg.solve(basis.B, unit)
+        complemented = tableaux.complemented[np.maximum(basis.basis, 0)] & (basis.basis >= 0)
+        column = np.concatenate([[0.0], np.where(complemented, -change, change)])
+        # basis -1 (row without a basic variable) picks the zero cost appended at the end
+        costs = np.zeros(tableaux.columns_n() + 1)
+        costs[:basis.variables_n] = solution.normal_model.compile().c[:basis.variables_n]
+        column[0] = costs[basis.basis] @ change
+
+        sign = 1.0 if solution.model.objective.type == o.ObjectiveType.MAX else -1.0
+        walks = []
+        for (direction, limit) in [(-1.0, lower), (1.0, upper)]:
+            segments, end = self._bound_walk(tableaux.copy(), column * direction, abs(limit - start))
+            walks.append(([(step, sign * rate) for (step, rate) in segments], end))
+        return self._create_result(start, solution.objective_value(), walks, (lower, upper))
+
+    def _bound_walk(self, tableaux, column, distance):
+        """
+            _bound_walk(tableaux: Tableaux, column: numpy.Array, distance: float) -> (list[(float, float)], SweepEnd):
+                increases the parameter moving the table's bounds along the column, up to the given distance
+                returns list of (step, change of the max form objective per unit of the step) segments and the reason of stopping
+        """
+        segments = []
+        dual_solver = dsv.DualSimplexSolver()
+        travelled = 0.0
+        for _ in range(self.max_pivots + 1):
+            values = tableaux.table[1:, -1]
+            has_basic = tableaux.basis >= 0
+            upper_bounds = np.where(has_basic, tableaux.upper_bounds[np.maximum(tableaux.basis, 0)], 0.0)
+            steps = np.full(len(values), np.inf)
+            decreasing = column[1:] < -t.eps
+            increasing = (column[1:] > t.eps) & np.isfinite(upper_bounds)
+            steps[decreasing] = np.maximum(values[decreasing], 0.0) / -column[1:][decreasing]
+            steps[increasing] = np.maximum(upper_bounds[increasing] - values[increasing], 0.0) / column[1:][increasing]
+            row = np.argmin(steps)
+
+            step = min(steps[row], distance - travelled)
+            segments.append((step, column[0]))
+            travelled += step
+            tableaux.table[:, -1] += step * column
+            if travelled >= distance:
+                return (segments, SweepEnd.REACHED)
+            if len(segments) > self.max_pivots:
+                return (segments, SweepEnd.LIMIT)
+
+            # the blocking basic variable leaves the basis (dual simplex pivot), at its upper bound it's complemented first
+            row += 1
+            if tableaux.basis[row - 1] < 0:
+                # redundant constraint is no longer consistent with the other ones
+                return (segments, SweepEnd.UNFEASIBLE)
+            if column[row] > 0:
+                tableaux.complement_basic(row)
+                column[row] *= -1
+            col, _ = dual_solver._choose_entering_variable(tableaux, row)
+            if col == None:
+                return (segments, SweepEnd.UNFEASIBLE)
+            pivot_column = tableaux.table[:, col].copy()
+            tableaux.pivot(row, col)
+            self.iterations += 1
+            factor = column[row] / pivot_column[row]
+            column -= factor * pivot_column
+            column[row] = factor
+
+    def objective_sweep(self, solution, var, lower, upper):
+        self.iterations = 0
+        if solution.assignment == None or solution.tableaux == None:
+            raise Exception("Parametric sweep can start only from an optimal solution with a tableaux")
+        if len(solution.normal_model.constraints) != len(solution.model.constraints):
+            raise Exception("Parametric sweep can't start from a presolved solution, its tableaux refers to the reduced model")
+        start = float(solution.model.objective.expression.coefficients.get(var.index, 0.0))
+        sign = 1.0 if solution.model.objective.type == o.ObjectiveType.MAX else -1.0
+        walks = []
+        for (direction, limit) in [(-1.0, lower), (1.0, upper)]:
+            segments, end = self._objective_walk(solution.tableaux.copy(), var.index, direction * sign, abs(limit - start))
+            # the slope of the value function is just the value of the variable
+            walks.append(([(step, direction * value) for (step, value) in segments], end))
+        return self._create_result(start, solution.objective_value(), walks, (lower, upper))
+
+    def _objective_walk(self, tableaux, index, direction, distance):
+        """
+            _objective_walk(tableaux: Tableaux, index: int, direction: float, distance: float) -> (list[(float, float)], SweepEnd):
+                increases the (max form) cost factor of the given column by the direction times the parameter, up to the given distance
+                returns list of (step, value of the variable) segments and the reason of stopping
+        """
+        segments = []
+        travelled = 0.0
+        change = np.zeros(tableaux.columns_n())
+        change[index] = direction
+        for _ in range(self.max_pivots + 1):
+            # change of the cost row per unit of the parameter, complemented columns represent (upper - x)
+            column_change = np.where(tableaux.complemented, -change, change)
+            basic_rows = np.flatnonzero(tableaux.basis >= 0)
+            cost_change = column_change[tableaux.basis[basic_rows]] @ tableaux.table[basic_rows + 1, :-1] - column_change
+
+            nonbasic = np.ones(tableaux.columns_n(), dtype=bool)
+            nonbasic[tableaux.basis[basic_rows]] = False
+            candidates = np.flatnonzero(nonbasic & (cost_change < -t.eps))
+            steps = np.maximum(tableaux.cost_factors(candidates), 0.0) / -cost_change[candidates]
+            best = np.argmin(steps) if len(steps) > 0 else None
+
+            step = distance - travelled if best == None else min(steps[best], distance - travelled)
+            segments.append((step, tableaux.extract_assignment()[index]))
+            travelled += step
+            tableaux.table[0, :-1] += step * cost_change
+            if travelled >= distance:
+                return (segments, SweepEnd.REACHED)
+            if len(segments) > self.max_pivots:
+                return (segments, SweepEnd.LIMIT)
+
+            # the variable which became attractive enters the basis (primal simplex pivot or bound flip)
+            col = candidates[best]
+            row, pivot_step = tableaux.bounded_ratio_test(col)
+            if pivot_step == np.inf:
+                return (segments, SweepEnd.UNBOUNDED)
+            if row == None:
+                tableaux.complement(col)
+            else:
+                if tableaux.table[row, col] < 0:
+                    tableaux.complement_basic(row)
+                tableaux.pivot(row, col)
+            self.iterations += 1
+
+    def _create_result(self, start, start_value, walks, limits):
+        """
+            _create_result(start: float, start_value: float, walks: list[(list[(float, float)], SweepEnd)], limits: (float, float)) -> ParametricResult:
+                joins the walks down and up from the starting value (segments with the change of the objective per unit of the step),
+                pivots that haven't changed the slope (e.g. the degenerate ones) don't make a breakpoint
+        """
+        sides = []
+        for ((segments, end), direction, limit) in zip(walks, [-1.0, 1.0], limits):
+            parameters, values, slopes = [], [], []
+            parameter, value = start, start_value
+            for (step, rate) in segments:
+                if step <= t.eps:
+                    continue
+                parameter += direction * step
+                value += step * rate if rate != 0 else 0.0
+                if len(slopes) > 0 and abs(slopes[-1] - direction * rate) <= t.eps:
+                    parameters[-1], values[-1] = parameter, value
+                    continue
+                parameters.append(parameter)
+                values.append(value)
+                slopes.append(direction * rate)
+            if end == SweepEnd.REACHED and len(parameters) > 0:
+                parameters[-1] = limit
+            sides.append((parameters, values, slopes))
+
+        (down, up) = sides
+        # the segments on both sides of the starting value can have the same slope too
+        if len(down[2]) > 0 and len(up[2]) > 0 and abs(down[2][0] - up[2][0]) <= t.eps:
+            breakpoints = down[0][::-1] + up[0]
+            values = down[1][::-1] + up[1]
+            slopes = down[2][::-1] + up[2][1:]
+        else:
+            breakpoints = down[0][::-1] + [start] + up[0]
+            values = down[1][::-1] + [start_value] + up[1]
+            slopes = down[2][::-1] + up[2]
+        return ParametricResult(np.array(breakpoints), np.array(values), np.array(slopes), walks[0][1], walks[1][1])
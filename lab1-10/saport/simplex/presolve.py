@@ -0,0 +1,294 @@
+from collections import Counter
+import numpy as np
+
+from . import model as m
+from . import tableaux as t
+from .expressions import constraint as c
+from .expressions import expression as ex
+from .expressions import objective as o
+
+
+class PresolveReport:
+    """
+        A class to represent a summary of the presolve, i.e. what has been removed from the model and why.
+
+        Attributes
+        ----------
+        original_shape : (int, int)
+            number of constraints and variables in the original model
+        reduced_shape : (int, int)
+            number of constraints and variables in the reduced model
+        removed_rows : Counter[str]
+            number of removed constraints by the reason (empty, singleton, duplicate, redundant)
+        removed_columns : Counter[str]
+            number of removed variables by the reason (fixed, empty)
+        is_feasible : bool
+            whether the presolve hasn't proven the model unfeasible
+
+        Methods
+        -------
+        rows_removed() -> int:
+            returns total number of the removed constraints
+        columns_removed() -> int:
+            returns total number of the removed variables
+    """
+
+    def __init__(self, original_shape):
+        self.original_shape = original_shape
+        self.reduced_shape = original_shape
+        self.removed_rows = Counter()
+        self.removed_columns = Counter()
+        self.is_feasible = True
+
+    def rows_removed(self):
+        return sum(self.removed_rows.values())
+
+    def columns_removed(self):
+        return sum(self.removed_columns.values())
+
+    def __str__(self):
+        if not self.is_feasible:
+            return "- presolve: the model is unfeasible"
+        rows = ", ".join(f"{reason}: {n}" for (reason, n) in self.removed_rows.items())
+        columns = ", ".join(f"{reason}: {n}" for (reason, n) in self.removed_columns.items())
+        text = f"- presolve: {self.original_shape[0]}x{self.original_shape[1]} -> {self.reduced_shape[0]}x{self.reduced_shape[1]}\n"
+        text += f"\t- removed constraints: {self.rows_removed()} ({rows})\n"
+        text += f"\t- removed variables: {self.columns_removed()} ({columns})"
+        return text
+
+
+class Presolver:
+    """
+        A class to represent the LP presolve, reducing the model before it's passed to the simplex.
+        It works on the compiled model and repeats following reductions until nothing changes:
+        - fixed variables (lower bound = upper bound) are substituted into the constraints,
+        - empty constraints are checked and removed,
+        - singleton constraints (a single variable) are turned into variable bounds,
+        - duplicate constraints (the same up to a factor) are merged, the tighter one is kept,
+        - redundant constraints (satisfied for any values within the variable bounds) are removed,
+        - empty variables (not used by any constraint) are fixed at the bound optimal for the objective.
+        The bounds found on the way are passed to the reduced model as the variable bounds, they don't need constraint rows.
+        Presolver remembers what it has done, so the solution (and the dual values) of the reduced model
+        can be mapped back to the original model.
+
+        Attributes
+        ----------
+        max_passes : int
+            maximal number of the passes over all the reductions
+        report : PresolveReport
+            summary of the last presolve
+
+        Methods
+        -------
+        __init__(max_passes: int = 16) -> Presolver:
+            constructs a new presolver
+        presolve(model: Model) -> Model | None:
+            returns the reduced model (with the maximized objective), None if the model has been found unfeasible
+        postsolve(reduced_assignment: list[float]) -> list[float]:
+            maps the assignment of the reduced model back to the variables of the original model
+        postsolve_duals(reduced_duals: numpy.Array, assignment: list[float]) -> numpy.Array:
+            maps the dual values of the reduced model constraints to the original constraints,
+            dual values are the multipliers of the maximization form, i.e. (c - A^T y) are the reduced costs,
+            the removed singleton constraints take over the reduced cost of the variable, if they define its active bound
+    """
+
+    def __init__(self, max_passes = 16):
+        self.max_passes = max_passes
+
+    def presolve(self, model):
+        compiled = model.compile()
+        self.report = PresolveReport(compiled.shape)
+        self.A = compiled.A
+        self.b = compiled.b.copy()
+        self.sense = compiled.sense
+        self.c = compiled.c if compiled.objective_type == o.ObjectiveType.MAX else -compiled.c
+        self.lower = compiled.lower_bounds.copy()
+        self.upper = compiled.upper_bounds.copy()
+        self.lower_rows = np.full(compiled.shape[1], -1)
+        self.upper_rows = np.full(compiled.shape[1], -1)
+        self.values = np.full(compiled.shape[1], np.nan)
+        self.rows = np.ones(compiled.shape[0], dtype=bool)
+        self.cols = np.ones(compiled.shape[1], dtype=bool)
+
+        reductions = [self._remove_fixed_columns, self._remove_empty_rows, self._remove_singleton_rows,
+                      self._remove_duplicate_rows, self._remove_redundant_rows, self._remove_empty_columns]
+        for _ in range(self.max_passes):
+            changed = False
+            for reduction in reductions:
+                changed = reduction() or changed
+                if not self.report.is_feasible:
+                    return None
+            if not changed:
+                break
+
+        # the last pass could have removed the last rows of some variables
+        self._remove_empty_columns()
+        return self._create_reduced_model(model)
+
+    def postsolve(self, reduced_assignment):
+        assignment = self.values.copy()
+        cols = np.flatnonzero(self.cols)
+        assignment[cols] = reduced_assignment[:len(cols)]
+        return assignment.tolist()
+
+    def postsolve_duals(self, reduced_duals, assignment):
+        rows = np.flatnonzero(self.rows)
+        duals = np.zeros(len(self.rows))
+        duals[rows] = np.asarray(reduced_duals, dtype=float)[:len(rows)]
+        reduced_costs = self.c - self.A.T @ duals
+        assignment = np.asarray(assignment, dtype=float)
+
+        at_upper = (reduced_costs > t.eps) & (self.upper_rows >= 0) & (assignment >= self.upper - t.eps)
+        at_lower = (reduced_costs < -t.eps) & (self.lower_rows >= 0) & (assignment <= self.lower + t.eps)
+        for (cols, bound_rows) in [(np.flatnonzero(at_upper), self.upper_rows), (np.flatnonzero(at_lower), self.lower_rows)]:
+            duals[bound_rows[cols]] += reduced_costs[cols] / self.A[bound_rows[cols], cols]
+        return duals
+
+    def _active(self):
+        """
+            _active() -> (numpy.Array, numpy.Array, numpy.Array):
+                returns indexes of the remaining rows and columns and the corresponding submatrix
+        """
+        rows, cols = np.flatnonzero(self.rows), np.flatnonzero(self.cols)
+        return (rows, cols, self.A[np.ix_(rows, cols)])
+
+    def _fix(self, cols, values, reason):
+        self.values[cols] = values
+        self.b -= self.A[:, cols] @ values
+        self.cols[cols] = False
+        self.report.removed_columns[reason] += len(cols)
+
+    def _remove_rows(self, rows, reason):
+        self.rows[rows] = False
+        self.report.removed_rows[reason] += len(rows)
+
+    def _remove_fixed_columns(self):
+        fixed = np.flatnonzero(self.cols & (self.upper - self.lower <= t.eps))
+        if len(fixed) == 0:
+            return False
+        self._fix(fixed, self.lower[fixed], "fixed")
+        return True
+
+    def _remove_empty_rows(self):
+        rows, _, A = self._active()
+        empty = rows[~A.any(axis=1)]
+        if len(empty) == 0:
+            return False
+        b, sense = self.b[empty], self.sense[empty]
+        violated = np.where(sense == c.ConstraintType.LE.value, b < -t.eps,
+                            np.where(sense == c.ConstraintType.GE.value, b > t.eps, np.abs(b) > t.eps))
+        if violated.any():
+            self.report.is_feasible = False
+            return False
+        self._remove_rows(empty, "empty")
+        return True
+
+    def _remove_singleton_rows(self):
+        rows, cols, A = self._active()
+        nonzero = A != 0
+        singletons = np.flatnonzero(nonzero.sum(axis=1) == 1)
+        if len(singletons) == 0:
+            return False
+
+        for row in singletons:
+            i, j = rows[row], cols[np.argmax(nonzero[row])]
+            factor = A[row, np.argmax(nonzero[row])]
+            bound = self.b[i] / factor
+            # dividing by a negative factor swaps LE and GE
+            sense = self.sense[i] * np.sign(factor)
+            if sense <= 0 and bound < self.upper[j]:
+                self.upper[j], self.upper_rows[j] = bound, i
+            if sense >= 0 and bound > self.lower[j]:
+                self.lower[j], self.lower_rows[j] = bound, i
+
+        self._remove_rows(rows[singletons], "singleton")
+        if (self.lower > self.upper + t.eps).any():
+            self.report.is_feasible = False
+        return True
+
+    def _remove_duplicate_rows(self):
+        rows, _, A = self._active()
+        groups = dict()
+        for (row, coefficients) in enumerate(A):
+            nonzero = np.flatnonzero(coefficients)
+            if len(nonzero) < 2:
+                continue
+            factor = coefficients[nonzero[0]]
+            key = np.round(coefficients / factor, 12).tobytes()
+            groups.setdefault(key, []).append((rows[row], self.sense[rows[row]] * np.sign(factor), self.b[rows[row]] / factor))
+
+        duplicates = []
+        for group in groups.values():
+            if len(group) > 1:
+                duplicates += self._merge_duplicates(group)
+                if not self.report.is_feasible:
+                    return False
+        if len(duplicates) == 0:
+            return False
+        self._remove_rows(duplicates, "duplicate")
+        return True
+
+    def _merge_duplicates(self, group):
+        """
+            _merge_duplicates(group: list[(int, int, float)]) -> list[int]:
+                for the rows (index, sense, bound) with the same (scaled) coefficients returns the rows that can be removed,
+                only the tightest LE, the tightest GE and a single EQ row are needed
+        """
+        by_sense = {sense: sorted([(bound, i) for (i, s, bound) in group if s == sense]) for sense in (-1, 0, 1)}
+        le, eq, ge = by_sense[c.ConstraintType.LE.value], by_sense[c.ConstraintType.EQ.value], by_sense[c.ConstraintType.GE.value]
+        removed = [i for (_, i) in le[1:]] + [i for (_, i) in ge[:-1]] + [i for (_, i) in eq[1:]]
+
+        if len(eq) > 0:
+            bound = eq[0][0]
+            if (eq[-1][0] - bound > t.eps
+                or (len(le) > 0 and bound > le[0][0] + t.eps)
+                or (len(ge) > 0 and bound < ge[-1][0] - t.eps)):
+                self.report.is_feasible = False
+            removed += [i for (_, i) in le[:1]] + [i for (_, i) in ge[-1:]]
+        elif len(le) > 0 and len(ge) > 0 and ge[-1][0] > le[0][0] + t.eps:
+            self.report.is_feasible = False
+        return removed
+
+    def _remove_redundant_rows(self):
+        rows, cols, A = self._active()
+        lower, upper = self.lower[cols], self.upper[cols]
+        with np.errstate(invalid='ignore'):
+            min_activity = np.where(A > 0, A * lower, np.where(A < 0, A * upper, 0.0)).sum(axis=1)
+            max_activity = np.where(A > 0, A * upper, np.where(A < 0, A * lower, 0.0)).sum(axis=1)
+
+        b, sense = self.b[rows], self.sense[rows]
+        le, ge = sense == c.ConstraintType.LE.value, sense == c.ConstraintType.GE.value
+        if ((~ge & (min_activity > b + t.eps)) | (~le & (max_activity < b - t.eps))).any():
+            self.report.is_feasible = False
+            return False
+
+        redundant = rows[(le & (max_activity <= b + t.eps)) | (ge & (min_activity >= b - t.eps))]
+        if len(redundant) == 0:
+            return False
+        self._remove_rows(redundant, "redundant")
+        return True
+
+    def _remove_empty_columns(self):
+        rows, cols, A = self._active()
+        empty = cols[~A.any(axis=0)]
+        # a variable increasing the objective without an upper bound makes the model unbounded, it's left for the solver
+        empty = empty[(self.c[empty] <= t.eps) | np.isfinite(self.upper[empty])]
+        if len(empty) == 0:
+            return False
+        values = np.where(self.c[empty] > t.eps, self.upper[empty], self.lower[empty])
+        self._fix(empty, values, "empty")
+        return True
+
+    def _create_reduced_model(self, original_model):
+        rows, cols, A = self._active()
+
+        model = m.Model(f"{original_model.name} (presolved)")
+        variables = [model.create_variable(original_model.variables[j].name, self.lower[j], self.upper[j]) for j in cols]
+        for (row, i) in enumerate(rows):
+            nonzero = np.flatnonzero(A[row])
+            expression = ex.Expression.from_vectors([variables[k] for k in nonzero], A[row, nonzero])
+            model.add_constraint(c.Constraint(expression, float(self.b[i]), c.ConstraintType(self.sense[i])))
+        model.maximize(ex.Expression.from_vectors(variables, self.c[cols]))
+
+        self.report.reduced_shape = (len(rows), len(cols))
+        return model
@@ -0,0 +1,184 @@
+import math
+import numpy as np
+from . import tableaux as t
+
+
+class PricingRule:
+    """
+        An abstract class to represent a pricing rule, i.e. a strategy choosing the variable entering the basis.
+
+        Methods
+        -------
+        reset(tableaux: Tableaux):
+            called once before the optimization of the given tableaux starts (e.g. at the beginning of every simplex phase)
+        choose_entering_variable(tableaux: Tableaux) -> int | None:
+            finds index of the variable, that should enter the basis next, returns None if the tableaux is optimal
+        choose_leaving_variable(tableaux: Tableaux, col: int) -> int:
+            finds index of the row, that should leave the basis next, by default the tableaux ratio test is used
+        update(tableaux: Tableaux, row: int, col: int):
+            called right before the tableaux is pivoted on the given row and column, allows to update the pricing weights
+    """
+
+    def reset(self, tableaux):
+        pass
+
+    def choose_entering_variable(self, tableaux):
+        raise Exception("This is an abstract pricing rule, don't call it directly!")
+
+    def choose_leaving_variable(self, tableaux, col):
+        return tableaux.choose_leaving_variable(col)
+
+    def update(self, tableaux, row, col):
+        pass
+
+
+class DantzigPricing(PricingRule):
+    """
+        The classic Dantzig's rule, the variable with the most negative cost factor enters the basis.
+    """
+
+    def choose_entering_variable(self, tableaux):
+        if tableaux.is_optimal():
+            return None
+        return tableaux.choose_entering_variable()
+
+
+class BlandPricing(PricingRule):
+    """
+        The Bland's rule, the first variable with negative cost factor enters the basis
+        and ties in the ratio test are broken by the smallest index of the leaving variable.
+        It's slow, but it never cycles, so it's a good fallback on the degenerate problems.
+    """
+
+    def choose_entering_variable(self, tableaux):
+        candidates = tableaux.cost_factors() < -t.eps
+        col = np.argmax(candidates)
+        return col if candidates[col] else None
+
+    def choose_leaving_variable(self, tableaux, col):
+        column = tableaux.table[1:, col]
+        positive = column > t.eps
+        quotients = np.full(len(column), np.inf)
+        quotients[positive] = tableaux.table[1:, -1][positive] / column[positive]
+        # the quotients differing only by the round-off are ties as well, otherwise the rule could cycle
+        candidates = np.flatnonzero(quotients <= quotients.min() + t.eps)
+        basis = tableaux.basis
+        return 1 + min(candidates, key=lambda row: basis[row] if basis[row] >= 0 else np.inf)
+
+
+class DevexPricing(PricingRule):
+    """
+        The Devex rule, an approximation of the steepest edge rule:
+        the cost factors are scaled by the reference weights that are updated after every pivot using only the pivot row.
+
+        Attributes
+        ----------
+        weights : numpy.Array
+            reference weight of every column
+    """
+
+    def reset(self, tableaux):
+        self.weights = np.ones(tableaux.columns_n())
+
+    def choose_entering_variable(self, tableaux):
+        return _best_scaled_candidate(tableaux.cost_factors(), self.weights)
+
+    def update(self, tableaux, row, col):
+        pivot_row = tableaux.table[row, :-1]
+        ratios = pivot_row / pivot_row[col]
+        entering_weight = self.weights[col]
+        np.maximum(self.weights, ratios ** 2 * entering_weight, out=self.weights)
+        leaving = tableaux.basis[row - 1]
+        if leaving >= 0:
+            self.weights[leaving] = max(entering_weight / pivot_row[col] ** 2, 1.0)
+
+
+class SteepestEdgePricing(PricingRule):
+    """
+        The steepest edge rule, the cost factors are scaled by the norms of the corresponding edge directions: (1 + ||column||^2).
+        The norms are computed once per phase and then updated after each pivot with the exact (Goldfarb-Reid) recurrence,
+        which costs a single product of the pivot column with the tableaux.
+
+        Attributes
+        ----------
+        weights : numpy.Array
+            squared norm of the edge direction of every column
+    """
+
+    def reset(self, tableaux):
+        self.weights = 1.0 + (tableaux.table[1:, :-1] ** 2).sum(axis=0)
+
+    def choose_entering_variable(self, tableaux):
+        return _best_scaled_candidate(tableaux.cost_factors(), self.weights)
+
+    def update(self, tableaux, row, col):
+        constraints = tableaux.table[1:, :-1]
+        pivot_column = constraints[:, col]
+        pivot_row = constraints[row - 1]
+        ratios = pivot_row / pivot_row[col]
+        products = pivot_column @ constraints - pivot_row
+        entering_weight = self.weights[col] - 2.0 * pivot_row[col]
+        self.weights += ratios * (ratios * entering_weight - 2.0 * products)
+        np.maximum(self.weights, 1.0, out=self.weights)
+
+
+class PartialPricing(PricingRule):
+    """
+        The partial (and multiple) pricing for the wide problems.
+        Instead of the whole cost row, only a block of columns is priced, the blocks are scanned in a round-robin fashion
+        until a block with attractive columns is found. The best of them enters the basis
+        and the next best ones are kept on a short candidate list. Following iterations re-price only the candidates,
+        until none of them is attractive anymore, and only then the next block is scanned.
+        The optimality is proven only by the (rare) scan finding no attractive column in any block.
+
+        Attributes
+        ----------
+        block_size : int
+            number of columns priced at once during a scan
+        candidates_n : int
+            how many attractive columns found by a scan are kept (together with the entering one)
+        candidates : numpy.Array
+            indexes of the candidate columns for the next iterations
+    """
+
+    def __init__(self, block_size = 128, candidates_n = 8):
+        self.block_size = block_size
+        self.candidates_n = candidates_n
+
+    def reset(self, tableaux):
+        self.next_block = 0
+        self.candidates = np.empty(0, dtype=int)
+
+    def choose_entering_variable(self, tableaux):
+        if len(self.candidates) > 0:
+            cost_factors = tableaux.cost_factors(self.candidates)
+            attractive = cost_factors < -t.eps
+            self.candidates = self.candidates[attractive]
+            if len(self.candidates) > 0:
+                best = np.argmin(cost_factors[attractive])
+                col = self.candidates[best]
+                self.candidates = np.delete(self.candidates, best)
+                return col
+        return self._scan(tableaux)
+
+    def _scan(self, tableaux):
+        cols_n = tableaux.columns_n()
+        block_size = min(self.block_size, cols_n)
+        for _ in range(math.ceil(cols_n / block_size)):
+            cols = (self.next_block + np.arange(block_size)) % cols_n
+            self.next_block = (self.next_block + block_size) % cols_n
+
+            cost_factors = tableaux.cost_factors(cols)
+            attractive = np.flatnonzero(cost_factors < -t.eps)
+            if len(attractive) > 0:
+                best = attractive[np.argsort(cost_factors[attractive], kind='stable')[:self.candidates_n + 1]]
+                self.candidates = cols[best[1:]]
+                return cols[best[0]]
+        return None
+
+
+def _best_scaled_candidate(cost_factors, weights):
+    candidates = cost_factors < -t.eps
+    scores = np.where(candidates, cost_factors ** 2 / weights, -1.0)
+    col = np.argmax(scores)
+    return col if candidates[col] else None
@@ -0,0 +1,336 @@
+import numpy as np
+import time
+
+from . import solver as sv
+from . import solution as s
+from . import tableaux as t
+from . import pricing as p
+from .factorization import BasisFactorization
+from .sparse import CSCMatrix
+
+
+class RevisedSolver(sv.Solver):
+    """
+        A class to represent a revised simplex solver.
+        Instead of updating the whole tableaux it keeps only a factorized basis (see BasisFactorization),
+        prices the columns with a single btran and computes the entering column with a single ftran.
+        The reduced costs are computed only for the columns requested by the pricing rule,
+        so with PartialPricing every iteration touches only a block of columns.
+        Rules that need the whole tableaux (Devex, steepest edge) are supported only by the tableaux Solver.
+        With BlandPricing the ties in the ratio test are broken by the smallest index of the leaving variable,
+        and like in the tableaux Solver, the Bland's rule takes over after degenerate_pivots_limit degenerate pivots in a row.
+        The constraint matrix is stored as a sparse CSCMatrix built from the compiled model (see Model.compile),
+        so apart from the (dense) basis factorization the memory scales with the number of nonzero factors.
+        By default (keep_tableaux=False) no dense tableaux is built during the solve: the solution keeps only the final basis
+        and builds the tableaux from it on the first access (e.g. by the sensitivity analysis), the initial one isn't built at all.
+        With keep_tableaux=True both are built when the solve ends, each one a dense (rows + 1) x (columns + 1) table.
+
+        Attributes
+        ----------
+        pricing : PricingRule
+            strategy choosing the entering variables, DantzigPricing, BlandPricing or PartialPricing
+        refactorization_frequency : int
+            how many basis changes are stored in the product form before the basis is factorized again
+
+        Methods
+        -------
+        __init__(pricing: PricingRule = DantzigPricing(), refactorization_frequency: int = 64, presolver: Presolver | None = None, statistics: bool = False, hooks: list[Callable] | None = None, formulation: Formulation = Formulation.PRIMAL, limits: SolveLimits | None = None, keep_tableaux: bool = False) -> RevisedSolver:
+            constructs a new solver, the pricing time includes the btran, the ratio test time the ftran of the entering column
+        solve(model: Model) -> Solution:
+            solves the given model and return the first solution
+    """
+
+    def __init__(self, pricing = None, refactorization_frequency = 64, presolver = None, statistics = False, hooks = None, formulation = sv.Formulation.PRIMAL, limits = None, keep_tableaux = False):
+        super().__init__(pricing, presolver=presolver, statistics=statistics, hooks=hooks, formulation=formulation, limits=limits, keep_tableaux=keep_tableaux)
+        if isinstance(self.pricing, (p.DevexPricing, p.SteepestEdgePricing)):
+            raise Exception("Revised solver doesn't support pricing rules requiring the whole tableaux")
+        self.refactorization_frequency = refactorization_frequency
+
+    def _solve(self, model):
+        normal_model = self._normalize_model(model)
+        self._create_matrices(normal_model)
+
+        if len(self.artificial_columns) > 0:
+            cost = np.zeros(self.A.shape[1])
+            cost[self.artificial_columns] = -1.0
+            self._phase = "phase one"
+            self._optimize(cost, np.ones(len(cost), dtype=bool))
+            if self.x[np.isin(self.basis, self.artificial_columns)].sum() > t.eps:
+                tableaux = self._final_tableaux(normal_model)
+                return self._with_basis(s.Solution.unfeasible(model, tableaux, tableaux, normal_model))
+            self._drive_out_artificial_variables()
+
+        entering_allowed = np.ones(len(self.c), dtype=bool)
+        entering_allowed[self.artificial_columns] = False
+
+        initial_tableaux = self._create_tableaux(normal_model, self.c) if self.keep_tableaux else None
+        self._phase = "phase two"
+        if self._optimize(self.c, entering_allowed) == False:
+            tableaux = self._final_tableaux(normal_model)
+            return self._with_basis(s.Solution.unbounded(model, initial_tableaux, tableaux, normal_model))
+
+        tableaux = self._final_tableaux(normal_model)
+        assignment = self._extract_assignment()
+        return self._with_basis(self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model))
+
+    def _interrupted_solution(self, model, status):
+        """
+            _interrupted_solution(model: Model, status: Status) -> Solution:
+                returns the solution with the tableaux of the current basis, with its assignment in the second phase
+                (the basic solution stays feasible there)
+        """
+        tableaux = self._final_tableaux(self._normal_model)
+        assignment = self._project_assignment(self._extract_assignment(), model) if self._phase == "phase two" else None
+        return self._with_basis(s.Solution.interrupted(model, status, assignment, None, tableaux, self._normal_model))
+
+    def _final_tableaux(self, normal_model):
+        """
+            _final_tableaux(normal_model: Model) -> Tableaux | None:
+                returns the full tableaux of the current basis if the tableaux are kept, otherwise None (see _with_basis)
+        """
+        return self._create_tableaux(normal_model, self.c) if self.keep_tableaux else None
+
+    def _with_basis(self, solution):
+        """
+            _with_basis(solution: Solution) -> Solution:
+                gives the solution without the tableaux the current basis (and the variables at their upper bounds),
+                so it builds the tableaux on the first access
+        """
+        if not self.keep_tableaux:
+            at_upper = np.flatnonzero(self.at_upper[:self.columns_n])
+            solution.defer_tableaux(np.where(self.basis < self.columns_n, self.basis, -1), at_upper)
+        return solution
+
+    def _estimated_cost(self, rows_n, cols_n, nonzeros_n, artificial_n):
+        """
+            _estimated_cost(rows_n: int, cols_n: int, nonzeros_n: int, artificial_n: int) -> float:
+                returns a rough cost of solving a normalized model of the given size: about one iteration per row
+                (and per artificial variable), every iteration works with the dense basis and prices the nonzero factors
+        """
+        return float(rows_n + artificial_n) * (rows_n ** 2 + nonzeros_n + cols_n + artificial_n)
+
+    def _create_matrices(self, normal_model):
+        """
+            _create_matrices(normal_model: Model):
+                builds the constraint matrix extended with artificial columns, the starting basis and its factorization
+        """
+        rows_n = len(normal_model.constraints)
+        self.columns_n = len(normal_model.variables)
+
+        slack_rows = {row: var.index for (var, row) in self.slack_variables.items()}
+        artificial_rows = [row for row in range(rows_n) if row not in slack_rows]
+        self.artificial_columns = np.arange(self.columns_n, self.columns_n + len(artificial_rows))
+
+        compiled = normal_model.compile()
+        artificial = CSCMatrix.from_triplets((rows_n, len(artificial_rows)), artificial_rows, range(len(artificial_rows)), np.ones(len(artificial_rows)))
+        self.A = compiled.sparse_A.hstack(artificial)
+
+        self.b = compiled.b.copy()
+        self.c = np.zeros(self.A.shape[1])
+        self.c[:self.columns_n] = compiled.c
+
+        # the variables are already shifted by their lower bounds (see Solver._shift_by_lower_bounds)
+        self.lower = compiled.lower_bounds
+        self.upper = np.full(self.A.shape[1], np.inf)
+        self.upper[:self.columns_n] = compiled.upper_bounds - compiled.lower_bounds
+        self.at_upper = np.zeros(self.A.shape[1], dtype=bool)
+
+        self.basis = np.empty(rows_n, dtype=int)
+        for (row, col) in slack_rows.items():
+            self.basis[row] = col
+        self.basis[artificial_rows] = self.artificial_columns
+        self.x = self.b.copy()
+        self.factorization = BasisFactorization(self.A.columns(self.basis), self.refactorization_frequency)
+
+    def _optimize(self, cost, entering_allowed):
+        """
+            _optimize(cost: numpy.Array, entering_allowed: numpy.Array) -> bool:
+                maximizes the given cost starting from the current basis, only the columns marked in entering_allowed can enter it
+                returns False if the problem is unbounded
+        """
+        prices = _Prices(self.A, cost, entering_allowed, self.at_upper)
+        pricing = self.pricing
+        pricing.reset(prices)
+        degenerate_pivots = 0
+        instrumented = self._is_instrumented()
+
+        while True:
+            self._check_limits()
+            if self.factorization.needs_refactorization():
+                self.factorization.refactorize(self.A.columns(self.basis))
+
+            started = time.perf_counter() if instrumented else 0.0
+            prices.duals = self.factorization.btran(cost[self.basis])
+            col = pricing.choose_entering_variable(prices)
+            if col == None:
+                return True
+            priced = time.perf_counter() if instrumented else 0.0
+
+            column = self.factorization.ftran(self.A.column(col))
+            # a variable at its upper bound enters by decreasing
+            direction = -1.0 if self.at_upper[col] else 1.0
+            row, step = self._ratio_test(direction * column, self.upper[col], isinstance(pricing, p.BlandPricing))
+            if step == np.inf:
+                return False
+            tested = time.perf_counter() if instrumented else 0.0
+            if row == None:
+                self.x -= step * direction * column
+                self.at_upper[col] = not self.at_upper[col]
+            else:
+                leaving = self.basis[row]
+                self._change_basis(row, col, column, step, direction)
+            if instrumented:
+                self._record(col, None if row == None else leaving, row, step, self._objective(cost), step <= t.eps, row == None, (started, priced, tested))
+
+            # like in the tableaux solver, the Bland's rule takes over when the pivots stall (the bound flips don't count)
+            if row != None:
+                degenerate_pivots = degenerate_pivots + 1 if step <= t.eps else 0
+            if degenerate_pivots > self.degenerate_pivots_limit and not isinstance(pricing, p.BlandPricing):
+                pricing = p.BlandPricing()
+                pricing.reset(prices)
+
+    def _ratio_test(self, change, entering_upper, smallest_index = False):
+        """
+            _ratio_test(change: numpy.Array, entering_upper: float, smallest_index: bool = False) -> (int | None, float):
+                returns the leaving row and the step of the entering variable, when the basic values change by (-step * change),
+                row is None if the entering variable reaches its own upper bound first or the step is unbounded (inf),
+                ties are broken by the smallest index of the leaving variable if smallest_index is set (the Bland's rule)
+        """
+        upper = self.upper[self.basis]
+        quotients = np.full(len(change), np.inf)
+        decreasing = change > t.eps
+        increasing = (change < -t.eps) & np.isfinite(upper)
+        quotients[decreasing] = self.x[decreasing] / change[decreasing]
+        quotients[increasing] = (upper[increasing] - self.x[increasing]) / -change[increasing]
+        # ties are broken by taking the last row with the minimal quotient, like in the tableaux
+        row = len(quotients) - 1 - np.argmin(quotients[::-1])
+        if smallest_index and quotients[row] < np.inf:
+            ties = np.flatnonzero(quotients <= quotients[row] + t.eps)
+            row = ties[np.argmin(self.basis[ties])]
+        if entering_upper <= quotients[row]:
+            return (None, entering_upper)
+        return (row, quotients[row])
+
+    def _change_basis(self, row, col, column, step = None, direction = 1.0):
+        if step == None:
+            step = self.x[row] / column[row]
+        leaving = self.basis[row]
+        # the leaving variable increased to its upper bound, if its value was moving up
+        self.at_upper[leaving] = direction * column[row] < 0 and np.isfinite(self.upper[leaving])
+        entering_value = self.upper[col] - step if self.at_upper[col] else step
+        self.at_upper[col] = False
+
+        self.x -= step * direction * column
+        self.x[row] = entering_value
+        self.basis[row] = col
+        self.factorization.update(row, column)
+        self.iterations += 1
+
+    def _drive_out_artificial_variables(self):
+        """
+            _drive_out_artificial_variables():
+                replaces artificial variables left in the basis (on the zero level) with structural ones,
+                the artificial variables that can't be replaced correspond to the redundant constraints
+        """
+        for row in np.flatnonzero(np.isin(self.basis, self.artificial_columns)):
+            unit = np.zeros(len(self.basis))
+            unit[row] = 1.0
+            tableaux_row = self.A.rmatvec(self.factorization.btran(unit))[:self.columns_n]
+            tableaux_row[self.basis[self.basis < self.columns_n]] = 0.0
+            candidates = np.flatnonzero(np.abs(tableaux_row) > t.eps)
+            if len(candidates) == 0:
+                continue
+            col = candidates[0]
+            self.x[row] = 0.0
+            self._change_basis(row, col, self.factorization.ftran(self.A.column(col)), 0.0)
+
+    def _objective(self, cost):
+        """
+            _objective(cost: numpy.Array) -> float:
+                returns the given objective at the current basic solution (used only by the statistics)
+        """
+        at_upper = np.flatnonzero(self.at_upper)
+        return cost[self.basis] @ self.x + cost[at_upper] @ self.upper[at_upper] + cost[:self.columns_n] @ self.lower
+
+    def _extract_assignment(self):
+        assignment = np.where(self.at_upper, self.upper, 0.0)
+        assignment[self.basis] = self.x
+        return list(assignment[:self.columns_n] + self.lower)
+
+    def _create_tableaux(self, normal_model, cost):
+        """
+            _create_tableaux(normal_model: Model, cost: numpy.Array) -> Tableaux:
+                builds the full tableaux (without artificial columns) corresponding to the current basis
+        """
+        self.factorization.refactorize(self.A.columns(self.basis))
+        rows_n = len(self.basis)
+        at_upper = np.flatnonzero(self.at_upper)
+        b = self.b - self.A.matvec(np.where(self.at_upper, self.upper, 0.0))
+        columns = self.factorization.ftran(np.column_stack([self.A.columns(np.arange(self.columns_n)), b]))
+        duals = self.factorization.btran(cost[self.basis])
+
+        table = np.empty((rows_n + 1, self.columns_n + 1))
+        table[1:] = columns
+        table[0, :-1] = self.A.rmatvec(duals)[:self.columns_n] - cost[:self.columns_n]
+        table[0, -1] = duals @ b + cost[at_upper] @ self.upper[at_upper] + cost[:self.columns_n] @ self.lower
+
+        structural_rows = np.flatnonzero(self.basis < self.columns_n)
+        structural_basis = self.basis[structural_rows]
+        table[:, structural_basis] = 0.0
+        table[structural_rows + 1, structural_basis] = 1.0
+        basis = np.where(self.basis < self.columns_n, self.basis, -1)
+        tableaux = t.Tableaux(normal_model, table, basis)
+        tableaux.lower_bounds[:] = self.lower
+        tableaux.upper_bounds[:] = self.upper[:self.columns_n]
+        # the columns of the variables at their upper bounds represent (upper - x), like in the tableaux solver
+        for col in at_upper[at_upper < self.columns_n]:
+            tableaux.table[:, col] *= -1
+            tableaux.complemented[col] = True
+        return tableaux
+
+
+class _Prices:
+    """
+        Reduced costs of the revised solver exposed like the cost row of a tableaux (negative = attractive),
+        so the pricing rules can be shared. Factors of the variables at their upper bounds are negated, like complemented columns. The factors are computed only when requested, for the requested columns.
+        The factors of all the columns are computed once per iteration, i.e. until the duals are set again.
+    """
+
+    def __init__(self, A, cost, entering_allowed, at_upper):
+        self.A = A
+        self.cost = cost
+        self.entering_allowed = entering_allowed
+        self.at_upper = at_upper
+        self.duals = None
+
+    @property
+    def duals(self):
+        return self._duals
+
+    @duals.setter
+    def duals(self, duals):
+        self._duals = duals
+        self._factors = None
+
+    def columns_n(self):
+        return len(self.cost)
+
+    def is_optimal(self):
+        return self.cost_factors().min() >= -t.eps
+
+    def choose_entering_variable(self):
+        return self.cost_factors().argmin()
+
+    def cost_factors(self, cols = None):
+        if cols is None:
+            if self._factors is None:
+                factors = self.A.rmatvec(self.duals) - self.cost
+                factors[self.at_upper] *= -1
+                factors[~self.entering_allowed] = 0.0
+                self._factors = factors
+            factors = self._factors
+        else:
+            factors = self.A.rmatvec(self.duals, cols) - self.cost[cols]
+            factors[self.at_upper[cols]] *= -1
+            factors[~self.entering_allowed[cols]] = 0.0
+        return factors
@@ -0,0 +1,220 @@
+import numpy as np
+
+from . import solver as sv
+from . import dual_solver as dsv
+from . import tableaux as t
+from .expressions import constraint as c
+from .expressions import objective as o
+
+
+class ScenarioResults:
+    """
+        A class to represent solutions of a batch of scenarios (one row per scenario).
+
+        Attributes
+        ----------
+        assignments : numpy.Array
+            2d-array with the values of the model variables, rows of the unfeasible / unbounded scenarios are filled with nan
+        objective_values : numpy.Array
+            objective value of every scenario (nan if there is no solution)
+        is_feasible : numpy.Array
+            whether the scenario is feasible
+        is_bounded : numpy.Array
+            whether the scenario is bounded
+        reoptimized : numpy.Array
+            whether the final basis had to be changed for the scenario (i.e. some pivots were needed)
+
+        Methods
+        -------
+        scenarios_n() -> int:
+            returns number of the scenarios
+    """
+
+    def __init__(self, scenarios_n, variables_n):
+        self.assignments = np.full((scenarios_n, variables_n), np.nan)
+        self.objective_values = np.full(scenarios_n, np.nan)
+        self.is_feasible = np.ones(scenarios_n, dtype=bool)
+        self.is_bounded = np.ones(scenarios_n, dtype=bool)
+        self.reoptimized = np.zeros(scenarios_n, dtype=bool)
+
+    def scenarios_n(self):
+        return len(self.objective_values)
+
+
+class ScenarioSolver:
+    """
+        A class to solve many variants of the same model, differing only in the bounds of the constraints or in the objective factors.
+        It starts from the final basis of an optimal solution: all the scenarios are checked against it in a single vectorized pass
+        (one linear solve for all the new bounds, one matrix product for all the new objectives),
+        only the scenarios for which the basis stops being feasible (new bounds) or optimal (new objective) are reoptimized,
+        with the dual simplex or the primal one respectively, starting from a copy of the final tableaux.
+
+        Attributes
+        ----------
+        solution : Solution
+            optimal solution of the model, its tableaux is reused by all the scenarios,
+            so it can't be a solution reduced by the presolve (see Solution.is_reduced)
+        B : numpy.Array
+            basis matrix in the rows of the original constraints (without the sign changes of the normal form)
+        nonbasic_activity : numpy.Array
+            part of every constraint's left side coming from the nonbasic variables (fixed at their bounds)
+        iterations : int
+            number of pivots made by the reoptimizations during the last call
+
+        Methods
+        -------
+        __init__(solution: Solution) -> ScenarioSolver:
+            prepares the basis of the given solution
+        basic_bounds() -> (numpy.Array, numpy.Array):
+            returns the lower and upper bounds of the basic variables (rows without a basic variable have to stay at zero)
+        shadow_prices() -> numpy.Array:
+            returns c_B B^-1, i.e. change of the objective (in the model's direction) per unit added to the bound of every constraint
+        solve_bounds(bounds: numpy.Array) -> ScenarioResults:
+            solves the model for every row of the given 2d-array with the new bounds of the constraints (in the model's order)
+        solve_objectives(factors: numpy.Array) -> ScenarioResults:
+            solves the model for every row of the given 2d-array with the new objective factors (in the model's direction)
+    """
+
+    def __init__(self, solution):
+        if solution.assignment == None or solution.tableaux == None:
+            raise Exception("Scenarios can be solved only starting from an optimal solution with a tableaux")
+        if solution.is_reduced():
+            raise Exception("Scenarios can't be solved from a presolved solution, its tableaux refers to the reduced model")
+
+        self.solution = solution
+        self.iterations = 0
+        compiled = solution.model.compile()
+        self.A = compiled.A
+        self.sense = compiled.sense
+        self.objective_factors = compiled.c
+        self.variables_n = compiled.shape[1]
+
+        tableaux = solution.tableaux
+        self.basis = tableaux.basis
+        self.basic_rows = np.flatnonzero(self.basis >= 0)
+        self.x = np.asarray(solution.assignment, dtype=float)
+
+        # nonbasic variables stay at their bounds, whatever the constraint bounds are
+        nonbasic = np.ones(self.variables_n, dtype=bool)
+        nonbasic[self.basis[(self.basis >= 0) & (self.basis < self.variables_n)]] = False
+        self.nonbasic_activity = self.A[:, nonbasic] @ self.x[nonbasic]
+        self.B = self._basis_matrix(solution.normal_model.compile().A)
+
+    def _basis_matrix(self, normal_A):
+        """
+            _basis_matrix(normal_A: numpy.Array) -> numpy.Array:
+                returns columns of the basic variables in the original rows (no sign changes of the normal form),
+                slack / surplus column is a (-)unit vector of its constraint, rows without any basic variable get an artificial unit column
+        """
+        rows_n = len(self.basis)
+        B = np.zeros((rows_n, rows_n))
+        for (row, col) in enumerate(self.basis):
+            if col < 0:
+                B[row, row] = 1.0
+            elif col < self.variables_n:
+                B[:, row] = self.A[:, col]
+            else:
+                constraint = np.flatnonzero(normal_A[:, col])[0]
+                B[constraint, row] = -1.0 if self.sense[constraint] == c.ConstraintType.GE.value else 1.0
+        return B
+
+    def basic_bounds(self):
+        tableaux = self.solution.tableaux
+        cols = np.maximum(self.basis, 0)
+        lower = np.where((self.basis >= 0) & (self.basis < self.variables_n), tableaux.lower_bounds[cols], 0.0)
+        upper = np.where(self.basis >= 0, tableaux.upper_bounds[cols] + lower, 0.0)
+        return (lower, upper)
+
+    def shadow_prices(self):
+        # the extra zero at the end is the cost of the rows without any basic variable (basis = -1)
+        costs = np.zeros(self.solution.tableaux.columns_n() + 1)
+        costs[:self.variables_n] = self.objective_factors
+        return np.linalg.solve(self.B.T, costs[self.basis])
+
+    def solve_bounds(self, bounds):
+        self.iterations = 0
+        bounds = np.atleast_2d(np.asarray(bounds, dtype=float))
+        results = ScenarioResults(len(bounds), self.variables_n)
+
+        basic_values = np.linalg.solve(self.B, (bounds - self.nonbasic_activity).T).T
+        assignments = np.repeat(self.x[np.newaxis], len(bounds), axis=0)
+        structural = (self.basis >= 0) & (self.basis < self.variables_n)
+        assignments[:, self.basis[structural]] = basic_values[:, structural]
+
+        lower, upper = self.basic_bounds()
+        infeasible = ((basic_values < lower - t.eps) | (basic_values > upper + t.eps)).any(axis=1)
+
+        feasible = np.flatnonzero(~infeasible)
+        results.assignments[feasible] = assignments[feasible]
+        for scenario in np.flatnonzero(infeasible):
+            results.reoptimized[scenario] = True
+            self._reoptimize_bounds(results, scenario, basic_values[scenario] - lower)
+
+        solved = results.is_feasible & results.is_bounded
+        results.objective_values[solved] = results.assignments[solved] @ self.objective_factors
+        return results
+
+    def _reoptimize_bounds(self, results, scenario, values):
+        """
+            _reoptimize_bounds(results: ScenarioResults, scenario: int, values: numpy.Array):
+                the final tableaux with the new basic values (relative to the lower bounds) is still dual feasible,
+                so the dual simplex restores the primal feasibility
+        """
+        tableaux = self.solution.tableaux.copy()
+        complemented = tableaux.complemented[np.maximum(self.basis, 0)] & (self.basis >= 0)
+        values = np.where(complemented, tableaux.upper_bounds[np.maximum(self.basis, 0)] - values, values)
+        if (np.abs(values[self.basis < 0]) > t.eps).any():
+            # redundant constraints are no longer consistent with the other ones
+            results.is_feasible[scenario] = False
+            return
+
+        tableaux.table[1:, -1] = values
+        solver = dsv.DualSimplexSolver()
+        if not solver.optimize(tableaux):
+            results.is_feasible[scenario] = False
+        else:
+            results.assignments[scenario] = tableaux.extract_assignment()[:self.variables_n]
+        self.iterations += solver.iterations
+
+    def solve_objectives(self, factors):
+        self.iterations = 0
+        factors = np.atleast_2d(np.asarray(factors, dtype=float))
+        if self.solution.model.objective.type == o.ObjectiveType.MIN:
+            factors = -factors
+        results = ScenarioResults(len(factors), self.variables_n)
+
+        tableaux = self.solution.tableaux
+        costs = np.zeros((len(factors), tableaux.columns_n()))
+        costs[:, :self.variables_n] = factors
+        costs[:, tableaux.complemented] *= -1
+
+        # cost row of the final tableaux for every scenario at once
+        basic_costs = costs[:, self.basis[self.basic_rows]]
+        cost_rows = basic_costs @ tableaux.table[self.basic_rows + 1, :-1] - costs
+        optimal = (cost_rows >= -t.eps).all(axis=1)
+
+        results.assignments[optimal] = self.x
+        for scenario in np.flatnonzero(~optimal):
+            results.reoptimized[scenario] = True
+            self._reoptimize_objective(results, scenario, cost_rows[scenario])
+
+        solved = results.is_feasible & results.is_bounded
+        results.objective_values[solved] = (results.assignments[solved] * factors[solved]).sum(axis=1)
+        if self.solution.model.objective.type == o.ObjectiveType.MIN:
+            results.objective_values *= -1
+        return results
+
+    def _reoptimize_objective(self, results, scenario, cost_row):
+        """
+            _reoptimize_objective(results: ScenarioResults, scenario: int, cost_row: numpy.Array):
+                the final tableaux with the new cost row is still primal feasible,
+                so the primal simplex restores the optimality
+        """
+        tableaux = self.solution.tableaux.copy()
+        tableaux.table[0, :-1] = cost_row
+        solver = sv.Solver()
+        if not solver._optimize(tableaux):
+            results.is_bounded[scenario] = False
+        else:
+            results.assignments[scenario] = tableaux.extract_assignment()[:self.variables_n]
+        self.iterations += solver.iterations
@@ -1,3 +1,27 @@
+import copy
+import enum
+import numpy as np
+
+from . import compiled as cm
+
+
+class Status(enum.Enum):
+    """
+        An enum to represent how the solve has ended:
+        - OPTIMAL = the assignment is optimal
+        - UNFEASIBLE = the model has no feasible solution
+        - UNBOUNDED = the objective can grow without any limit
+        - TIME_LIMIT, ITERATION_LIMIT, CANCELLED = the solve has been interrupted (see SolveLimits in saport.simplex.limits),
+          the solution keeps the basis reached so far
+    """
+    OPTIMAL = 0
+    UNFEASIBLE = 1
+    UNBOUNDED = 2
+    TIME_LIMIT = 3
+    ITERATION_LIMIT = 4
+    CANCELLED = 5
+
+
 class Solution:
     """
         A class to represent a solution to linear programming problem.
@@ -11,15 +35,32 @@ class Solution:
             list with the values assigned to the variables if solution is feasible and bounded, otherwise None
             order of values should correspond to the order of variables in model.variables list
         initial_tableaux: Tableaux
-            a simplex tableaux corresponding to the first base solution
+            a simplex tableaux corresponding to the first base solution, None if the tableaux aren't kept
         tableaux: Tableaux
-            a simplex tableaux corresponding to the solution 
+            a simplex tableaux corresponding to the solution,
+            if it has been released (see release_tableaux), it's rebuilt from the normal model and the basis on the first access
         normal_model: Model
-            normal model with slack and surplus variables
+            normal model with slack and surplus variables, if it has been released with the tableaux, it's rebuilt on the first access
+        basis: numpy.Array | None
+            indexes of the basic variables of the solution's tableaux (-1 for a row without one), None if there is no tableaux
         is_feasible: bool
             whether the problem is feasible
         is_bounded: bool
             whether the problem is bounded
+        statistics: SolveStatistics | None
+            statistics of the solve, if the solver has been asked to collect them
+        dual_solution: Solution | None
+            solution of the dual model, if it has been solved instead of the model (see Formulation in saport.simplex.solver),
+            then the tableaux and normal model of the solution are None
+        interruption: Status | None
+            why the solve has been interrupted (TIME_LIMIT, ITERATION_LIMIT or CANCELLED), None if it has finished,
+            the interrupted solution has the tableaux of the last basis, the assignment only if that basis is feasible
+            (e.g. reached in the second phase), it's neither optimal, nor proven unfeasible or unbounded
+        status: Status
+            how the solve has ended
+        presolve_report: PresolveReport | None
+            summary of the presolve, if the model has been reduced before the simplex (see Solver.presolver),
+            then the tableaux and the normal model are of the reduced model, not of the model of the solution
 
 
         Methods
@@ -33,6 +74,28 @@ class Solution:
             returns a value of the objective function if the model is feasible and bounded, otherwise None
         has_assignment() -> bool:
             helper method returning info if the model is feasible and bounded, only then there is an assignment available
+        is_interrupted() -> bool:
+            checks whether the solve has been stopped by a limit or cancelled
+        is_reduced() -> bool:
+            checks whether the presolve has removed any constraints or variables, i.e. the tableaux and the normal model
+            don't describe the model of the solution
+        release_tableaux():
+            drops the tableaux (the initial one for good) and the normal model, keeping only the basis, the variables
+            at their upper bounds and the compiled normal model (its sparse factors), so both can be rebuilt when needed,
+            the first phase tableaux (of the unfeasible or interrupted solutions) can't be rebuilt, they're dropped for good,
+            the compiled normal model isn't recomputed from the model of the solution, because it may be of another model
+            (e.g. reduced by the presolver), so the released solution still takes memory proportional to the nonzero factors
+            (about 24 bytes per factor and 8 per constraint and column), instead of the dense tables
+        defer_tableaux(basis: numpy.Array, complemented: numpy.Array):
+            sets the basis of the solution without its tableaux (e.g. the revised solver doesn't build it), with the given columns
+            at their upper bounds, the tableaux is built from the normal model and the basis on the first access
+        keeps_tableaux() -> bool:
+            checks whether the tableaux is held by the solution, i.e. reading it won't rebuild it
+        for_permuted_constraints(model: Model, rows: numpy.Array) -> Solution:
+            returns a shallow copy of the solution for the model having the constraints of the solved one in another order
+            (its i-th constraint is the rows[i]-th one of the solved model), the basis is permuted and the tableaux is rebuilt
+            from it on the first access, the initial tableaux and the dual solution are dropped, as well as the tableaux
+            that can't be rebuilt (e.g. of the first phase or of the model reduced by the presolve)
     """
 
     def __init__(self, model, assignment, initial_tableaux, tableaux, normal_model, is_feasible, is_bounded):
@@ -41,8 +104,102 @@ class Solution:
         self.is_feasible = is_feasible
         self.is_bounded = is_bounded
         self.assignment = assignment
+        self.basis = None if tableaux == None else np.array(tableaux.basis)
         self.tableaux = tableaux
         self.initial_tableaux = initial_tableaux
+        self._complemented = None
+        self._normal_compiled = None
+        self.statistics = None
+        self.dual_solution = None
+        self.interruption = None
+        self.presolve_report = None
+
+    @property
+    def tableaux(self):
+        if self._tableaux == None and self._complemented is not None:
+            # imported here, the solvers create the solutions
+            from .solver import Solver
+            self._tableaux = Solver()._tableaux_from_basis(self.normal_model, self.basis, self._complemented)
+        return self._tableaux
+
+    @tableaux.setter
+    def tableaux(self, tableaux):
+        self._tableaux = tableaux
+
+    @property
+    def normal_model(self):
+        if self._normal_model == None and self._normal_compiled != None:
+            # imported here, the model creates the solutions
+            from .model import Model
+            name, compiled, variable_names = self._normal_compiled
+            self._normal_model = Model.from_compiled(name, compiled, variable_names)
+        return self._normal_model
+
+    @normal_model.setter
+    def normal_model(self, normal_model):
+        self._normal_model = normal_model
+
+    def release_tableaux(self):
+        if self._tableaux != None and self._tableaux.model is self._normal_model:
+            self._complemented = np.flatnonzero(self._tableaux.complemented)
+        self._tableaux = None
+        self.initial_tableaux = None
+        if self._normal_model == None:
+            return
+        # a new compiled model keeps just the sparse factors, without the cached matrices
+        compiled = self._normal_model.compile()
+        compact = cm.CompiledModel(compiled.shape, compiled.rows, compiled.cols, compiled.values, compiled.b, compiled.sense,
+                                   compiled.c, compiled.objective_type, compiled.lower_bounds, compiled.upper_bounds)
+        self._normal_compiled = (self._normal_model.name, compact, [var.name for var in self._normal_model.variables])
+        self._normal_model = None
+
+    def defer_tableaux(self, basis, complemented):
+        self._tableaux = None
+        self.basis = np.array(basis)
+        self._complemented = np.array(complemented, dtype=np.int64)
+
+    def keeps_tableaux(self):
+        return self._tableaux != None
+
+    def for_permuted_constraints(self, model, rows):
+        permuted = copy.copy(self)
+        permuted.model = model
+        permuted.tableaux = None
+        permuted.initial_tableaux = None
+        permuted.normal_model = None
+        permuted.basis = None
+        permuted.dual_solution = None
+        permuted._complemented = None
+        permuted._normal_compiled = None
+        if self.is_reduced():
+            # the columns of the reduced model don't follow the model, they can't be permuted like its own ones
+            return permuted
+        if self._tableaux != None and self._tableaux.model is self._normal_model:
+            normal_compiled, complemented = self._normal_model.compile(), np.flatnonzero(self._tableaux.complemented)
+        elif self._complemented is not None:
+            normal_compiled, complemented = self._normal_compiled[1], self._complemented
+        else:
+            return permuted
+
+        # imported here, the solvers create the solutions
+        from .solver import Solver
+        normal_model = Solver()._normalize_model(model)
+        columns = _permuted_columns(normal_compiled, normal_model.compile(), rows, len(model.variables))
+        basis = self.basis[rows]
+        permuted.normal_model = normal_model
+        permuted.basis = np.where(basis >= 0, columns[basis], -1)
+        permuted._complemented = columns[complemented]
+        return permuted
+
+    @property
+    def status(self):
+        if self.interruption != None:
+            return self.interruption
+        if not self.is_bounded:
+            return Status.UNBOUNDED
+        if not self.is_feasible:
+            return Status.UNFEASIBLE
+        return Status.OPTIMAL
 
     def value(self, var):
         return None if self.assignment == None else self.assignment[var.index]
@@ -53,6 +210,13 @@ class Solution:
     def has_assignment(self):
         return self.assignment == None
 
+    def is_interrupted(self):
+        return self.interruption != None
+
+    def is_reduced(self):
+        report = self.presolve_report
+        return report != None and (report.rows_removed() > 0 or report.columns_removed() > 0)
+
     @staticmethod
     def with_assignment(model, assignment, initial_tableaux, tableaux, normal_model):
         return Solution(model, assignment, initial_tableaux, tableaux, normal_model, True, True)  
@@ -65,8 +229,17 @@ class Solution:
     def unbounded(model, initial_tableaux, tableaux, normal_model):
         return Solution(model, None, initial_tableaux, tableaux, normal_model, True, False)
 
+    @staticmethod
+    def interrupted(model, status, assignment, initial_tableaux, tableaux, normal_model):
+        solution = Solution(model, assignment, initial_tableaux, tableaux, normal_model, True, True)
+        solution.interruption = status
+        return solution
+
     def __str__(self):
 
+        if self.interruption != None and self.assignment == None:
+            return f"The solve has been interrupted ({self.interruption.name}) before any feasible solution was found"
+
         if not self.is_bounded:
             return "There is no optimal solution, the model is unbounded"
         
@@ -74,8 +247,30 @@ class Solution:
             return "There is no solution, the model is unfeasible"
 
         print(self.model.objective)
-        text = f'- objective value: {self.objective_value()}\n'
+        text = '' if self.interruption == None else f'- interrupted ({self.interruption.name}), the solution may be not optimal\n'
+        text += f'- objective value: {self.objective_value()}\n'
         text += '- assignment:'
         for (i,val) in enumerate(self.assignment):
             text += f'\n\t- {self.model.variables[i].name} = {"{:.3f}".format(val)}'
-        return text
\ No newline at end of file
+        return text
+
+
+def _permuted_columns(normal_compiled, permuted_compiled, rows, variables_n):
+    """
+        _permuted_columns(normal_compiled: CompiledModel, permuted_compiled: CompiledModel, rows: numpy.Array, variables_n: int) -> numpy.Array:
+            returns the column of the permuted normal model for every column of the normal model, the variables keep their columns,
+            the slack and surplus ones follow their constraints (the i-th constraint of the permuted one is the rows[i]-th one)
+    """
+    rows_n, cols_n = normal_compiled.shape
+    added = normal_compiled.cols >= variables_n
+    constraint_of = np.zeros(cols_n, dtype=np.int64)
+    constraint_of[normal_compiled.cols[added]] = normal_compiled.rows[added]
+    permuted_added = permuted_compiled.cols >= variables_n
+    column_of = np.zeros(rows_n, dtype=np.int64)
+    column_of[permuted_compiled.rows[permuted_added]] = permuted_compiled.cols[permuted_added]
+    permuted_rows = np.empty(rows_n, dtype=np.int64)
+    permuted_rows[rows] = np.arange(rows_n)
+
+    columns = np.arange(cols_n)
+    columns[variables_n:] = column_of[permuted_rows[constraint_of[variables_n:]]]
+    return columns
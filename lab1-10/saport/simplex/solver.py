@@ -1,26 +1,283 @@
-from copy import deepcopy
+import enum
+from copy import copy
 from os import name
 
 from . import model as m 
+from . import compiled as cm
 from .expressions import objective as o 
 from .expressions import constraint as c
 from .expressions import variable as v
 from . import solution as s 
 from . import tableaux as t
+from . import pricing as p
+from . import presolve as ps
+from . import statistics as st
+from . import limits as lm
 import numpy as np 
+import time
+
+
+class Formulation(enum.Enum):
+    """
+        An enum to represent which formulation of the model is solved:
+        - PRIMAL = the model itself
+        - DUAL = its dual (see Model.dual), the values of the variables are the shadow prices of the dual constraints
+        - AUTO = the dual if its estimated cost is at most half of the primal's, e.g. for a model with many more constraints than variables
+    """
+    PRIMAL = 0
+    DUAL = 1
+    AUTO = 2
 
 
 class Solver:
     """
         A class to represent a simplex solver.
 
+        Attributes
+        ----------
+        pricing : PricingRule
+            strategy choosing the entering variables (see saport.simplex.pricing), Dantzig's rule by default
+        degenerate_pivots_limit : int
+            after that many degenerate pivots in a row, the solver falls back to the Bland's rule to avoid cycling
+        iterations : int
+            number of pivots made during the last solve (both phases)
+        presolver : Presolver | None
+            if given, the model is reduced before the simplex starts (see saport.simplex.presolve),
+            the solution's assignment refers to the original model, but its tableaux and normal model to the reduced one
+            (see Solution.presolve_report)
+        collect_statistics : bool
+            whether the solutions should get the statistics of the solve (see saport.simplex.statistics)
+        hooks : list[Callable[[PivotEvent], None]]
+            functions called after every iteration with its PivotEvent, e.g. JSONLTraceWriter
+        anti_degeneracy : AntiDegeneracy | None
+            if given, the Harris ratio test and bound perturbations are used against stalling (see saport.simplex.degeneracy)
+        statistics : SolveStatistics | None
+            statistics of the last solve, None if they're not collected
+        formulation : Formulation
+            whether the model, its dual or the cheaper of them is solved (the primal by default), the solutions found via the dual
+            have no tableaux of the model (so no sensitivity analysis), the solution of the dual is kept in their dual_solution
+        limits : SolveLimits | None
+            if given, the time, the iterations and the cancellation token checked at every iteration (see saport.simplex.limits),
+            the interrupted solve returns a solution with its interruption status and the last basis, instead of raising
+        crash : TriangularCrash | None
+            if given, the first phase starts from a triangular basis of the structural columns, only the rows it doesn't cover
+            get the artificial variables (see saport.simplex.crash)
+        keep_tableaux : bool
+            whether the solutions keep their tableaux (the default), otherwise the initial tableaux isn't even copied
+            and the final one is released (see Solution.release_tableaux), e.g. for the large batches of solutions,
+            it's rebuilt from the basis if the sensitivity analysis or the reoptimization reads it
+
         Methods
         -------
+        __init__(pricing: PricingRule = DantzigPricing(), degenerate_pivots_limit: int = 50, presolver: Presolver | None = None, statistics: bool = False, hooks: list[Callable] | None = None, anti_degeneracy: AntiDegeneracy | None = None, formulation: Formulation = Formulation.PRIMAL, limits: SolveLimits | None = None, crash: TriangularCrash | None = None, keep_tableaux: bool = True) -> Solver:
+            constructs a new solver using the given pricing rule
+            without the statistics and hooks the iterations aren't timed and no events are created
         solve(model: Model) -> Solution:
             solves the given model and return the first solution
     """
 
+    def __init__(self, pricing = None, degenerate_pivots_limit = 50, presolver = None, statistics = False, hooks = None, anti_degeneracy = None, formulation = Formulation.PRIMAL, limits = None, crash = None, keep_tableaux = True):
+        self.pricing = p.DantzigPricing() if pricing == None else pricing
+        self.degenerate_pivots_limit = degenerate_pivots_limit
+        self.anti_degeneracy = anti_degeneracy
+        self.presolver = presolver
+        self.formulation = formulation
+        self.limits = limits
+        self.crash = crash
+        self.keep_tableaux = keep_tableaux
+        self.collect_statistics = statistics
+        self.hooks = [] if hooks == None else list(hooks)
+        self.statistics = None
+        self.iterations = 0
+        self._phase = "phase two"
+        self._active_tableaux = None
+
     def solve(self, model):
+        return self._solve_with_statistics(self._presolve_and_solve, model)
+
+    def _solve_with_statistics(self, solve, *args):
+        """
+            _solve_with_statistics(solve: Callable[..., Solution], *args) -> Solution:
+                resets the counters, starts the limits, calls the given solving method and attaches the statistics to its solution,
+                releases its tableaux if they aren't kept
+        """
+        self.iterations = 0
+        if self.limits != None:
+            self.limits.start()
+        self.statistics = st.SolveStatistics() if self.collect_statistics else None
+        started = time.perf_counter()
+        solution = solve(*args)
+        if self.statistics != None:
+            self.statistics.solve_time = time.perf_counter() - started
+            solution.statistics = self.statistics
+        if not self.keep_tableaux:
+            solution.release_tableaux()
+            if solution.dual_solution != None:
+                solution.dual_solution.release_tableaux()
+        return solution
+
+    def _presolve_and_solve(self, model):
+        """
+            _presolve_and_solve(model: Model) -> Solution:
+                solves the model, reduced by the presolver (if there is one)
+        """
+        if self.presolver == None:
+            return self._solve_formulation(model)
+
+        reduced_model = self.presolver.presolve(model)
+        if reduced_model == None:
+            postsolved = s.Solution.unfeasible(model, None, None, None)
+        elif len(reduced_model.variables) == 0:
+            postsolved = s.Solution.with_assignment(model, self.presolver.postsolve([]), None, None, reduced_model)
+        elif len(reduced_model.constraints) == 0:
+            # only the unused variables increasing the objective without any upper bound are left
+            postsolved = s.Solution.unbounded(model, None, None, reduced_model)
+        else:
+            solution = self._solve_formulation(reduced_model)
+            if solution.assignment == None:
+                postsolved = s.Solution(model, None, solution.initial_tableaux, solution.tableaux, solution.normal_model, solution.is_feasible, solution.is_bounded)
+            else:
+                assignment = self.presolver.postsolve(solution.assignment)
+                postsolved = s.Solution.with_assignment(model, assignment, solution.initial_tableaux, solution.tableaux, solution.normal_model)
+            postsolved.interruption = solution.interruption
+        postsolved.presolve_report = self.presolver.report
+        return postsolved
+
+    def _solve_formulation(self, model):
+        """
+            _solve_formulation(model: Model) -> Solution:
+                solves the model or its dual, depending on the formulation
+        """
+        if self.formulation == Formulation.PRIMAL or len(model.constraints) == 0:
+            return self._solve_within_limits(model)
+        if self.formulation == Formulation.AUTO:
+            primal_cost, dual_cost = self._formulation_costs(model)
+            # the estimates are rough, the dual (and recovering the assignment) pays off only when it's clearly cheaper
+            if 2 * dual_cost >= primal_cost:
+                return self._solve_within_limits(model)
+        return self._solve_dual(model)
+
+    def _solve_within_limits(self, model):
+        """
+            _solve_within_limits(model: Model) -> Solution:
+                solves the model, if a limit stops the iterations returns the interrupted solution with the last basis
+        """
+        self._active_tableaux = None
+        try:
+            return self._solve(model)
+        except lm.SolveInterrupted as interruption:
+            return self._interrupted_solution(model, interruption.status)
+
+    def _interrupted_solution(self, model, status):
+        """
+            _interrupted_solution(model: Model, status: Status) -> Solution:
+                returns the solution with the tableaux being optimized when the limit has been reached,
+                its assignment is given only for a feasible basis of the second phase (the perturbation of the bounds is removed first)
+        """
+        tableaux = self._active_tableaux
+        if tableaux == None:
+            return s.Solution.interrupted(model, status, None, None, None, None)
+        # the first phase tableaux has the artificial columns, the normal model doesn't
+        normal_model = self._normal_model if self._phase == "phase one" else tableaux.model
+        assignment = None
+        if self._phase == "phase two":
+            if self.anti_degeneracy != None and self.anti_degeneracy.is_modified():
+                self.anti_degeneracy.remove(tableaux)
+            if self._is_primal_feasible(tableaux):
+                assignment = self._project_assignment(tableaux.extract_assignment(), model)
+        return s.Solution.interrupted(model, status, assignment, None, tableaux, normal_model)
+
+    def _is_primal_feasible(self, tableaux):
+        """
+            _is_primal_feasible(tableaux: Tableaux) -> bool:
+                checks whether the basic variables are within their bounds
+        """
+        rows = np.flatnonzero(tableaux.basis >= 0)
+        values = tableaux.table[rows + 1, -1]
+        return bool(np.all(values >= -t.eps) and np.all(values <= tableaux.upper_bounds[tableaux.basis[rows]] + t.eps))
+
+    def _check_limits(self, iterations = None):
+        """
+            _check_limits(iterations: int | None = None):
+                raises SolveInterrupted if any of the limits has been reached, iterations default to the pivots made so far
+        """
+        if self.limits != None:
+            status = self.limits.reached(self.iterations if iterations == None else iterations)
+            if status != None:
+                raise lm.SolveInterrupted(status)
+
+    def _formulation_costs(self, model):
+        """
+            _formulation_costs(model: Model) -> (float, float):
+                returns the estimated costs of solving the model and its dual, based on their shapes, numbers of nonzero factors
+                and numbers of rows needing the artificial variables (see _estimated_cost)
+        """
+        compiled = model.compile()
+        rows_n, cols_n = compiled.shape
+        sense = compiled.sense
+        b = compiled.b - compiled.sparse_A.matvec(compiled.lower_bounds) if compiled.lower_bounds.any() else compiled.b
+        costs = compiled.c * compiled.objective_type.value
+        equalities = sense == c.ConstraintType.EQ.value
+        bounded_n = int(np.isfinite(compiled.upper_bounds).sum())
+        nonzeros_n = len(compiled.values)
+
+        # rows without a feasible slack variable start with the artificial ones (e.g. a x >= b > 0, or a x <= b < 0)
+        primal_artificial_n = int(equalities.sum() + ((sense == c.ConstraintType.LE.value) & (b < 0)).sum()
+                                  + ((sense == c.ConstraintType.GE.value) & (b > 0)).sum())
+        primal_cost = self._estimated_cost(rows_n, cols_n + rows_n - int(equalities.sum()), nonzeros_n, primal_artificial_n)
+
+        # dual: a row per variable (A^T y >= c, with a surplus each), a column per constraint, finite upper bound and equality
+        dual_cols_n = rows_n + bounded_n + int(equalities.sum()) + cols_n
+        dual_nonzeros_n = nonzeros_n + bounded_n + int(equalities[compiled.rows].sum())
+        dual_cost = self._estimated_cost(cols_n, dual_cols_n, dual_nonzeros_n, int((costs > 0).sum()))
+        return (primal_cost, dual_cost)
+
+    def _estimated_cost(self, rows_n, cols_n, nonzeros_n, artificial_n):
+        """
+            _estimated_cost(rows_n: int, cols_n: int, nonzeros_n: int, artificial_n: int) -> float:
+                returns a rough cost of solving a normalized model of the given size: about one pivot per row
+                (and per artificial variable), every pivot updates the whole dense tableaux (with the artificial columns)
+        """
+        return float(rows_n + artificial_n) * (rows_n + 1) * (cols_n + artificial_n + 1)
+
+    def _solve_dual(self, model):
+        """
+            _solve_dual(model: Model) -> Solution:
+                solves the dual of the model (shifted by the lower bounds, the dual needs them at zero),
+                the values of the variables are the shadow prices of the dual constraints, found from the final basis of the dual,
+                an unfeasible dual means that the model is unbounded or unfeasible, so then the model is solved directly
+        """
+        # imported here, the scenarios are built on top of the solvers
+        from .scenarios import ScenarioSolver
+
+        compiled = model.compile()
+        cols_n = compiled.shape[1]
+        lower, upper = compiled.lower_bounds, compiled.upper_bounds
+        primal = model
+        if lower.any():
+            shifted = cm.CompiledModel(compiled.shape, compiled.rows, compiled.cols, compiled.values,
+                                       compiled.b - compiled.sparse_A.matvec(lower), compiled.sense, compiled.c,
+                                       compiled.objective_type, np.zeros(cols_n), upper - lower)
+            primal = m.Model.from_compiled(model.name, shifted, [var.name for var in model.variables])
+
+        dual_solution = self._solve_within_limits(primal.dual())
+        if dual_solution.is_interrupted():
+            # the basis of the dual gives no feasible assignment of the model
+            solution = s.Solution.interrupted(model, dual_solution.interruption, None, None, None, None)
+            solution.dual_solution = dual_solution
+            return solution
+        if not dual_solution.is_feasible:
+            return self._solve_within_limits(model)
+        if not dual_solution.is_bounded:
+            solution = s.Solution.unfeasible(model, None, None, None)
+        else:
+            # round-off of the shadow prices can't move the values outside of the bounds
+            values = np.clip(ScenarioSolver(dual_solution).shadow_prices()[:cols_n], 0.0, upper - lower) + lower
+            solution = s.Solution.with_assignment(model, values.tolist(), None, None, None)
+        solution.dual_solution = dual_solution
+        return solution
+
+    def _solve(self, model):
         normal_model = self._normalize_model(model)
         if len(self.slack_variables) < len(normal_model.constraints):
             tableaux, success = self._presolve(normal_model)
@@ -29,7 +286,8 @@ class Solver:
         else:
             tableaux = self._basic_initial_tableaux(normal_model)
 
-        initial_tableaux = deepcopy(tableaux)
+        initial_tableaux = self._initial_copy(tableaux)
+        self._phase = "phase two"
         if self._optimize(tableaux) == False:
             return s.Solution.unbounded(model, initial_tableaux, tableaux, normal_model)
 
@@ -37,33 +295,147 @@ class Solver:
         return self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model)
 
     def _optimize(self, tableaux):
-        while not tableaux.is_optimal():
-            pivot_col = tableaux.choose_entering_variable()
-            if tableaux.is_unbounded(pivot_col):
-                return False
-            pivot_row = tableaux.choose_leaving_variable(pivot_col)
+        self._active_tableaux = tableaux
+        pricing = self.pricing
+        pricing.reset(tableaux)
+        degenerate_pivots = 0
+        instrumented = self._is_instrumented()
+        guard = self.anti_degeneracy
+        if guard != None:
+            guard.reset(tableaux)
+
+        while True:
+            self._check_limits()
+            started = time.perf_counter() if instrumented else 0.0
+            pivot_col = pricing.choose_entering_variable(tableaux)
+            if pivot_col == None:
+                if guard != None and guard.is_modified():
+                    # optimal for the perturbed bounds, the exact ones are restored and the pricing checks the optimality again
+                    self.iterations += guard.restore(tableaux)
+                    pricing.reset(tableaux)
+                    continue
+                return True
+            priced = time.perf_counter() if instrumented else 0.0
+
+            if guard != None or tableaux.has_upper_bounds():
+                if guard == None:
+                    pivot_row, step = tableaux.bounded_ratio_test(pivot_col, isinstance(pricing, p.BlandPricing))
+                else:
+                    pivot_row, step = guard.ratio_test(tableaux, pivot_col)
+                if step == np.inf:
+                    if guard != None:
+                        guard.remove(tableaux)
+                    return False
+                if pivot_row == None:
+                    # the entering variable reaches its upper bound before any basic one, it's flipped without a pivot
+                    tested = time.perf_counter() if instrumented else 0.0
+                    tableaux.complement(pivot_col)
+                    if instrumented:
+                        self._record(pivot_col, None, None, step, tableaux.table[0, -1], False, True, (started, priced, tested))
+                    continue
+                if tableaux.table[pivot_row, pivot_col] < 0:
+                    # the basic variable leaves the basis at its upper bound
+                    if guard == None:
+                        tableaux.complement_basic(pivot_row)
+                    else:
+                        guard.complement_basic(tableaux, pivot_row)
+            else:
+                if tableaux.is_unbounded(pivot_col):
+                    return False
+                pivot_row = pricing.choose_leaving_variable(tableaux, pivot_col)
+
+            is_degenerate = tableaux.table[pivot_row, -1] <= t.eps
+            degenerate_pivots = degenerate_pivots + 1 if is_degenerate else 0
+            if instrumented:
+                tested = time.perf_counter()
+                leaving = tableaux.basis[pivot_row - 1]
+                step = tableaux.table[pivot_row, -1] / tableaux.table[pivot_row, pivot_col]
+            pricing.update(tableaux, pivot_row, pivot_col)
+            if guard == None:
+                tableaux.pivot(pivot_row, pivot_col)
+            else:
+                guard.pivot(tableaux, pivot_row, pivot_col)
+            self.iterations += 1
+            if instrumented:
+                self._record(pivot_col, leaving, pivot_row - 1, step, tableaux.table[0, -1], is_degenerate, False, (started, priced, tested))
+
+            if guard != None and degenerate_pivots >= guard.degenerate_pivots_trigger:
+                guard.perturb(tableaux)
+                degenerate_pivots = 0
+            if degenerate_pivots > self.degenerate_pivots_limit and not isinstance(pricing, p.BlandPricing):
+                pricing = p.BlandPricing()
+                pricing.reset(tableaux)
+
+    def _initial_copy(self, tableaux):
+        """
+            _initial_copy(tableaux: Tableaux) -> Tableaux | None:
+                returns a copy of the starting tableaux for the solution, None if the tableaux aren't kept
+        """
+        return tableaux.copy() if self.keep_tableaux else None
 
-            tableaux.pivot(pivot_row, pivot_col)
-        return True
+    def _tableaux_from_basis(self, normal_model, basis, complemented):
+        """
+            _tableaux_from_basis(normal_model: Model, basis: numpy.Array, complemented: numpy.Array) -> Tableaux:
+                returns the tableaux of the normal model for the given basis, with the given columns at their upper bounds,
+                the table is expressed in terms of the basis by a single solve, the rows without a basic variable
+                (redundant constraints) are completed with the unit columns
+        """
+        compiled = normal_model.compile()
+        table = self._constraints_table(normal_model)
+        table[0, :-1] = -compiled.c
+        table[0, -1] = compiled.c @ compiled.lower_bounds
+        tableaux = t.Tableaux(normal_model, table, np.array(basis))
+        self._set_bounds(tableaux, normal_model)
+        for col in complemented:
+            tableaux.complement(col)
+
+        rows = np.flatnonzero(tableaux.basis >= 0)
+        cols = tableaux.basis[rows]
+        matrix = np.eye(len(tableaux.basis))
+        matrix[:, rows] = table[1:, cols]
+        table[1:] = np.linalg.solve(matrix, table[1:])
+        table[1:, cols] = 0.0
+        table[rows + 1, cols] = 1.0
+        table[0] -= table[0, cols] @ table[rows + 1]
+        table[0, cols] = 0.0
+        # round-off of the solve, the pivots would leave exact zeros there
+        table[np.abs(table) <= t.eps] = 0.0
+        return tableaux
+
+    def _is_instrumented(self):
+        return self.statistics != None or len(self.hooks) > 0
+
+    def _record(self, entering, leaving, row, step, objective, is_degenerate, is_bound_flip, timestamps):
+        """
+            _record(entering: int, leaving: int | None, row: int | None, step: float, objective: float, is_degenerate: bool, is_bound_flip: bool, timestamps: (float, float, float)):
+                creates the event of the iteration that has just finished and passes it to the statistics and the hooks,
+                timestamps mark the start of the iteration, the end of the pricing and the end of the ratio test
+        """
+        started, priced, tested = timestamps
+        event = st.PivotEvent(self._phase, self.iterations, entering, leaving, row, step, objective, is_degenerate, is_bound_flip,
+                              priced - started, tested - priced, time.perf_counter() - tested)
+        if self.statistics != None:
+            self.statistics.record(event)
+        for hook in self.hooks:
+            hook(event)
 
     def _presolve(self, model):
         """
             _presolve(model: Model) -> Tableaux:
                 returns a initial tableaux for the second phase of simplex
         """
-        presolve_model = self._create_presolve_model(model)
-        tableaux = self._presolve_initial_tableaux(presolve_model)
+        tableaux = self._presolve_initial_tableaux(model)
         
+        self._phase = "phase one"
         self._optimize(tableaux)
 
         if self._artifical_variables_are_positive(tableaux):
             return (tableaux, False)
 
-        basis = tableaux.extract_basis()
-
+        self._drive_out_artificial_variables(tableaux)
         tableaux = self._remove_artificial_variables(tableaux)
         tableaux = self._restore_original_objective_row(tableaux, model)
-        tableaux = self._fix_objective_row_to_the_basis(tableaux, basis)
+        tableaux = self._fix_objective_row_to_the_basis(tableaux)
         return (tableaux, True)
 
     def _normalize_model(self, original_model):
@@ -73,20 +445,44 @@ class Solver:
         """
 
         model = original_model.translate_to_standard_form()
+        self._shift_by_lower_bounds(model)
         self._change_constraints_bounds_to_nonnegative(model)
         self.slack_variables = self._add_slack_variables(model)
         self.surplus_variables = self._add_surplus_variables(model)   
+        self._normal_model = model
         return model
 
-    def _create_presolve_model(self, normalized_model):
-        presolve_model = deepcopy(normalized_model)
-        self.artificial_variables = self._add_artificial_variables(presolve_model)
-        return presolve_model    
+    def _create_presolve_model(self, normalized_model, crashed_rows = ()):
+        """
+            _create_presolve_model(model: Model, crashed_rows: Iterable[int] = ()) -> Model:
+                returns a view of the normal model with the artificial variables appended (used to label the phase one tableaux),
+                the constraints are shared with the normal model, the artificial columns exist only in the tableaux,
+                the rows covered by the crash basis get no artificial variables
+        """
+        presolve_model = copy(normalized_model)
+        presolve_model.variables = list(normalized_model.variables)
+        presolve_model.invalidate()
+        self.artificial_variables = self._add_artificial_variables(presolve_model, crashed_rows)
+        return presolve_model
+
+    def _shift_by_lower_bounds(self, model):
+        """
+            _shift_by_lower_bounds(model: Model):
+                moves the lower bounds of the variables to the constraints, so the tableaux columns represent (x - lower) >= 0,
+                the lower bounds are added back when the assignment is extracted from the tableaux
+        """
+        lower_bounds = model.compile().lower_bounds
+        if not lower_bounds.any():
+            return
+        for constraint in model.constraints:
+            constraint.bound -= float(constraint.expression.evaluate(lower_bounds))
+        model.invalidate()
 
     def _change_constraints_bounds_to_nonnegative(self, model):
         for constraint in model.constraints:
             if constraint.bound < 0:
                 constraint.invert()
+        model.invalidate()
     
     def _add_slack_variables(self, model):
         slack_variables = dict()
@@ -108,60 +504,136 @@ class Solver:
                 constraint.type = c.ConstraintType.EQ
         return surplus_variables 
 
-    def _add_artificial_variables(self, model):
+    def _add_artificial_variables(self, model, crashed_rows = ()):
         artificial_variables = dict()
         for (i,constraint) in enumerate(model.constraints.copy()):
-            if i in self.slack_variables.values():
+            if i in self.slack_variables.values() or i in crashed_rows:
                 continue
             artificial_var = model.create_variable(f"R{i}")
             artificial_variables[artificial_var] = i
-            constraint.expression = constraint.expression + artificial_var
         return artificial_variables
 
     def _presolve_initial_tableaux(self, model):
-        objective_row = np.array([0.0 for _ in model.variables] + [0.0])
-
-        for var in self.artificial_variables.keys():
-            objective_row[var.index] = 1.0
-
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-
-        for constraint_index in self.artificial_variables.values():
-            constraint = model.constraints[constraint_index]
-            factors_row = np.array(constraint.expression.factors(model) + [constraint.bound])
-            objective_row = objective_row - factors_row
-
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-        return t.Tableaux(model, table)
+        crashed = self._crash_basis(model)
+        presolve_model = self._create_presolve_model(model, crashed.keys())
+        artificial_cols = [var.index for var in self.artificial_variables.keys()]
+        artificial_rows = list(self.artificial_variables.values())
+
+        table = self._constraints_table(model, len(artificial_cols))
+        table[np.array(artificial_rows, dtype=int) + 1, artificial_cols] = 1.0
+        basis = self._initial_basis(model, self.artificial_variables)
+        if len(crashed) > 0:
+            basis[list(crashed.keys())] = list(crashed.values())
+            # the crash basis isn't a unit one, the table is expressed in its terms by a single solve
+            table[1:] = np.linalg.solve(table[1:, basis], table[1:])
+            table[1:, basis] = np.eye(len(basis))
+            # round-off of the degenerate basic values, the ratio test needs them exactly zero
+            values = table[1:, -1]
+            values[np.abs(values) <= t.eps] = 0.0
+            artificial_rows = np.flatnonzero(np.isin(basis, artificial_cols))
+        table[0, artificial_cols] = 1.0
+        table[0] -= table[1:][artificial_rows].sum(axis=0)
+        tableaux = t.Tableaux(presolve_model, table, basis)
+        self._set_bounds(tableaux, model)
+        return tableaux
+
+    def _crash_basis(self, model):
+        """
+            _crash_basis(model: Model) -> dict[int, int]:
+                returns the structural columns covering the rows without slack variables (row -> column) found by the crash procedure,
+                empty if there is no crash procedure
+        """
+        if self.crash == None:
+            return dict()
+        compiled = model.compile()
+        slack_rows = set(self.slack_variables.values())
+        rows = [row for row in range(compiled.shape[0]) if row not in slack_rows]
+        return self.crash.find_basis(compiled.A, compiled.b, compiled.upper_bounds - compiled.lower_bounds, rows,
+                                     [var.index for var in self.slack_variables.keys()])
 
     def _basic_initial_tableaux(self, model):
-        objective_row = np.array((-1 * model.objective.expression).factors(model) + [0.0])
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-        return t.Tableaux(model, table)
+        compiled = model.compile()
+        table = self._constraints_table(model)
+        table[0, :-1] = -compiled.c
+        table[0, -1] = compiled.c @ compiled.lower_bounds
+        tableaux = t.Tableaux(model, table, self._initial_basis(model))
+        self._set_bounds(tableaux, model)
+        return tableaux
+
+    def _set_bounds(self, tableaux, model):
+        compiled = model.compile()
+        cols_n = compiled.shape[1]
+        tableaux.lower_bounds[:cols_n] = compiled.lower_bounds
+        tableaux.upper_bounds[:cols_n] = compiled.upper_bounds - compiled.lower_bounds
+
+    def _constraints_table(self, model, extra_cols_n = 0):
+        """
+            _constraints_table(model: Model, extra_cols_n: int = 0) -> numpy.Array:
+                returns a table with the compiled constraints (A | b) in the rows 1.. and zeroed objective row,
+                optionally with zeroed extra columns between A and b
+        """
+        compiled = model.compile()
+        rows_n, cols_n = compiled.shape
+        table = np.zeros((rows_n + 1, cols_n + extra_cols_n + 1))
+        table[1:, :cols_n] = compiled.A
+        table[1:, -1] = compiled.b
+        return table
+
+    def _initial_basis(self, model, artificial_variables = {}):
+        basis = np.full(len(model.constraints), -1)
+        for variables in (self.slack_variables, artificial_variables):
+            for (var, row) in variables.items():
+                basis[row] = var.index
+        return basis
 
     def _artifical_variables_are_positive(self, tableaux):
         assignment = tableaux.extract_assignment()
         for artificial_var in self.artificial_variables:
-            if assignment[artificial_var.index] > 0:
+            if assignment[artificial_var.index] > t.eps:
                 return True 
         return False
 
+    def _drive_out_artificial_variables(self, tableaux):
+        """
+            _drive_out_artificial_variables(tableaux: Tableaux):
+                replaces artificial variables left in the basis (on the zero level) with the other ones using degenerate pivots,
+                otherwise their rows would lose the basic variable and stop constraining the second phase,
+                the artificial variables that can't be replaced correspond to the redundant constraints
+        """
+        artificial_cols = [var.index for var in self.artificial_variables.keys()]
+        first_artificial_col = min(artificial_cols, default=tableaux.columns_n())
+        for row in np.flatnonzero(np.isin(tableaux.basis, artificial_cols)) + 1:
+            candidates = np.flatnonzero(np.abs(tableaux.table[row, :first_artificial_col]) > t.eps)
+            if len(candidates) > 0:
+                tableaux.pivot(row, candidates[0])
+
     def _remove_artificial_variables(self, tableaux):
         columns_to_remove = [var.index for var in self.artificial_variables.keys()]
         table = np.delete(tableaux.table, columns_to_remove, 1)
-        return t.Tableaux(tableaux.model, table)
+        # artificial variables are the last ones, so removing them doesn't shift indexes of the remaining variables
+        basis = np.where(np.isin(tableaux.basis, columns_to_remove), -1, tableaux.basis)
+        new_tableaux = t.Tableaux(tableaux.model, table, basis)
+        new_tableaux.inherit_bounds(tableaux)
+        return new_tableaux
 
     def _restore_original_objective_row(self, tableaux, model):
-        objective_row = np.array((-1 * model.objective.expression).factors(model) + [0.0])
+        compiled = model.compile()
         new_table = np.array(tableaux.table)
-        new_table[0] = objective_row
-        return t.Tableaux(model, new_table)
-
-    def _fix_objective_row_to_the_basis(self, tableaux, basis):
+        new_table[0, :-1] = -compiled.c
+        new_table[0, -1] = compiled.c @ compiled.lower_bounds
+        # variables at their upper bounds are represented by (upper - x) columns
+        complemented = tableaux.complemented
+        new_table[0, :-1][complemented] *= -1
+        new_table[0, -1] += compiled.c[complemented] @ tableaux.upper_bounds[complemented]
+        new_tableaux = t.Tableaux(model, new_table, tableaux.basis)
+        new_tableaux.inherit_bounds(tableaux)
+        return new_tableaux
+
+    def _fix_objective_row_to_the_basis(self, tableaux):
         objective_row = tableaux.table[0].copy()
 
-        for (constr_index, col) in enumerate(basis):
-            if col >= len(objective_row) - 1:
+        for (constr_index, col) in enumerate(tableaux.basis):
+            if col < 0:
                 continue
             
             row = constr_index + 1
@@ -172,8 +644,17 @@ class Solver:
 
         new_table = np.array(tableaux.table)
         new_table[0] = objective_row
-        return t.Tableaux(tableaux.model, new_table)
+        new_tableaux = t.Tableaux(tableaux.model, new_table, tableaux.basis)
+        new_tableaux.inherit_bounds(tableaux)
+        return new_tableaux
+
+    def _project_assignment(self, assignment, model):
+        """
+            _project_assignment(assignment: list[float], model: Model) -> list[float]:
+                returns the values of the model variables only (without the slack and artificial ones)
+        """
+        return [float(assignment[var.index]) for var in model.variables]
 
     def _create_solution(self, assignment, model, initial_tableaux, tableaux, normal_model):
-        assignment = [assignment[var.index] for var in model.variables]
+        assignment = self._project_assignment(assignment, model)
         return s.Solution.with_assignment(model, assignment, initial_tableaux, tableaux, normal_model)
@@ -0,0 +1,142 @@
+import numpy as np
+
+
+class CSCMatrix:
+    """
+        A class to represent a sparse matrix stored column by column (compressed sparse columns),
+        memory used by the matrix depends only on the number of nonzero entries (and columns).
+
+
+        Attributes
+        ----------
+        shape : (int, int)
+            number of rows and columns
+        data : numpy.Array
+            nonzero values, ordered by column and then by row
+        indices : numpy.Array
+            row index of every nonzero value
+        indptr : numpy.Array
+            values of column j are stored in data[indptr[j]:indptr[j+1]]
+        entry_columns : numpy.Array
+            column index of every nonzero value (redundant with indptr, allows vectorized pricing)
+
+        Methods
+        -------
+        __init__(shape: (int, int), data: numpy.Array, indices: numpy.Array, indptr: numpy.Array) -> CSCMatrix:
+            constructs a matrix from already compressed arrays
+        @staticmethod from_triplets(shape: (int, int), rows: Iterable[int], cols: Iterable[int], values: Iterable[float]) -> CSCMatrix:
+            constructs a matrix from (row, col, value) triplets, values of the repeated entries are summed up, zeros are dropped
+        @staticmethod from_dense(array: numpy.Array) -> CSCMatrix:
+            constructs a matrix with nonzero entries of the given 2d-array
+        @staticmethod from_expressions(expressions: Iterable[Expression], cols_n: int) -> CSCMatrix:
+            constructs a matrix with one row per expression, walking directly over the coefficients (no dense factor lists)
+        nnz() -> int:
+            returns number of the stored entries
+        column(col: int) -> numpy.Array:
+            returns a dense copy of the given column
+        columns(cols: Iterable[int]) -> numpy.Array:
+            returns a dense 2d-array with the given columns
+        matvec(x: numpy.Array) -> numpy.Array:
+            returns A x
+        rmatvec(y: numpy.Array, cols: numpy.Array | None = None) -> numpy.Array:
+            returns y^T A (restricted to the given columns, if specified), e.g. used to price the columns
+        hstack(other: CSCMatrix) -> CSCMatrix:
+            returns a new matrix with the columns of the other matrix appended
+        to_dense() -> numpy.Array:
+            returns a dense copy of the matrix
+    """
+
+    def __init__(self, shape, data, indices, indptr):
+        self.shape = shape
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.entry_columns = np.repeat(np.arange(shape[1]), np.diff(self.indptr))
+
+    @staticmethod
+    def from_triplets(shape, rows, cols, values):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+
+        order = np.lexsort((rows, cols))
+        rows, cols, values = rows[order], cols[order], values[order]
+
+        if len(values) > 0:
+            starts = np.flatnonzero(np.r_[True, (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])])
+            values = np.add.reduceat(values, starts)
+            rows, cols = rows[starts], cols[starts]
+            nonzero = values != 0.0
+            rows, cols, values = rows[nonzero], cols[nonzero], values[nonzero]
+
+        indptr = np.zeros(shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=shape[1]), out=indptr[1:])
+        return CSCMatrix(shape, values, rows, indptr)
+
+    @staticmethod
+    def from_dense(array):
+        array = np.asarray(array, dtype=float)
+        cols, rows = np.nonzero(array.T)
+        return CSCMatrix.from_triplets(array.shape, rows, cols, array[rows, cols])
+
+    @staticmethod
+    def from_expressions(expressions, cols_n):
+        rows, cols, values = [], [], []
+        rows_n = 0
+        for (row, expression) in enumerate(expressions):
+            coefficients = expression.coefficients
+            rows.extend([row] * len(coefficients))
+            cols.extend(coefficients.keys())
+            values.extend(coefficients.values())
+            rows_n = row + 1
+        return CSCMatrix.from_triplets((rows_n, cols_n), rows, cols, values)
+
+    def nnz(self):
+        return len(self.data)
+
+    def column(self, col):
+        dense = np.zeros(self.shape[0])
+        start, end = self.indptr[col], self.indptr[col + 1]
+        dense[self.indices[start:end]] = self.data[start:end]
+        return dense
+
+    def columns(self, cols):
+        cols = np.asarray(cols, dtype=np.int64)
+        dense = np.zeros((self.shape[0], len(cols)))
+        entries, local_cols = self._entries(cols)
+        dense[self.indices[entries], local_cols] = self.data[entries]
+        return dense
+
+    def matvec(self, x):
+        return np.bincount(self.indices, weights=self.data * x[self.entry_columns], minlength=self.shape[0])
+
+    def rmatvec(self, y, cols = None):
+        if cols is None:
+            return np.bincount(self.entry_columns, weights=self.data * y[self.indices], minlength=self.shape[1])
+        cols = np.asarray(cols, dtype=np.int64)
+        entries, local_cols = self._entries(cols)
+        return np.bincount(local_cols, weights=self.data[entries] * y[self.indices[entries]], minlength=len(cols))
+
+    def hstack(self, other):
+        assert self.shape[0] == other.shape[0], "matrices should have the same number of rows"
+        indptr = np.concatenate([self.indptr, other.indptr[1:] + self.indptr[-1]])
+        return CSCMatrix((self.shape[0], self.shape[1] + other.shape[1]),
+                         np.concatenate([self.data, other.data]),
+                         np.concatenate([self.indices, other.indices]),
+                         indptr)
+
+    def _entries(self, cols):
+        """
+            _entries(cols: numpy.Array) -> (numpy.Array, numpy.Array):
+                returns positions of the entries stored in the given columns and the position of their column in cols
+        """
+        lengths = self.indptr[cols + 1] - self.indptr[cols]
+        local_cols = np.repeat(np.arange(len(cols)), lengths)
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        entries = np.repeat(self.indptr[cols], lengths) + offsets
+        return (entries, local_cols)
+
+    def to_dense(self):
+        dense = np.zeros(self.shape)
+        dense[self.indices, self.entry_columns] = self.data
+        return dense
@@ -0,0 +1,174 @@
+import json
+
+
+class PivotEvent:
+    """
+        A class to represent a single iteration of the simplex, passed to the solver's hooks.
+
+        Attributes
+        ----------
+        phase : str
+            "phase one", "phase two" or "dual" (iterations of the dual simplex)
+        iteration : int
+            number of the pivots made so far in the solve, including this one (bound flips share the number of the previous pivot)
+        entering : int
+            index of the entering column (for the dual simplex - chosen by its ratio test)
+        leaving : int | None
+            index of the leaving column, -1 if the row had no basic variable, None for the bound flips
+        row : int | None
+            index of the pivot row (constraint), None for the bound flips
+        step : float
+            how much the entering variable has changed
+        objective : float
+            objective of the current phase (in the maximization form) after the iteration
+        is_degenerate : bool
+            whether the iteration hasn't changed the objective (zero step of the primal simplex,
+            zero cost factor of the entering variable in the dual simplex)
+        is_bound_flip : bool
+            whether the entering variable only moved to its opposite bound, without a pivot
+        pricing_time : float
+            seconds spent choosing the entering variable (the leaving row for the dual simplex)
+        ratio_test_time : float
+            seconds spent in the ratio test (choosing the leaving row, the entering column for the dual simplex)
+        pivot_time : float
+            seconds spent updating the tableaux / basis
+
+        Methods
+        -------
+        to_dict() -> dict:
+            returns the event as a dictionary of plain values (e.g. to serialize it)
+    """
+
+    __slots__ = ('phase', 'iteration', 'entering', 'leaving', 'row', 'step', 'objective',
+                 'is_degenerate', 'is_bound_flip', 'pricing_time', 'ratio_test_time', 'pivot_time')
+
+    def __init__(self, phase, iteration, entering, leaving, row, step, objective, is_degenerate, is_bound_flip, pricing_time, ratio_test_time, pivot_time):
+        self.phase = phase
+        self.iteration = iteration
+        self.entering = int(entering)
+        self.leaving = None if leaving == None else int(leaving)
+        self.row = None if row == None else int(row)
+        self.step = float(step)
+        self.objective = float(objective)
+        self.is_degenerate = bool(is_degenerate)
+        self.is_bound_flip = is_bound_flip
+        self.pricing_time = pricing_time
+        self.ratio_test_time = ratio_test_time
+        self.pivot_time = pivot_time
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __str__(self):
+        move = f"flip x{self.entering}" if self.is_bound_flip else f"x{self.entering} in, x{self.leaving} out (row {self.row})"
+        return f"- {self.phase} #{self.iteration}: {move}, step {self.step:.3f}, objective {self.objective:.3f}"
+
+
+class SolveStatistics:
+    """
+        A class to represent statistics of a single solve, collected from the pivot events.
+
+        Attributes
+        ----------
+        phase_one_iterations : int
+            number of the iterations looking for a feasible basis
+        phase_two_iterations : int
+            number of the iterations optimizing the objective
+        dual_iterations : int
+            number of the dual simplex iterations
+        degenerate_pivots : int
+            number of the pivots that haven't changed the objective
+        bound_flips : int
+            number of the iterations that only moved the entering variable to its opposite bound
+        pricing_time : float
+            total seconds spent choosing the entering variables
+        ratio_test_time : float
+            total seconds spent in the ratio tests
+        pivot_time : float
+            total seconds spent updating the tableaux / basis
+        solve_time : float
+            total seconds of the solve, including the normalization, presolve and the tableaux construction
+        objective_values : list[float]
+            objective of the current phase (in the maximization form) after every iteration, in order
+
+        Methods
+        -------
+        record(event: PivotEvent):
+            adds the event to the statistics
+        iterations() -> int:
+            returns total number of the iterations (of all phases, including the bound flips)
+    """
+
+    def __init__(self):
+        self.phase_one_iterations = 0
+        self.phase_two_iterations = 0
+        self.dual_iterations = 0
+        self.degenerate_pivots = 0
+        self.bound_flips = 0
+        self.pricing_time = 0.0
+        self.ratio_test_time = 0.0
+        self.pivot_time = 0.0
+        self.solve_time = 0.0
+        self.objective_values = []
+
+    def record(self, event):
+        if event.phase == "phase one":
+            self.phase_one_iterations += 1
+        elif event.phase == "phase two":
+            self.phase_two_iterations += 1
+        else:
+            self.dual_iterations += 1
+        if event.is_bound_flip:
+            self.bound_flips += 1
+        elif event.is_degenerate:
+            self.degenerate_pivots += 1
+        self.pricing_time += event.pricing_time
+        self.ratio_test_time += event.ratio_test_time
+        self.pivot_time += event.pivot_time
+        self.objective_values.append(event.objective)
+
+    def iterations(self):
+        return self.phase_one_iterations + self.phase_two_iterations + self.dual_iterations
+
+    def __str__(self):
+        text = f"- iterations: {self.iterations()} (phase one: {self.phase_one_iterations}, phase two: {self.phase_two_iterations}, dual: {self.dual_iterations})\n"
+        text += f"- degenerate pivots: {self.degenerate_pivots}, bound flips: {self.bound_flips}\n"
+        text += f"- time [s]: total {self.solve_time:.4f}, pricing {self.pricing_time:.4f}, ratio test {self.ratio_test_time:.4f}, pivots {self.pivot_time:.4f}"
+        return text
+
+
+class JSONLTraceWriter:
+    """
+        A solver hook writing every pivot event as a single line of JSON, for the offline analysis.
+
+        Attributes
+        ----------
+        file : TextIO
+            file the events are written to
+
+        Methods
+        -------
+        __init__(target: str | TextIO) -> JSONLTraceWriter:
+            opens the file with the given path (or uses the given file object, it's not closed by the writer)
+        __call__(event: PivotEvent):
+            writes the event
+        close():
+            closes the file, if it has been opened by the writer
+    """
+
+    def __init__(self, target):
+        self._owns_file = isinstance(target, str)
+        self.file = open(target, "w") if self._owns_file else target
+
+    def __call__(self, event):
+        self.file.write(json.dumps(event.to_dict()) + "\n")
+
+    def close(self):
+        if self._owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -14,13 +14,24 @@ class Tableaux:
             model corresponding to the tableaux
         table : numpy.Array
             2d-array with the tableaux
+        basis : numpy.Array
+            index of the basic variable of every constraint row (-1 if the row has no basic variable), updated by pivot
+        upper_bounds : numpy.Array
+            upper bound of every variable (inf by default), relative to its lower bound
+        lower_bounds : numpy.Array
+            lower bound of every variable (0 by default), the columns represent the shifted variables (x - lower_bound)
+        complemented : numpy.Array
+            whether the column represents the variable complemented to its upper bound, i.e. (upper_bound - x) instead of x
 
         Methods
         -------
-        __init__(model: Model, table: array) -> Tableaux:
+        __init__(model: Model, table: array, basis: array | None = None) -> Tableaux:
             constructs a new tableaux for the specified model and initial table
-        cost_factors() -> numpy.Array:
-            returns a vector containing factors in the cost row
+            if the basis is not given, it's found by scanning the table for the unit columns
+        columns_n() -> int:
+            returns number of the variables (columns without the cost and bound ones)
+        cost_factors(cols: numpy.Array | None = None) -> numpy.Array:
+            returns a vector containing factors in the cost row (only for the given columns, if specified)
         cost() -> float:
             returns the cost of solution represented in tableaux
         is_optimal() -> bool:
@@ -31,20 +42,47 @@ class Tableaux:
             checks whether the problem is unbounded
         choose_leaving_variable(col: int) -> int:
             finds index of the variable, that should leave the basis next
-        pivot(col: int, row: int):
-            updates tableaux using pivot operation with given entering and leaving variables
+        has_upper_bounds() -> bool:
+            checks whether any variable has a finite upper bound, i.e. the bounded ratio test is needed
+        bounded_ratio_test(col: int, smallest_index: bool = False) -> (int | None, float):
+            ratio test respecting the upper bounds, returns the leaving row and the step of the entering variable,
+            row is None if the entering variable reaches its own upper bound first (bound flip) or the step is unbounded (inf),
+            ties are broken by the last row, or by the smallest index of the leaving variable if smallest_index is set (the Bland's rule)
+        pivot(row: int, col: int):
+            updates tableaux in place using pivot operation with given leaving and entering variables
+            (a single rank-1 update into a preallocated buffer, no copy of the table)
         extract_assignment() -> list[float]:
             returns assignment corresponding to the tableaux
         extract_basis() -> list[int]
             returns list of indexes corresponding to the variables belonging to the basis
+        find_basis() -> numpy.Array
+            finds the basis by scanning every column for a unit vector (slow, used only when the basis is unknown)
+        check_basis() -> bool
+            consistency check, whether the basic columns are (up to the round-off errors) unit vectors
+        complement(col: int):
+            replaces the nonbasic variable x with (upper_bound - x), i.e. moves it from its lower to its upper bound or back
+        complement_basic(row: int):
+            replaces the basic variable of the given row x with (upper_bound - x), used when x exceeds its upper bound
+        copy() -> Tableaux:
+            returns a copy of the table, basis and bounds (the model is shared, not copied)
+        inherit_bounds(other: Tableaux):
+            copies the bounds and complemented flags of the columns shared with the other tableaux
     """
 
-    def __init__(self, model, table):
+    def __init__(self, model, table, basis = None):
         self.model = model
-        self.table = table
+        self.table = np.asarray(table, dtype=float)
+        self.basis = self.find_basis() if basis is None else np.array(basis, dtype=int)
+        self.upper_bounds = np.full(self.columns_n(), np.inf)
+        self.lower_bounds = np.zeros(self.columns_n())
+        self.complemented = np.zeros(self.columns_n(), dtype=bool)
+        self._workspace = None
 
-    def cost_factors(self):
-        return self.table[0,:-1] 
+    def columns_n(self):
+        return self.table.shape[1] - 1
+
+    def cost_factors(self, cols = None):
+        return self.table[0,:-1] if cols is None else self.table[0, cols]
 
     def cost(self):
         return self.table[0, -1]
@@ -56,50 +94,84 @@ class Tableaux:
         return self.cost_factors().argmin()
 
     def is_unbounded(self, col):
-        return self.table[1:, col].max() <= 0 
+        return self.table[1:, col].max() <= eps
 
     def choose_leaving_variable(self, col):
-        column = np.copy(self.table[1:, col])
-        column = np.where(column > 0, column, -1)
-        indicators = self.table[1:, -1] / column
-        quotients = np.where(column > 0, indicators, np.inf)
+        _, _, positive, quotients = self._buffers()
+        column = self.table[1:, col]
+        np.greater(column, eps, out=positive)
+        quotients.fill(np.inf)
+        np.divide(self.table[1:, -1], column, out=quotients, where=positive)
+        # ties are broken by taking the last row with the minimal quotient
         index = len(quotients) - np.argmin(quotients[::-1])
 
         return index
 
+    def has_upper_bounds(self):
+        return np.isfinite(self.upper_bounds).any()
+
+    def bounded_ratio_test(self, col, smallest_index = False):
+        column = self.table[1:, col]
+        values = self.table[1:, -1]
+        has_basic = self.basis >= 0
+        upper_bounds = np.where(has_basic, self.upper_bounds[self.basis], np.inf)
+
+        # basic variables decrease to zero for the positive factors and increase to their upper bounds for the negative ones
+        quotients = np.full(len(column), np.inf)
+        decreasing = column > eps
+        increasing = (column < -eps) & np.isfinite(upper_bounds)
+        quotients[decreasing] = values[decreasing] / column[decreasing]
+        quotients[increasing] = (upper_bounds[increasing] - values[increasing]) / -column[increasing]
+        row = len(quotients) - 1 - np.argmin(quotients[::-1])
+        if smallest_index and quotients[row] < np.inf:
+            ties = np.flatnonzero(quotients <= quotients[row] + eps)
+            row = ties[np.argmin(np.where(has_basic[ties], self.basis[ties], np.iinfo(self.basis.dtype).max))]
+
+        if self.upper_bounds[col] <= quotients[row]:
+            return (None, self.upper_bounds[col])
+        return (row + 1, quotients[row])
+
     def pivot(self, row, col):
-        rows_n, cols_n = self.table.shape
-        pivot_factor = self.table[row, col]
+        outer, pivot_column, _, _ = self._buffers()
+        table = self.table
 
-        new_table = self.table.copy()
-        new_table[row] = self.table[row] / pivot_factor
+        table[row] /= table[row, col]
+        pivot_column[:] = table[:, col]
+        pivot_column[row] = 0.0
 
-        new_table[:, col] = 0.0
-        new_table[row, col] = 1.0
-        
-        for r in range(rows_n):
-            if r == row:
-                continue
-            for c in range(cols_n):
-                if c == col:
-                    continue 
-                new_table[r,c] = (-self.table[r, col]) * new_table[row, c] + self.table[r,c]
+        np.multiply.outer(pivot_column, table[row], out=outer)
+        table -= outer
 
-        self.table = new_table
+        table[:, col] = 0.0
+        table[row, col] = 1.0
+        self.basis[row - 1] = col
 
-    def extract_assignment(self):
+    def _buffers(self):
         rows_n, cols_n = self.table.shape
-        assignment = [0.0 for _ in range(cols_n - 1)]
-        basis = self.extract_basis()
-        for r in range(1, rows_n):
-            var_index = basis[r - 1]
-            assignment[var_index] = self.table[r, -1]
-        
-        return assignment
+        if self._workspace is None or self._workspace[0].shape != self.table.shape:
+            self._workspace = (
+                np.empty((rows_n, cols_n)),
+                np.empty(rows_n),
+                np.empty(rows_n - 1, dtype=bool),
+                np.empty(rows_n - 1)
+            )
+        return self._workspace
+
+    def extract_assignment(self):
+        assignment = np.zeros(self.columns_n())
+        rows = np.flatnonzero(self.basis >= 0)
+        # [rows+1] because we ignore the cost row
+        assignment[self.basis[rows]] = self.table[rows + 1, -1]
+        assignment[self.complemented] = self.upper_bounds[self.complemented] - assignment[self.complemented]
+        assignment += self.lower_bounds
+        return assignment.tolist()
     
     def extract_basis(self):
+        return self.basis.tolist()
+
+    def find_basis(self):
         rows_n, cols_n = self.table.shape
-        basis = [-1 for _ in range(rows_n -1)]
+        basis = np.full(rows_n - 1, -1)
         for c in range(cols_n - 1):
             column = self.table[:,c]
             belongs_to_basis = column.min() == 0.0 and column.max() == 1.0 and column.sum() == 1.0
@@ -109,6 +181,35 @@ class Tableaux:
                 basis[row-1] = c
         return basis
 
+    def check_basis(self):
+        rows = np.flatnonzero(self.basis >= 0)
+        unit_columns = np.zeros((self.table.shape[0], len(rows)))
+        unit_columns[rows + 1, np.arange(len(rows))] = 1.0
+        return np.allclose(self.table[:, self.basis[rows]], unit_columns, atol=eps)
+
+    def complement(self, col):
+        self.table[:, -1] -= self.upper_bounds[col] * self.table[:, col]
+        self.table[:, col] *= -1
+        self.complemented[col] = not self.complemented[col]
+
+    def complement_basic(self, row):
+        col = self.basis[row - 1]
+        self.table[row, -1] -= self.upper_bounds[col]
+        self.table[row] *= -1
+        self.table[row, col] = 1.0
+        self.complemented[col] = not self.complemented[col]
+
+    def copy(self):
+        tableaux = Tableaux(self.model, self.table.copy(), self.basis)
+        tableaux.inherit_bounds(self)
+        return tableaux
+
+    def inherit_bounds(self, other):
+        n = min(self.columns_n(), other.columns_n())
+        self.upper_bounds[:n] = other.upper_bounds[:n]
+        self.lower_bounds[:n] = other.lower_bounds[:n]
+        self.complemented[:n] = other.complemented[:n]
+
     def __str__(self):
         def cell(x, w):
             return '{0: >{1}}'.format(x, w)
@@ -118,7 +219,8 @@ class Tableaux:
         header = ["basis", cost_name] + [var.name for var in self.model.variables] + ["b"]
         longest_col = max([len(h) for h in header])
 
-        rows = [[cost_name]] + [[self.model.variables[i].name] for i in basis]
+        # the rows without a basic variable (see find_basis) get a placeholder
+        rows = [[cost_name]] + [[self.model.variables[i].name if i >= 0 else "-"] for i in basis]
 
         for (i,r) in enumerate(rows):
             cost_factor = 0.0 if i > 0 else 1.0
@@ -0,0 +1,46 @@
+import logging
+import math
+from saport.integer.model import Model
+from saport.simplex.solver import Solver, Formulation
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.dual_solver import DualSimplexSolver
+from saport.simplex.interior_point import InteriorPointSolver
+from saport.simplex.presolve import Presolver
+
+def create_model():
+    model = Model("integer_02_relaxation_solvers")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    # the unused variable and the singleton constraint are removed by the presolve, the other columns are shifted
+    model.add_constraint(x2 <= 4)
+    model.add_constraint(x2 + 2*x3 <= 9)
+    model.add_constraint(3*x2 + x3 <= 14)
+    model.maximize(2 * x2 + 3 * x3 - x1)
+    return model
+
+def run():
+    relaxation_solvers = [
+        ("default", None),
+        ("presolved", Solver(presolver=Presolver())),
+        ("dual formulation", Solver(formulation=Formulation.DUAL)),
+        ("cheaper formulation", Solver(formulation=Formulation.AUTO)),
+        ("lean", Solver(keep_tableaux=False)),
+        ("revised", RevisedSolver()),
+        ("presolved revised", RevisedSolver(presolver=Presolver())),
+        ("dual simplex", DualSimplexSolver()),
+        ("interior point", InteriorPointSolver()),
+        ("presolved interior point", InteriorPointSolver(presolver=Presolver()))
+    ]
+    for (name, relaxation_solver) in relaxation_solvers:
+        solution = create_model().solve(relaxation_solver=relaxation_solver)
+        assert all(math.isclose(value, expected, abs_tol=1e-6) for (value, expected) in zip(solution.assignment, [0, 3, 3])), f"branch and bound with the {name} relaxation solver found an incorrect solution!"
+
+    logging.info("Congratulations! Every relaxation solver can start the branch and bound :)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
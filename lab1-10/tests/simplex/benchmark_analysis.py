@@ -0,0 +1,30 @@
+import time
+from saport.simplex.solver import Solver
+from saport.simplex.analyser import Analyser
+from .benchmark_models import random_assignment_model, random_model
+
+
+def workloads():
+    return [random_assignment_model(20), random_model(30, 2000), random_model(100, 5000)]
+
+
+def run(print_function=print):
+    tools = Analyser().tools
+    header = f"{'model':>18} | {'solve [s]':>9} | " + " | ".join(f"{tool.name:>38}" for tool in tools)
+    print_function(header)
+    print_function('-' * len(header))
+    for model in workloads():
+        start = time.perf_counter()
+        solution = model.solve(Solver())
+        solve_time = time.perf_counter() - start
+
+        times = []
+        for tool in tools:
+            start = time.perf_counter()
+            tool.analyse(solution)
+            times.append(time.perf_counter() - start)
+        print_function(f"{model.name:>18} | {solve_time:>9.3f} | " + " | ".join(f"{t:>38.4f}" for t in times))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,60 @@
+import time
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.sparse import CSCMatrix
+from saport.simplex.expressions.expression import Expression
+
+# manipulate following parameters to customize the benchmark
+ASSIGNMENT_SIZES = [50, 100, 200]
+
+
+def scalar_assignment_model(costs):
+    """
+        n x n assignment model built variable by variable and constraint by constraint
+    """
+    n = len(costs)
+    model = Model(f"assignment_{n}")
+    xs = [[model.create_variable(f"x{i}_{j}", upper=1) for j in range(n)] for i in range(n)]
+    model.minimize(Expression.from_vectors([x for row in xs for x in row], costs.flatten().tolist()))
+    for i in range(n):
+        model.add_constraint(Expression.from_vectors(xs[i], [1.0] * n) == 1)
+    for j in range(n):
+        model.add_constraint(Expression.from_vectors([row[j] for row in xs], [1.0] * n) == 1)
+    return model
+
+
+def bulk_assignment_model(costs):
+    """
+        the same model built from the sparse matrices of the row and column sums
+    """
+    n = len(costs)
+    model = Model(f"assignment_{n}")
+    xs = model.create_variables(n * n, [f"x{i}_{j}" for i in range(n) for j in range(n)], upper=1)
+    positions = np.arange(n * n)
+    model.minimize(costs.flatten() @ xs)
+    model.add_constraints(CSCMatrix.from_triplets((n, n * n), positions // n, positions, np.ones(n * n)) @ xs == 1)
+    model.add_constraints(CSCMatrix.from_triplets((n, n * n), positions % n, positions, np.ones(n * n)) @ xs == 1)
+    return model
+
+
+def timed(build, costs):
+    start = time.perf_counter()
+    model = build(costs)
+    compiled = model.compile()
+    return time.perf_counter() - start, compiled
+
+
+def run(print_function=print):
+    header = f"{'model':>16} | {'variables':>9} | {'scalar [s]':>10} | {'bulk [s]':>8} | {'speedup':>7}"
+    print_function(header)
+    print_function('-' * len(header))
+    for n in ASSIGNMENT_SIZES:
+        costs = np.random.default_rng(n).integers(1, 100, (n, n)).astype(float)
+        scalar, expected = timed(scalar_assignment_model, costs)
+        bulk, compiled = timed(bulk_assignment_model, costs)
+        assert np.array_equal(compiled.A, expected.A) and np.array_equal(compiled.c, expected.c)
+        print_function(f"{'assignment_' + str(n):>16} | {n * n:>9} | {scalar:>10.3f} | {bulk:>8.3f} | {scalar / bulk:>6.1f}x")
+
+
+if __name__ == '__main__':
+    run()
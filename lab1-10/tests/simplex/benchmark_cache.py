@@ -0,0 +1,35 @@
+import time
+from saport.simplex.cache import SolutionCache
+from saport.simplex.revised_solver import RevisedSolver
+from .benchmark_models import random_sparse_model
+
+# manipulate following parameters to customize the benchmark
+MODEL_SHAPES = [(50, 100, 500), (100, 200, 2000), (200, 400, 8000)]
+
+
+def run(print_function=print):
+    header = f"{'model':>16} | {'solve [s]':>9} | {'hit [s]':>8} | {'fingerprint [s]':>15} | {'speedup':>8}"
+    print_function(header)
+    print_function('-' * len(header))
+    for (rows_n, cols_n, nonzeros_n) in MODEL_SHAPES:
+        cache = SolutionCache()
+        start = time.perf_counter()
+        expected = random_sparse_model(rows_n, cols_n, nonzeros_n, 0).solve(RevisedSolver(), cache=cache)
+        solve = time.perf_counter() - start
+
+        # a fresh copy of the model, so the hit has to compile and fingerprint it again
+        model = random_sparse_model(rows_n, cols_n, nonzeros_n, 0)
+        start = time.perf_counter()
+        solution = model.solve(RevisedSolver(), cache=cache)
+        hit = time.perf_counter() - start
+        assert cache.hits == 1 and solution.assignment == expected.assignment
+
+        model.invalidate()
+        start = time.perf_counter()
+        model.compile().fingerprint
+        fingerprint = time.perf_counter() - start
+        print_function(f"{f'{rows_n}x{cols_n}':>16} | {solve:>9.3f} | {hit:>8.4f} | {fingerprint:>15.4f} | {solve / hit:>7.0f}x")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,42 @@
+import time
+from saport.simplex.solver import Solver
+from saport.simplex.crash import TriangularCrash
+from .benchmark_models import assignment_test_models, network_test_models, random_assignment_model
+
+
+# manipulate following parameters to customize the benchmark
+RANDOM_ASSIGNMENT_SIZES = [10, 20, 30, 40]
+
+
+def workloads():
+    return assignment_test_models() + network_test_models() + [random_assignment_model(n) for n in RANDOM_ASSIGNMENT_SIZES]
+
+
+def solve(model, crash = None):
+    """
+        returns the solution (with the statistics) and the time of the solve
+    """
+    start = time.perf_counter()
+    solution = model.solve(Solver(statistics=True, crash=crash))
+    return (solution, time.perf_counter() - start)
+
+
+def run(print_function=print):
+    header = f"{'model':>28} | {'covered':>7} | {'artificial':>10} | {'phase one':>9} | {'phase one (crash)':>17} | {'iterations':>10} | {'iterations (crash)':>18} | {'time [ms]':>9} | {'time crash [ms]':>15}"
+    print_function(header)
+    print_function('-' * len(header))
+    totals = [0, 0, 0, 0]
+    for model in workloads():
+        plain, plain_time = solve(model)
+        crash = TriangularCrash()
+        crashed, crashed_time = solve(model, crash)
+        assert abs(plain.objective_value() - crashed.objective_value()) < 1e-6, f"crash changed the objective of {model.name}"
+
+        counts = [plain.statistics.phase_one_iterations, crashed.statistics.phase_one_iterations, plain.statistics.iterations(), crashed.statistics.iterations()]
+        totals = [total + count for (total, count) in zip(totals, counts)]
+        print_function(f"{model.name:>28} | {crash.covered_rows:>7} | {crash.artificial_rows:>10} | {counts[0]:>9} | {counts[1]:>17} | {counts[2]:>10} | {counts[3]:>18} | {plain_time * 1000:>9.1f} | {crashed_time * 1000:>15.1f}")
+    print_function(f"{'total':>28} | {'':>7} | {'':>10} | {totals[0]:>9} | {totals[1]:>17} | {totals[2]:>10} | {totals[3]:>18} |")
+
+
+if __name__ == '__main__':
+    run()
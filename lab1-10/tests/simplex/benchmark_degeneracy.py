@@ -0,0 +1,42 @@
+import time
+from saport.simplex.solver import Solver
+from saport.simplex.degeneracy import AntiDegeneracy
+from .benchmark_models import assignment_test_models, network_test_models, random_assignment_model
+
+
+# manipulate following parameters to customize the benchmark
+RANDOM_ASSIGNMENT_SIZES = [10, 20, 30]
+
+
+def workloads():
+    return assignment_test_models() + network_test_models() + [random_assignment_model(n) for n in RANDOM_ASSIGNMENT_SIZES]
+
+
+def solve(model, anti_degeneracy = None):
+    """
+        returns the solution (with the statistics) and the time of the solve
+    """
+    start = time.perf_counter()
+    solution = model.solve(Solver(statistics=True, anti_degeneracy=anti_degeneracy))
+    return (solution, time.perf_counter() - start)
+
+
+def run(print_function=print):
+    header = f"{'model':>28} | {'iterations':>10} | {'degenerate':>10} | {'iterations (AD)':>15} | {'degenerate (AD)':>15} | {'perturbations':>13} | {'cleanup':>7} | {'time [ms]':>9} | {'time AD [ms]':>12}"
+    print_function(header)
+    print_function('-' * len(header))
+    totals = [0, 0, 0, 0]
+    for model in workloads():
+        plain, plain_time = solve(model)
+        anti_degeneracy = AntiDegeneracy()
+        guarded, guarded_time = solve(model, anti_degeneracy)
+        assert abs(plain.objective_value() - guarded.objective_value()) < 1e-6, f"anti-degeneracy changed the objective of {model.name}"
+
+        counts = [plain.statistics.iterations(), plain.statistics.degenerate_pivots, guarded.statistics.iterations(), guarded.statistics.degenerate_pivots]
+        totals = [total + count for (total, count) in zip(totals, counts)]
+        print_function(f"{model.name:>28} | {counts[0]:>10} | {counts[1]:>10} | {counts[2]:>15} | {counts[3]:>15} | {anti_degeneracy.perturbations:>13} | {anti_degeneracy.cleanup_pivots:>7} | {plain_time * 1000:>9.1f} | {guarded_time * 1000:>12.1f}")
+    print_function(f"{'total':>28} | {totals[0]:>10} | {totals[1]:>10} | {totals[2]:>15} | {totals[3]:>15} |")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,60 @@
+import time
+import tracemalloc
+from saport.simplex.expressions.expression import Expression
+from saport.simplex.expressions.variable import Variable
+
+# manipulate following parameters to customize the benchmark
+SIZES = [1000, 10000, 100000, 1000000]
+TUPLE_SIZES_LIMIT = 20000
+
+
+class TupleExpression:
+    """
+        The original representation (a tuple of atoms copied by every addition), kept as a reference.
+    """
+
+    def __init__(self, *atoms):
+        self.atoms = atoms
+
+    def __add__(self, other):
+        new_atoms = list(self.atoms)
+        new_atoms += other.atoms
+        return TupleExpression(*new_atoms)
+
+
+def build(create_expression, variables):
+    expression = create_expression()
+    for var in variables:
+        expression += 2.0 * var
+    return expression
+
+
+def add_up(create_expression, variables):
+    expression = sum((2.0 * var for var in variables), create_expression())
+    # the sum is merged on the first read
+    expression.coefficients
+    return expression
+
+
+def measure(create_expression, variables, build = build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    expression = build(create_expression, variables)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (elapsed, peak)
+
+
+def run(print_function=print):
+    print_function(f"{'terms':>9} | {'tuple [s]':>10} | {'dict [s]':>9} | {'dict [us/term]':>14} | {'dict peak [MB]':>14} | {'sum() [s]':>9} | {'sum() [us/term]':>15}")
+    for n in SIZES:
+        variables = [Variable(f"x{i}", i) for i in range(n)]
+        tuple_time = f"{measure(TupleExpression, variables)[0]:.3f}" if n <= TUPLE_SIZES_LIMIT else "-"
+        dict_time, dict_peak = measure(Expression, variables)
+        sum_time, _ = measure(Expression, variables, add_up)
+        print_function(f"{n:>9} | {tuple_time:>10} | {dict_time:>9.3f} | {dict_time / n * 1e6:>14.2f} | {dict_peak / 2**20:>14.1f} | {sum_time:>9.3f} | {sum_time / n * 1e6:>15.2f}")
+
+
+if __name__ == '__main__':
+    run()
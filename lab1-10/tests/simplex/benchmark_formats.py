@@ -0,0 +1,34 @@
+import os
+import tempfile
+import time
+from saport.simplex.model import Model
+from .benchmark_models import random_sparse_model
+
+# manipulate following parameters to customize the benchmark
+NONZEROS = [10**4, 10**5, 10**6]
+FILES = ["model.mps", "model_fixed.mps", "model.lp", "model.mps.gz"]
+
+
+def run(print_function=print):
+    directory = tempfile.mkdtemp()
+    header = f"{'nonzeros':>8} | {'file':>16} | {'size [MB]':>9} | {'write [s]':>9} | {'read [s]':>8}"
+    print_function(header)
+    print_function('-' * len(header))
+    for nonzeros_n in NONZEROS:
+        model = random_sparse_model(nonzeros_n // 20, nonzeros_n // 10, nonzeros_n)
+        for name in FILES:
+            path = os.path.join(directory, name)
+            fixed = "fixed" in name
+            start = time.perf_counter()
+            model.to_file(path, fixed)
+            write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            Model.from_file(path, fixed)
+            read = time.perf_counter() - start
+            print_function(f"{nonzeros_n:>8} | {name:>16} | {os.path.getsize(path) / 2**20:>9.2f} | {write:>9.3f} | {read:>8.3f}")
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,46 @@
+import time
+import numpy as np
+from saport.minimax.model import Game
+from saport.minimax.solvers.mixed import MixedSolver
+from saport.simplex.solver import Solver, Formulation
+from saport.simplex.revised_solver import RevisedSolver
+
+# manipulate following parameters to customize the benchmark
+GAME_SHAPES = [(5, 100), (10, 300), (20, 600), (300, 10)]
+
+
+def workloads():
+    """
+        LPs of the mixed strategies of the random games (rewards shifted to nonnegative values, like by the MixedSolver)
+    """
+    models = []
+    for (rows_n, cols_n) in GAME_SHAPES:
+        game = Game(np.random.default_rng(0).integers(0, 100, (rows_n, cols_n)).astype(float))
+        solver = MixedSolver(game)
+        model = solver.create_max_model(game)
+        model.name = f"game_{rows_n}x{cols_n}"
+        models.append(model)
+    return models
+
+
+def timed(model, solver):
+    start = time.perf_counter()
+    solution = model.solve(solver)
+    return time.perf_counter() - start, solution
+
+
+def run(print_function=print):
+    header = f"{'model':>14} | {'solver':>13} | {'chosen':>6} | {'primal [s]':>10} | {'auto [s]':>8} | {'speedup':>7}"
+    print_function(header)
+    print_function('-' * len(header))
+    for model in workloads():
+        for solver_class in [Solver, RevisedSolver]:
+            primal, expected = timed(model, solver_class())
+            auto, solution = timed(model, solver_class(formulation=Formulation.AUTO))
+            assert np.isclose(solution.objective_value(), expected.objective_value())
+            chosen = "primal" if solution.dual_solution == None else "dual"
+            print_function(f"{model.name:>14} | {solver_class.__name__:>13} | {chosen:>6} | {primal:>10.3f} | {auto:>8.3f} | {primal / auto:>6.1f}x")
+
+
+if __name__ == '__main__':
+    run()
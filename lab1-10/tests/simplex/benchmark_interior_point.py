@@ -0,0 +1,45 @@
+import time
+import numpy as np
+from saport.minimax.model import Game
+from saport.minimax.solvers.mixed import MixedSolver
+from saport.simplex.solver import Solver
+from saport.simplex.interior_point import InteriorPointSolver
+
+# manipulate following parameters to customize the benchmark
+GAME_SHAPES = [(25, 25), (50, 50), (100, 100), (200, 200), (300, 300), (400, 400), (100, 1000)]
+
+
+def workloads():
+    """
+        dense LPs of the mixed strategies of the random games, like in benchmark_formulation
+    """
+    models = []
+    for (rows_n, cols_n) in GAME_SHAPES:
+        game = Game(np.random.default_rng(0).integers(0, 100, (rows_n, cols_n)).astype(float))
+        model = MixedSolver(game).create_max_model(game)
+        model.name = f"game_{rows_n}x{cols_n}"
+        models.append(model)
+    return models
+
+
+def timed(model, solver):
+    start = time.perf_counter()
+    solution = model.solve(solver)
+    return time.perf_counter() - start, solution
+
+
+def run(print_function=print):
+    header = f"{'model':>14} | {'tableaux [s]':>12} | {'pivots':>6} | {'interior [s]':>12} | {'iterations':>10} | {'crossover':>9} | {'speedup':>7}"
+    print_function(header)
+    print_function('-' * len(header))
+    for model in workloads():
+        simplex = Solver()
+        simplex_time, expected = timed(model, simplex)
+        interior = InteriorPointSolver()
+        interior_time, solution = timed(model, interior)
+        assert np.isclose(solution.objective_value(), expected.objective_value()) and not interior.used_simplex
+        print_function(f"{model.name:>14} | {simplex_time:>12.3f} | {simplex.iterations:>6} | {interior_time:>12.3f} | {interior.interior_iterations:>10} | {interior.crossover_pivots:>9} | {simplex_time / interior_time:>6.1f}x")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,45 @@
+import time
+import tracemalloc
+from saport.simplex.solver import Solver
+from .benchmark_models import random_model
+
+
+# manipulate following parameters to customize the benchmark
+MODEL_SHAPES = [(20, 40), (50, 100), (100, 200)]
+BATCH_SIZE = 20
+
+
+def solve_batch(models, keep_tableaux):
+    """
+        returns the solutions of the models, the memory they keep alive [bytes] and the time of the solves
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    solutions = [model.solve(Solver(keep_tableaux=keep_tableaux)) for model in models]
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (solutions, retained, elapsed)
+
+
+def run(print_function=print):
+    header = f"{'models':>16} | {'kept [MB]':>9} | {'lean [MB]':>9} | {'ratio':>6} | {'solve [s]':>9} | {'solve lean [s]':>14} | {'rebuild [ms]':>12}"
+    print_function(header)
+    print_function('-' * len(header))
+    for (rows_n, cols_n) in MODEL_SHAPES:
+        # the models are compiled before, so only the solves are measured
+        models = [random_model(rows_n, cols_n, seed) for seed in range(BATCH_SIZE)]
+        for model in models:
+            model.compile()
+        full, full_bytes, full_time = solve_batch(models, True)
+        del full
+        lean, lean_bytes, lean_time = solve_batch(models, False)
+
+        start = time.perf_counter()
+        lean[0].tableaux
+        rebuild = time.perf_counter() - start
+        print_function(f"{f'{BATCH_SIZE} x {rows_n}x{cols_n}':>16} | {full_bytes / 2**20:>9.2f} | {lean_bytes / 2**20:>9.2f} | {full_bytes / lean_bytes:>6.1f} | {full_time:>9.3f} | {lean_time:>14.3f} | {rebuild * 1000:>12.2f}")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,97 @@
+"""
+LP models used by the simplex benchmarks, built the same way as the models created by the assignment and maxflow solvers.
+"""
+import os
+import numpy as np
+from saport.assignment.model import AssignmentProblem, NormalizedAssignmentProblem
+from saport.maxflow.model import Network
+from saport.simplex.model import Model
+from saport.simplex.compiled import CompiledModel
+from saport.simplex.expressions.expression import Expression
+from saport.simplex.expressions.objective import ObjectiveType
+
+ASSIGNMENT_DIR = "assignment_tests"
+NETWORKS_DIR = "tests/maxflow/networks"
+
+
+def assignment_model(costs, name = "assignment"):
+    """
+        the same LP as the one built by saport.assignment.simplex_solver.Solver for the given (square, min) costs
+    """
+    n = len(costs)
+    model = Model(name)
+    variables = [[model.create_variable(f"x{i}_{j}", upper=1) for j in range(n)] for i in range(n)]
+    model.minimize(Expression.from_vectors([v for row in variables for v in row], np.asarray(costs).flatten()))
+    for i in range(n):
+        model.add_constraint(Expression.from_vectors(variables[i], [1] * n) == 1)
+    for j in range(n):
+        model.add_constraint(Expression.from_vectors([row[j] for row in variables], [1] * n) == 1)
+    return model
+
+
+def random_assignment_model(n, seed = 0):
+    costs = np.random.default_rng(seed).integers(1, 100, (n, n))
+    return assignment_model(costs, f"assignment_{n}")
+
+
+def assignment_test_models():
+    models = []
+    for path in sorted(os.listdir(ASSIGNMENT_DIR)):
+        if path.endswith(".txt"):
+            problem = AssignmentProblem.from_file(os.path.join(ASSIGNMENT_DIR, path))
+            models.append(assignment_model(NormalizedAssignmentProblem.from_problem(problem).costs, problem.name))
+    return models
+
+
+def flow_model(network):
+    """
+        the same LP as the one built by saport.maxflow.solvers.simplex.SimplexSolver for the given network
+    """
+    model = Model(network.name)
+    variables = {(u, v): model.create_variable(f"f({u},{v})", upper=Network.capacity(network.digraph, u, v)) for (u, v) in network.digraph.edges()}
+
+    for u in network.digraph.nodes():
+        if u in {network.sink_node, network.source_node}:
+            continue
+        inflows = [variables[(v, u)] for v in network.digraph.predecessors(u) if v != network.sink_node]
+        outflows = [variables[(u, v)] for v in network.digraph.successors(u) if v != network.source_node]
+        model.add_constraint(Expression.from_vectors(inflows + outflows, [1.0] * len(inflows) + [-1.0] * len(outflows)) == 0)
+
+    source_variables = [var for ((u, _), var) in variables.items() if u == network.source_node]
+    model.maximize(Expression.from_vectors(source_variables, [1.0] * len(source_variables)))
+    return model
+
+
+def network_test_models():
+    return [flow_model(Network.from_file(os.path.join(NETWORKS_DIR, path))) for path in sorted(os.listdir(NETWORKS_DIR)) if path.endswith(".dnf")]
+
+
+def random_model(rows_n, cols_n, seed = 0):
+    generator = np.random.default_rng(seed)
+    model = Model(f"random_{rows_n}x{cols_n}")
+    variables = model.variables
+    for i in range(cols_n):
+        model.create_variable(f"x{i}")
+    for _ in range(rows_n):
+        factors = generator.integers(0, 10, cols_n) * (generator.random(cols_n) < 0.5)
+        model.add_constraint(Expression.from_vectors(variables, factors) <= float(generator.integers(10, 100)))
+    model.maximize(Expression.from_vectors(variables, generator.integers(1, 10, cols_n)))
+    return model
+
+
+def random_sparse_model(rows_n, cols_n, nonzeros_n, seed = 0):
+    """
+        a large sparse model (about nonzeros_n entries at random positions), built directly from the matrix form
+    """
+    generator = np.random.default_rng(seed)
+    compiled = CompiledModel((rows_n, cols_n),
+                             generator.integers(0, rows_n, nonzeros_n),
+                             generator.integers(0, cols_n, nonzeros_n),
+                             generator.integers(1, 10, nonzeros_n).astype(float),
+                             generator.integers(10, 100, rows_n).astype(float),
+                             np.full(rows_n, -1),
+                             generator.integers(1, 10, cols_n).astype(float),
+                             ObjectiveType.MAX,
+                             np.zeros(cols_n),
+                             np.where(generator.random(cols_n) < 0.2, 1.0, np.inf))
+    return Model.from_compiled(f"sparse_{rows_n}x{cols_n}", compiled, [f"x{j}" for j in range(cols_n)])
@@ -0,0 +1,49 @@
+import time
+import numpy as np
+from saport.simplex.solver import Solver
+from saport.simplex.parametric import ParametricAnalyser
+from .benchmark_models import random_model
+
+# manipulate following parameters to customize the benchmark
+SAMPLES_N = 20
+RANGE = 0.5
+
+
+def workloads():
+    return [random_model(20, 40), random_model(60, 120)]
+
+
+def sampled(model, constraint_index, parameters):
+    """
+        solves the model once for every sampled bound of the constraint, returns the total time
+    """
+    start = time.perf_counter()
+    for parameter in parameters:
+        model.constraints[constraint_index].bound = float(parameter)
+        model.invalidate()
+        model.solve(Solver())
+    return time.perf_counter() - start
+
+
+def run(print_function=print):
+    header = f"{'model':>14} | {'constraint':>10} | {'breakpoints':>11} | {'pivots':>6} | {f'{SAMPLES_N} solves [s]':>14} | {'sweep [s]':>9}"
+    print_function(header)
+    print_function('-' * len(header))
+    for model in workloads():
+        solution = model.solve(Solver())
+        for constraint_index in [0, len(model.constraints) // 2]:
+            bound = model.constraints[constraint_index].bound
+            lower, upper = bound * (1 - RANGE), bound * (1 + RANGE)
+
+            analyser = ParametricAnalyser()
+            start = time.perf_counter()
+            result = analyser.bound_sweep(solution, constraint_index, lower, upper)
+            sweep = time.perf_counter() - start
+
+            scratch_model = random_model(len(model.constraints), len(model.variables))
+            scratch = sampled(scratch_model, constraint_index, np.linspace(lower, upper, SAMPLES_N))
+            print_function(f"{model.name:>14} | {constraint_index:>10} | {len(result.breakpoints):>11} | {analyser.iterations:>6} | {scratch:>14.3f} | {sweep:>9.4f}")
+
+
+if __name__ == '__main__':
+    run()
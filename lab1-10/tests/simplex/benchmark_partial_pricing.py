@@ -0,0 +1,41 @@
+import time
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.pricing import DantzigPricing, PartialPricing
+from .benchmark_models import random_assignment_model, random_model
+
+# manipulate following parameters to customize the benchmark
+BLOCK_SIZE = 128
+CANDIDATES_N = 8
+
+
+def workloads():
+    return [random_assignment_model(20), random_model(30, 2000), random_model(30, 5000)]
+
+
+def solvers():
+    return [
+        ("tableaux, full", lambda: Solver(DantzigPricing())),
+        ("tableaux, partial", lambda: Solver(PartialPricing(BLOCK_SIZE, CANDIDATES_N))),
+        ("revised, full", lambda: RevisedSolver(DantzigPricing())),
+        ("revised, partial", lambda: RevisedSolver(PartialPricing(BLOCK_SIZE, CANDIDATES_N)))
+    ]
+
+
+def run(print_function=print):
+    header = f"{'model':>18} | " + " | ".join(f"{name:>22}" for (name, _) in solvers())
+    print_function(header)
+    print_function(f"{'':>18} | " + " | ".join(f"{'iterations / time [s]':>22}" for _ in solvers()))
+    print_function('-' * len(header))
+    for model in workloads():
+        results = []
+        for (_, create_solver) in solvers():
+            solver = create_solver()
+            start = time.perf_counter()
+            model.solve(solver)
+            results.append(f"{solver.iterations:>10} / {time.perf_counter() - start:>9.3f}")
+        print_function(f"{model.name:>18} | " + " | ".join(results))
+
+
+if __name__ == '__main__':
+    run()
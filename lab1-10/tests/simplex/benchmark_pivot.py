@@ -0,0 +1,66 @@
+import time
+import numpy as np
+from saport.simplex.tableaux import Tableaux
+
+# manipulate following parameters to customize the benchmark
+SIZES = [(50, 100), (200, 400), (1000, 2000)]
+TIMELIMIT = 2.0
+
+
+class LoopTableaux(Tableaux):
+    """
+        The original pivot implementation (a copy of the table and a python loop over every cell), kept as a reference.
+    """
+
+    def pivot(self, row, col):
+        rows_n, cols_n = self.table.shape
+        pivot_factor = self.table[row, col]
+
+        new_table = self.table.copy()
+        new_table[row] = self.table[row] / pivot_factor
+
+        new_table[:, col] = 0.0
+        new_table[row, col] = 1.0
+
+        for r in range(rows_n):
+            if r == row:
+                continue
+            for c in range(cols_n):
+                if c == col:
+                    continue
+                new_table[r, c] = (-self.table[r, col]) * new_table[row, c] + self.table[r, c]
+
+        self.table = new_table
+
+
+def random_table(rows_n, cols_n, seed=0):
+    generator = np.random.default_rng(seed)
+    return generator.uniform(0.5, 1.5, (rows_n + 1, cols_n + 1))
+
+
+def pivots_per_second(tableaux_class, rows_n, cols_n):
+    tableaux = tableaux_class(None, random_table(rows_n, cols_n))
+    generator = np.random.default_rng(1)
+    pivots = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < TIMELIMIT:
+        col = generator.integers(cols_n)
+        row = generator.integers(1, rows_n + 1)
+        if abs(tableaux.table[row, col]) < 1e-3:
+            continue
+        tableaux.pivot(row, col)
+        tableaux.choose_leaving_variable(col)
+        pivots += 1
+    return pivots / (time.perf_counter() - start)
+
+
+def run(print_function=print):
+    print_function(f"{'size':>12} | {'loop [pivots/s]':>16} | {'vectorized [pivots/s]':>22} | {'speedup':>8}")
+    for (rows_n, cols_n) in SIZES:
+        loop = pivots_per_second(LoopTableaux, rows_n, cols_n)
+        vectorized = pivots_per_second(Tableaux, rows_n, cols_n)
+        print_function(f"{f'{rows_n}x{cols_n}':>12} | {loop:>16.1f} | {vectorized:>22.1f} | {vectorized / loop:>7.1f}x")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,30 @@
+import time
+from saport.simplex.solver import Solver
+from saport.simplex.pricing import DantzigPricing, BlandPricing, DevexPricing, SteepestEdgePricing
+from .benchmark_models import random_assignment_model, network_test_models, random_model
+
+# manipulate following parameters to customize the benchmark
+RULES = [DantzigPricing, DevexPricing, SteepestEdgePricing, BlandPricing]
+
+
+def workloads():
+    return [random_assignment_model(n) for n in [8, 12, 16]] + network_test_models() + [random_model(60, 80), random_model(150, 200)]
+
+
+def run(print_function=print):
+    header = f"{'model':>22} | " + " | ".join(f"{rule.__name__:>26}" for rule in RULES)
+    print_function(header)
+    print_function(f"{'':>22} | " + " | ".join(f"{'iterations / time [s]':>26}" for _ in RULES))
+    print_function('-' * len(header))
+    for model in workloads():
+        results = []
+        for rule in RULES:
+            solver = Solver(rule())
+            start = time.perf_counter()
+            model.solve(solver)
+            results.append(f"{solver.iterations:>14} / {time.perf_counter() - start:>9.3f}")
+        print_function(f"{model.name:>22} | " + " | ".join(results))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,64 @@
+import time
+import numpy as np
+from saport.simplex.solver import Solver
+from saport.simplex.scenarios import ScenarioSolver
+from saport.simplex.expressions.expression import Expression
+from .benchmark_models import random_model
+
+# manipulate following parameters to customize the benchmark
+SCENARIOS_N = 500
+FROM_SCRATCH_N = 20
+PERTURBATIONS = [0.01, 0.1, 0.5]
+
+
+def workloads():
+    return [random_model(20, 40), random_model(60, 120)]
+
+
+def with_bounds(model, bounds):
+    for (constraint, bound) in zip(model.constraints, bounds):
+        constraint.bound = float(bound)
+    model.invalidate()
+
+
+def with_objective(model, factors):
+    model.maximize(Expression.from_vectors(model.variables, factors))
+
+
+def from_scratch(model, scenarios, change_model):
+    """
+        solves the model once for every given scenario, returns number of scenarios per second
+    """
+    start = time.perf_counter()
+    for scenario in scenarios:
+        change_model(model, scenario)
+        model.solve(Solver())
+    return len(scenarios) / (time.perf_counter() - start)
+
+
+def run(print_function=print):
+    header = f"{'model':>14} | {'scenarios':>9} | {'perturbation':>12} | {'reoptimized':>11} | {'from scratch [1/s]':>18} | {'batched [1/s]':>13}"
+    print_function(header)
+    print_function('-' * len(header))
+    for model in workloads():
+        generator = np.random.default_rng(0)
+        compiled = model.compile()
+        scenarios = ScenarioSolver(model.solve(Solver()))
+        kinds = [("bounds", compiled.b.copy(), scenarios.solve_bounds, with_bounds),
+                 ("objective", compiled.c.copy(), scenarios.solve_objectives, with_objective)]
+
+        for (kind, original, solve_batch, change_model) in kinds:
+            for perturbation in PERTURBATIONS:
+                batch = original * (1 + perturbation * generator.uniform(-1, 1, (SCENARIOS_N, len(original))))
+
+                start = time.perf_counter()
+                results = solve_batch(batch)
+                batched = SCENARIOS_N / (time.perf_counter() - start)
+
+                scratch_model = random_model(len(model.constraints), len(model.variables))
+                scratch = from_scratch(scratch_model, batch[:FROM_SCRATCH_N], change_model)
+                print_function(f"{model.name:>14} | {kind:>9} | {perturbation:>12.2f} | {results.reoptimized.sum():>11} | {scratch:>18.1f} | {batched:>13.1f}")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,32 @@
+import time
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.sparse import CSCMatrix
+from .benchmark_models import random_assignment_model
+
+# manipulate following parameters to customize the benchmark
+SIZES = [5, 10, 15, 20]
+
+
+def run(print_function=print):
+    print_function(f"{'n':>4} | {'rows x cols':>12} | {'dense [kB]':>11} | {'sparse [kB]':>11} | {'tableaux [s]':>12} | {'revised [s]':>11}")
+    for n in SIZES:
+        model = random_assignment_model(n)
+        rows_n, cols_n = len(model.constraints), len(model.variables)
+        sparse = CSCMatrix.from_expressions([c.expression for c in model.constraints], cols_n)
+        sparse_bytes = sparse.data.nbytes + sparse.indices.nbytes + sparse.indptr.nbytes
+        dense_bytes = rows_n * cols_n * 8
+
+        start = time.perf_counter()
+        expected = model.solve(Solver()).objective_value()
+        tableaux_time = time.perf_counter() - start
+        start = time.perf_counter()
+        value = model.solve(RevisedSolver()).objective_value()
+        revised_time = time.perf_counter() - start
+        assert abs(value - expected) < 1e-6, "revised solver found a different optimum"
+
+        print_function(f"{n:>4} | {f'{rows_n}x{cols_n}':>12} | {dense_bytes / 1024:>11.1f} | {sparse_bytes / 1024:>11.1f} | {tableaux_time:>12.3f} | {revised_time:>11.3f}")
+
+
+if __name__ == '__main__':
+    run()
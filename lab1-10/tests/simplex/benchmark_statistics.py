@@ -0,0 +1,44 @@
+import io
+import time
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.statistics import JSONLTraceWriter
+from .benchmark_models import random_model, random_assignment_model
+
+# manipulate following parameters to customize the benchmark
+REPEATS = 5
+
+
+def workloads():
+    return [random_model(40, 80), random_model(80, 160), random_assignment_model(12)]
+
+
+def best_time(solver_factory, model):
+    """
+        returns the best time of a few solves, the solver is created anew for every solve
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        solver = solver_factory()
+        start = time.perf_counter()
+        solver.solve(model)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(print_function=print):
+    header = f"{'model':>16} | {'solver':>13} | {'iterations':>10} | {'disabled [ms]':>13} | {'statistics [ms]':>15} | {'trace [ms]':>10}"
+    print_function(header)
+    print_function('-' * len(header))
+    for model in workloads():
+        for solver_class in [Solver, RevisedSolver]:
+            statistics = solver_class(statistics=True).solve(model).statistics
+            disabled = best_time(lambda: solver_class(), model)
+            enabled = best_time(lambda: solver_class(statistics=True), model)
+            traced = best_time(lambda: solver_class(statistics=True, hooks=[JSONLTraceWriter(io.StringIO())]), model)
+            print_function(f"{model.name:>16} | {solver_class.__name__:>13} | {statistics.iterations():>10} | {disabled * 1000:>13.2f} | {enabled * 1000:>15.2f} | {traced * 1000:>10.2f}")
+            print_function(str(statistics))
+
+
+if __name__ == '__main__':
+    run()
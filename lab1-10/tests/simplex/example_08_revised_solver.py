@@ -0,0 +1,41 @@
+import logging
+import math
+import numpy as np
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.analyser import Analyser
+from . import example_models
+
+def run():
+    tolerance = 0.000001
+    for create_model in example_models.ALL:
+        model = create_model()
+        expected = model.solve(Solver())
+        solution = model.solve(RevisedSolver(refactorization_frequency = 2))
+        assert not solution.keeps_tableaux() and solution.initial_tableaux == None, f"revised solver shouldn't build the tableaux of {model.name} during the solve"
+
+        assert solution.is_feasible == expected.is_feasible, f"revised solver got feasibility of {model.name} wrong"
+        assert solution.is_bounded == expected.is_bounded, f"revised solver got boundedness of {model.name} wrong"
+        if expected.assignment == None:
+            continue
+
+        assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=tolerance), f"revised solver found a different optimum for {model.name}"
+        for (value, expected_value) in zip(solution.assignment, expected.assignment):
+            assert math.isclose(value, expected_value, abs_tol=tolerance), f"revised solver found a different assignment for {model.name}"
+
+        analyser = Analyser()
+        ranges = analyser.analyse(solution)
+        expected_ranges = analyser.analyse(expected)
+        for name in expected_ranges:
+            for (bounds, expected_bounds) in zip(ranges[name], expected_ranges[name]):
+                assert all(math.isclose(b, e, abs_tol=tolerance) for (b, e) in zip(bounds, expected_bounds)), f"revised solver tableaux gives a different analysis for {model.name}"
+
+        # the tableaux built on the first access is the one the solver would build when the solve ends
+        kept = create_model().solve(RevisedSolver(keep_tableaux = True))
+        assert np.allclose(solution.tableaux.table, kept.tableaux.table) and kept.initial_tableaux != None, f"revised solver built a different tableaux for {model.name}"
+
+    logging.info("Congratulations! The revised simplex agrees with the tableaux one :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,37 @@
+import logging
+import numpy as np
+from saport.simplex.sparse import CSCMatrix
+from . import example_models
+
+def run():
+    generator = np.random.default_rng(0)
+    dense = generator.integers(-3, 4, (7, 11)) * (generator.random((7, 11)) < 0.3)
+    dense[:, 4] = 0.0
+    matrix = CSCMatrix.from_dense(dense)
+
+    assert matrix.nnz() == np.count_nonzero(dense), "sparse matrix should store only the nonzero entries"
+    assert np.array_equal(matrix.to_dense(), dense), "sparse matrix doesn't reproduce the dense one"
+    assert np.array_equal(matrix.column(3), dense[:, 3]), "column extraction is incorrect"
+    assert np.array_equal(matrix.columns([4, 0, 10]), dense[:, [4, 0, 10]]), "columns extraction is incorrect"
+
+    x = generator.random(11)
+    y = generator.random(7)
+    assert np.allclose(matrix.matvec(x), dense @ x), "A x is incorrect"
+    assert np.allclose(matrix.rmatvec(y), y @ dense), "y^T A is incorrect"
+    assert np.array_equal(matrix.hstack(matrix).to_dense(), np.hstack([dense, dense])), "hstack is incorrect"
+
+    repeated = CSCMatrix.from_triplets((2, 2), [0, 0, 1, 1], [1, 1, 0, 0], [2.0, 3.0, 1.0, -1.0])
+    assert repeated.nnz() == 1 and repeated.to_dense()[0, 1] == 5.0, "repeated entries should be summed up and zeros dropped"
+
+    for create_model in example_models.ALL:
+        model = create_model()
+        expressions = [c.expression for c in model.constraints]
+        matrix = CSCMatrix.from_expressions(expressions, len(model.variables))
+        expected = np.array([e.factors(model) for e in expressions])
+        assert np.array_equal(matrix.to_dense(), expected), f"sparse constraint matrix of {model.name} is incorrect"
+
+    logging.info("Congratulations! The sparse matrix seems to work correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
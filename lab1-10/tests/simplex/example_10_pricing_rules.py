@@ -0,0 +1,63 @@
+import logging
+import math
+import numpy as np
+from saport.simplex.solver import Solver
+from saport.simplex.tableaux import Tableaux
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.pricing import DantzigPricing, BlandPricing, DevexPricing, SteepestEdgePricing, PartialPricing
+from . import example_models
+from .benchmark_models import random_assignment_model
+
+def pivots(solver, model):
+    events = []
+    solver.hooks.append(events.append)
+    model.solve(solver)
+    return [(event.phase, event.entering, event.leaving) for event in events]
+
+def run():
+    solvers = [
+        ("bland", lambda: Solver(BlandPricing())),
+        ("devex", lambda: Solver(DevexPricing())),
+        ("steepest edge", lambda: Solver(SteepestEdgePricing())),
+        ("revised bland", lambda: RevisedSolver(BlandPricing())),
+        ("partial", lambda: Solver(PartialPricing(block_size = 2, candidates_n = 1))),
+        ("revised partial", lambda: RevisedSolver(PartialPricing(block_size = 2, candidates_n = 1)))
+    ]
+    for create_model in example_models.ALL:
+        model = create_model()
+        expected = model.solve(Solver(DantzigPricing()))
+        for (name, create_solver) in solvers:
+            solution = model.solve(create_solver())
+            assert solution.is_feasible == expected.is_feasible, f"{name} pricing got feasibility of {model.name} wrong"
+            assert solution.is_bounded == expected.is_bounded, f"{name} pricing got boundedness of {model.name} wrong"
+            if expected.assignment != None:
+                assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=0.000001), f"{name} pricing found a different optimum for {model.name}"
+
+    generator = np.random.default_rng(0)
+    table = np.hstack([generator.uniform(-1, 1, (6, 8)), np.vstack([np.zeros(5), np.eye(5)]), generator.uniform(1, 2, (6, 1))])
+    tableaux = Tableaux(None, table)
+    pricing = SteepestEdgePricing()
+    pricing.reset(tableaux)
+    for (row, col) in [(1, 0), (3, 2), (2, 5), (5, 1)]:
+        pricing.update(tableaux, row, col)
+        tableaux.pivot(row, col)
+        nonbasic = [j for j in range(13) if j not in tableaux.extract_basis()]
+        exact = 1.0 + (tableaux.table[1:, :-1] ** 2).sum(axis=0)
+        assert np.allclose(pricing.weights[nonbasic], exact[nonbasic]), "steepest edge weights should match the recomputed norms"
+
+    # the round-off entry of the first row can't be a pivot, the quotients of the other rows are a tie
+    table = np.array([[-1.0, 0, 0, 0, 0], [1e-12, 0, 0, 1, 0], [1, 0, 1, 0, 1], [3, 1, 0, 0, 3 + 3e-13]])
+    assert BlandPricing().choose_leaving_variable(Tableaux(None, table), 0) == 3, "bland's ratio test should ignore the round-off and break the ties by the smallest index"
+
+    # the degenerate pivots of the boxed assignment variables: both solvers follow the Bland's rule in the bounded ratio test,
+    # also after falling back to it when the pivots stall
+    for (pricing, limit) in [(BlandPricing, 50), (DantzigPricing, 0)]:
+        tableaux_solver, revised_solver = Solver(pricing()), RevisedSolver(pricing())
+        tableaux_solver.degenerate_pivots_limit = revised_solver.degenerate_pivots_limit = limit
+        assert pivots(tableaux_solver, random_assignment_model(8)) == pivots(revised_solver, random_assignment_model(8)), f"revised solver should choose the same pivots as the tableaux one ({pricing.__name__}, limit {limit})"
+
+    logging.info("Congratulations! All the pricing rules find the same optima :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
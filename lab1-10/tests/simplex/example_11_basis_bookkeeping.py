@@ -0,0 +1,39 @@
+import logging
+import numpy as np
+from saport.simplex.tableaux import Tableaux
+from . import example_models
+
+def run():
+    for create_model in example_models.ALL:
+        solution = create_model().solve()
+        for tableaux in [solution.initial_tableaux, solution.tableaux]:
+            assert tableaux.check_basis(), f"tracked basis of {solution.model.name} doesn't correspond to the unit columns"
+            found = tableaux.find_basis()
+            assert all(b == f for (b, f) in zip(tableaux.basis, found) if f >= 0), f"tracked basis of {solution.model.name} differs from the scanned one"
+
+    table = np.array([
+        [-3.0, -2.0, 0.0, 0.0, 0.0],
+        [ 1.0,  1.0, 1.0, 0.0, 4.0],
+        [ 1.0,  3.0, 0.0, 1.0, 6.0]
+    ])
+    tableaux = Tableaux(None, table)
+    assert tableaux.extract_basis() == [2, 3], "initial basis should be found by the scan"
+
+    tableaux.pivot(1, 0)
+    assert tableaux.extract_basis() == [0, 3], "pivot should update the basis"
+    assert tableaux.extract_assignment() == [4.0, 0.0, 0.0, 2.0], "assignment should be read from the basis"
+
+    tableaux.table[1:, 0] += 1e-13
+    assert tableaux.find_basis()[0] == -1, "scan with exact comparisons misses the column after round-off"
+    assert tableaux.check_basis(), "consistency check should tolerate the round-off"
+    assert tableaux.extract_basis() == [0, 3], "tracked basis shouldn't be affected by the round-off"
+
+    tableaux = example_models.ALL[0]().solve().tableaux.copy()
+    tableaux.basis[0] = -1
+    assert str(tableaux).splitlines()[2].split(" | ")[0].strip() == "-", "row without a basic variable should be printed with a placeholder"
+
+    logging.info("Congratulations! The basis is tracked correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
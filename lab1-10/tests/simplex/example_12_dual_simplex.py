@@ -0,0 +1,103 @@
+import logging
+import math
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver, Formulation
+from saport.simplex.presolve import Presolver
+from saport.simplex.dual_solver import DualSimplexSolver
+from saport.simplex.tableaux import Tableaux
+from saport.simplex.analyser import Analyser
+from . import example_models
+
+def assert_same_solution(reoptimized, expected, name):
+    assert reoptimized.is_feasible == expected.is_feasible, f"dual simplex got a different feasibility for {name}"
+    assert reoptimized.is_bounded == expected.is_bounded, f"dual simplex got a different boundedness for {name}"
+    if expected.assignment != None:
+        assert math.isclose(reoptimized.objective_value(), expected.objective_value(), abs_tol=1e-6), f"dual simplex got a different objective for {name}"
+
+def cuts(model, solution):
+    for var in model.variables:
+        value = solution.value(var)
+        yield lambda m, var=var, value=value: m.variables[var.index] <= math.floor(value / 2)
+        yield lambda m, var=var, value=value: m.variables[var.index] >= math.floor(value) + 1
+        # Variable overrides __eq__ for hashing, so the equality constraint needs an atom
+        yield lambda m, var=var, value=value: 1 * m.variables[var.index] == value / 3
+
+def run():
+    for create_model in example_models.ALL:
+        model = create_model()
+        solution = model.solve()
+        if solution.assignment == None:
+            continue
+        for create_cut in cuts(model, solution):
+            reoptimized = DualSimplexSolver().reoptimize(solution, create_cut(solution.model))
+
+            expected_model = create_model()
+            expected_model.add_constraint(create_cut(expected_model))
+            assert_same_solution(reoptimized, expected_model.solve(), model.name)
+
+            # the parent solution has to stay untouched, it's reused by the other branch
+            again = DualSimplexSolver().reoptimize(solution, create_cut(solution.model))
+            assert_same_solution(again, reoptimized, model.name)
+
+    # the reoptimized model has its own matrix form, so the analysis sees the new constraint
+    for create_model in [example_models.solvable_01, example_models.dual_06, example_models.cost_sensitivity_07]:
+        model = create_model()
+        model.compile()
+        reoptimized = DualSimplexSolver().reoptimize(model.solve(), model.variables[1] >= 1)
+        expected_model = create_model()
+        expected_model.add_constraint(expected_model.variables[1] >= 1)
+        assert reoptimized.model.compile().shape == expected_model.compile().shape, f"reoptimized {model.name} should be compiled with the new constraint"
+        results, expected = Analyser().analyse(reoptimized), Analyser().analyse(expected_model.solve())
+        for name in expected:
+            assert np.allclose(np.array(results[name], dtype=float), np.array(expected[name], dtype=float)), f"{name} of the reoptimized {model.name} seems to be incorrect"
+    model = example_models.unbounded_03()
+    model.compile()
+    reoptimized = DualSimplexSolver().reoptimize(model.solve(), model.variables[0] + model.variables[1] <= 5)
+    assert reoptimized.is_bounded and math.isclose(reoptimized.objective_value(), 40.0), "unbounded parent should be solved again with the new constraint"
+
+    # the tableaux of a presolved solution or of the dual formulation doesn't describe the model, it's solved again
+    for solver in [Solver(presolver=Presolver()), Solver(formulation=Formulation.DUAL)]:
+        model = Model("reduced_parent")
+        x, y, z = model.create_variable("x"), model.create_variable("y"), model.create_variable("z")
+        model.add_constraint(x <= 4)
+        model.add_constraint(x + 2*y <= 9)
+        model.add_constraint(3*x + y <= 14)
+        model.maximize(2*x + 3*y - z)
+        reoptimized = DualSimplexSolver().reoptimize(model.solve(solver), y + z >= 5)
+        assert math.isclose(reoptimized.objective_value(), 13.0, abs_tol=1e-6), "reduced parent should be solved again with the new constraint"
+
+    model = Model("dual_feasible_min")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(x1 + x2 >= 4)
+    model.add_constraint(x1 + 3*x2 >= 6)
+    model.minimize(2 * x1 + 3 * x2)
+    solver = DualSimplexSolver()
+    solution = model.solve(solver)
+    assert_same_solution(solution, model.solve(Solver()), model.name)
+    assert solver.iterations == 2, "starting from the slack basis, dual simplex should need only two pivots"
+
+    # max -x1 - 2x2, x1 + x2 >= 3, x1 <= 1, x2 <= 5: x1 is flipped to its upper bound and x2 enters in a single pivot
+    table = np.array([
+        [ 1.0,  2.0, 0.0,  0.0],
+        [-1.0, -1.0, 1.0, -3.0]
+    ])
+    tableaux = Tableaux(None, table.copy())
+    tableaux.upper_bounds[:2] = [1.0, 5.0]
+    solver = DualSimplexSolver()
+    assert solver.optimize(tableaux), "bounded problem should be feasible"
+    assert solver.iterations == 1, "bound flipping ratio test should need a single pivot"
+    assert np.allclose(tableaux.extract_assignment(), [1.0, 2.0, 0.0]), "x1 should be flipped to its upper bound"
+    assert math.isclose(tableaux.cost(), -5.0), "objective should be the same as with explicit bound constraints"
+
+    tableaux = Tableaux(None, table.copy())
+    tableaux.table[1, -1] = -7.0
+    tableaux.upper_bounds[:2] = [1.0, 5.0]
+    assert not DualSimplexSolver().optimize(tableaux), "x1 + x2 >= 7 can't be satisfied with x1 <= 1 and x2 <= 5"
+
+    logging.info("Congratulations! The dual simplex reoptimizes correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,36 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+
+def run():
+    model = Model("example_13_compiled_model")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + 2*x2 + x1 <= 10)
+    model.add_constraint(x3 - x2 >= 1)
+    model.minimize(3*x1 + x3)
+
+    compiled = model.compile()
+    assert np.array_equal(compiled.A, [[2.0, 2.0, 0.0], [0.0, -1.0, 1.0]]), "repeated variables should be summed up"
+    assert np.array_equal(compiled.b, [10.0, 1.0]), "bounds should be compiled in the order of constraints"
+    assert np.array_equal(compiled.sense, [-1, 1]), "constraint types should be compiled as LE = -1 and GE = 1"
+    assert np.array_equal(compiled.c, [3.0, 0.0, 1.0]), "objective factors should be compiled as given"
+    assert np.array_equal(compiled.sparse_A.to_dense(), compiled.A), "sparse and dense matrices should be the same"
+    assert np.array_equal(compiled.lower_bounds, [0.0, 0.0, 0.0]), "variables should be nonnegative"
+    assert model.compile() is compiled, "compiled form should be cached"
+
+    model.add_constraint(x1 + x2 + x3 == 4)
+    assert model.compile() is not compiled, "adding a constraint should invalidate the compiled form"
+    assert model.compile().shape == (3, 3), "recompiled model should contain the new constraint"
+
+    standard = model.translate_to_standard_form().compile()
+    assert np.array_equal(standard.A[1], [0.0, 1.0, -1.0]), "GE constraint should be inverted in the standard form"
+    assert np.array_equal(standard.c, [-3.0, 0.0, -1.0]), "MIN objective should be inverted in the standard form"
+    assert np.array_equal(model.compile().c, [3.0, 0.0, 1.0]), "translation shouldn't affect the original model"
+
+    logging.info("Congratulations! The model is compiled correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,52 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.expressions.expression import Expression
+
+def run():
+    model = Model("example_14_expressions")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    expression = 2*x1 + 3*x2 + x1
+    assert expression.coefficients == {0: 3.0, 1: 3.0}, "like terms should be merged on insert"
+    assert [atom.var for atom in expression.atoms] == [x1, x2], "atoms should be created one per variable"
+    assert expression.factors(model) == [3.0, 3.0, 0.0], "factors should correspond to the variables in the model"
+
+    accumulated = Expression()
+    alias = accumulated
+    for var in model.variables:
+        accumulated += 2 * var
+    assert alias is accumulated and accumulated.coefficients == {0: 2.0, 1: 2.0, 2: 2.0}, "+= should add the atoms in place"
+
+    atom = 2 * x1
+    total = atom
+    total += x2
+    assert atom.factor == 2.0 and atom.coefficients == {0: 2.0}, "+= on an atom shouldn't modify it"
+    single = x3
+    single += x1
+    assert x3.coefficients == {2: 1.0}, "+= on a variable shouldn't modify it"
+
+    # the sums built one on another share the chain of terms, each one sees only its own terms
+    partial = sum(model.variables[:2], Expression())
+    extended, branched = partial + x3, partial + 2*x1
+    partial += x2
+    assert sum(model.variables, Expression()).coefficients == {0: 1.0, 1: 1.0, 2: 1.0}, "sum should add up the variables"
+    assert extended.coefficients == {0: 1.0, 1: 1.0, 2: 1.0} and branched.coefficients == {0: 3.0, 1: 1.0}, "sums sharing the terms shouldn't affect each other"
+    assert partial.coefficients == {0: 1.0, 1: 2.0} and (extended + partial).coefficients == {0: 2.0, 1: 3.0, 2: 1.0}, "+= on a summed expression shouldn't change the sums built from it"
+
+    difference = x1 - (2*x2 + x3)
+    assert difference.coefficients == {0: 1.0, 1: -2.0, 2: 1.0}, "subtraction should invert only the first atom of the second polynomial"
+    assert (x1 + x2).simplify().coefficients == {0: 1.0, 1: 1.0}, "simplify should keep the factors"
+    assert list((x3 + x1).simplify().coefficients) == [0, 2], "simplify should sort the atoms by the variable index"
+    assert expression.evaluate([1.0, 2.0, 3.0]) == 9.0, "evaluation is incorrect"
+    assert str(x1 - 2*x2 + 1.5*x3) == "x1 - 2.0*x2 + 1.5*x3", "printing is incorrect"
+
+    for obj in [x1, 2*x1, expression]:
+        assert not hasattr(obj, "__dict__"), "expressions, atoms and variables should use slots"
+
+    logging.info("Congratulations! The expressions work correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
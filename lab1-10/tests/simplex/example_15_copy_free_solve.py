@@ -0,0 +1,35 @@
+import copy
+import logging
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.dual_solver import DualSimplexSolver
+from . import example_models
+
+def forbidden_deepcopy(*args, **kwargs):
+    raise AssertionError("solve path shouldn't deep copy anything")
+
+def run():
+    original_deepcopy = copy.deepcopy
+    copy.deepcopy = forbidden_deepcopy
+    try:
+        for create_model in example_models.ALL:
+            for solver in [Solver(), RevisedSolver(keep_tableaux=True), DualSimplexSolver()]:
+                model = create_model()
+                text = str(model)
+                constraints = list(model.constraints)
+
+                solution = model.solve(solver)
+
+                assert solution.model is model, "solution should refer to the solved model"
+                assert str(model) == text, f"solving {model.name} shouldn't modify the model"
+                assert all(c is o for (c, o) in zip(model.constraints, constraints)) and len(model.constraints) == len(constraints), f"solving {model.name} shouldn't replace the constraints"
+                if solution.assignment != None:
+                    assert solution.initial_tableaux.table is not solution.tableaux.table, "initial tableaux should be a separate table"
+    finally:
+        copy.deepcopy = original_deepcopy
+
+    logging.info("Congratulations! Models are solved without copying them :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,70 @@
+import logging
+import math
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.presolve import Presolver
+from . import example_models
+
+def create_reducible_model():
+    model = Model("example_16_presolve")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    x4 = model.create_variable("x4")
+    model.add_constraint(x1 + x2 + x3 <= 4)
+    model.add_constraint(2*x1 + 2*x2 + 2*x3 <= 10)
+    model.add_constraint(1*x1 <= 3)
+    model.add_constraint(1*x2 >= 0.5)
+    model.add_constraint(0*x1 <= 5)
+    model.maximize(3*x1 + 2*x2 + x3 - x4)
+    return model
+
+def run():
+    model = create_reducible_model()
+    presolver = Presolver()
+    reduced_model = presolver.presolve(model)
+    report = presolver.report
+    assert report.original_shape == (5, 4), "report should keep the shape of the original model"
+    assert report.removed_rows == {"duplicate": 1, "singleton": 2, "empty": 1}, "duplicate, singleton and empty constraints should be removed"
+    assert report.removed_columns == {"empty": 1}, "unused variable should be removed"
+    assert report.reduced_shape == (1, 3), "only the first constraint should be left"
+    assert len(reduced_model.constraints) == 1, "reduced model should contain only the remaining constraint"
+    assert (reduced_model.variables[0].upper, reduced_model.variables[1].lower) == (3.0, 0.5), "singleton constraints should become variable bounds"
+
+    solution = model.solve(Solver(presolver=presolver))
+    expected = create_reducible_model().solve()
+    assert np.allclose(solution.assignment, [3.0, 1.0, 0.0, 0.0]), "postsolve should map the solution back to the original variables"
+    assert math.isclose(solution.objective_value(), expected.objective_value()), "presolve shouldn't change the optimal objective"
+
+    # only the first constraint is tight in the reduced model (y = 2), x1 sits at its upper bound with the reduced cost 3 - 2 = 1
+    duals = presolver.postsolve_duals([2.0], solution.assignment)
+    assert np.allclose(duals, [2.0, 0.0, 1.0, 0.0, 0.0]), "bound constraint should take over the reduced cost of x1"
+
+    model = Model("example_16_presolve_unfeasible")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(x1 + x2 <= 10)
+    model.add_constraint(2*x1 >= 4)
+    model.add_constraint(3*x1 <= 3)
+    model.maximize(x1 + x2)
+    presolver = Presolver()
+    assert presolver.presolve(model) == None, "contradicting bounds should be detected by the presolve"
+    assert not presolver.report.is_feasible, "report should mark the model as unfeasible"
+    assert not model.solve(Solver(presolver=presolver)).is_feasible, "solver shouldn't start the simplex on an unfeasible model"
+
+    for create_model in example_models.ALL:
+        for solver in [Solver, RevisedSolver]:
+            solution = create_model().solve(solver(presolver=Presolver()))
+            expected = create_model().solve(solver())
+            assert solution.is_feasible == expected.is_feasible, f"presolve changed the feasibility of {expected.model.name}"
+            assert solution.is_bounded == expected.is_bounded, f"presolve changed the boundedness of {expected.model.name}"
+            if expected.assignment != None:
+                assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=1e-6), f"presolve changed the objective of {expected.model.name}"
+
+    logging.info("Congratulations! The presolve reduces the models correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
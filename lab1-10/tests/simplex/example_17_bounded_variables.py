@@ -0,0 +1,81 @@
+import logging
+import math
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.dual_solver import DualSimplexSolver
+from saport.simplex.analyser import Analyser
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+
+SOLVERS = [Solver, RevisedSolver, DualSimplexSolver]
+
+def create_model():
+    model = Model("example_17_bounded_variables")
+    x1 = model.create_variable("x1", 1, 3)
+    x2 = model.create_variable("x2", upper=2)
+    x3 = model.create_variable("x3", -2, 4)
+    model.add_constraint(x1 + x2 + x3 <= 6)
+    model.add_constraint(x1 - x3 >= -1)
+    model.maximize(3*x1 + 2*x2 - x3)
+    return model
+
+def run():
+    for solver in SOLVERS:
+        model = create_model()
+        solution = model.solve(solver())
+        assert np.allclose(solution.assignment, [3.0, 2.0, -2.0]), f"{solver.__name__} should respect the lower and upper bounds"
+        assert math.isclose(solution.objective_value(), 15.0), f"{solver.__name__} found a wrong objective value"
+        assert solution.tableaux.table.shape[0] == 3, f"{solver.__name__} shouldn't add rows for the variable bounds"
+
+    model = Model("example_17_binary_relaxation")
+    xs = [model.create_variable(f"x{i}", upper=1) for i in range(4)]
+    model.add_constraint(5*xs[0] + 4*xs[1] + 3*xs[2] + 2*xs[3] <= 10)
+    model.maximize(10*xs[0] + 7*xs[1] + 4*xs[2] + 2*xs[3])
+    for solver in SOLVERS:
+        solution = model.solve(solver())
+        assert np.allclose(solution.assignment, [1.0, 1.0, 1 / 3, 0.0]), f"{solver.__name__} should flip the boxed variables to their upper bounds"
+        assert solution.tableaux.table.shape == (2, 6), f"{solver.__name__} tableaux should contain only the capacity row"
+        ranges = Analyser().analyse(solution)[ObjectiveSensitivityAnalyser.name()]
+        assert np.allclose(ranges[0], (20 / 3, np.inf)), f"{solver.__name__}: x0 at its upper bound should stay there while c0 >= 20/3"
+
+    reoptimized = DualSimplexSolver().reoptimize(model.solve(Solver()), xs[0] + xs[2] >= 2)
+    model.add_constraint(xs[0] + xs[2] >= 2)
+    assert math.isclose(reoptimized.objective_value(), model.solve(Solver()).objective_value()), "reoptimization should work with the bounded variables"
+
+    # x1 is basic at 125, but its column is complemented (150 - x1) after it had reached the upper bound on the way
+    model = Model("example_17_complemented_basic")
+    x1, x2 = model.create_variable("x1", upper=150), model.create_variable("x2", upper=250)
+    model.add_constraint(2*x1 + x2 <= 500)
+    model.maximize(8*x1 + 5*x2)
+    solution = model.solve(Solver())
+    ranges = ObjectiveSensitivityAnalyser().analyse(solution)
+    assert solution.tableaux.complemented[0] and np.allclose(ranges[0], (0.0, 10.0)), "range of the complemented basic variable should be the same as of the constraint x1 <= 150"
+
+    model = Model("example_17_unfeasible_bounds")
+    x1 = model.create_variable("x1", upper=2)
+    x2 = model.create_variable("x2", upper=2)
+    model.add_constraint(x1 + x2 >= 5)
+    model.maximize(x1 + x2)
+    for solver in SOLVERS:
+        assert not model.solve(solver()).is_feasible, f"{solver.__name__} should detect that the bounds make the model unfeasible"
+
+    model = Model("example_17_unbounded")
+    x1 = model.create_variable("x1", upper=2)
+    x2 = model.create_variable("x2", lower=1)
+    model.add_constraint(x1 - x2 <= 1)
+    model.maximize(x1 + x2)
+    for solver in SOLVERS:
+        assert not model.solve(solver()).is_bounded, f"{solver.__name__} should detect that a variable without the upper bound makes the model unbounded"
+
+    try:
+        model.create_variable("x3", 2, 1)
+        assert False, "variable with lower bound greater than the upper one shouldn't be created"
+    except Exception as e:
+        assert "greater than its upper bound" in str(e), "wrong exception raised for the bounds"
+
+    logging.info("Congratulations! The variable bounds are handled correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,72 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.expressions.expression import Expression
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.presolve import Presolver
+from saport.simplex.scenarios import ScenarioSolver
+from .example_models import cost_sensitivity_07
+
+def solve_from_scratch(bounds = None, factors = None):
+    model = cost_sensitivity_07()
+    if bounds is not None:
+        for (constraint, bound) in zip(model.constraints, bounds):
+            constraint.bound = float(bound)
+    if factors is not None:
+        model.maximize(Expression.from_vectors(model.variables, factors))
+    model.invalidate()
+    return model.solve()
+
+def assert_same_results(results, expected_solutions, kind):
+    for (k, expected) in enumerate(expected_solutions):
+        assert results.is_feasible[k] == expected.is_feasible, f"{kind} scenario {k} has a wrong feasibility"
+        if expected.assignment != None:
+            assert np.isclose(results.objective_values[k], expected.objective_value()), f"{kind} scenario {k} has a wrong objective value"
+            assert np.allclose(results.assignments[k], expected.assignment), f"{kind} scenario {k} has a wrong assignment"
+
+def run():
+    for solver in [Solver, RevisedSolver]:
+        solution = cost_sensitivity_07().solve(solver())
+        scenarios = ScenarioSolver(solution)
+
+        bounds = np.array([[60, 150, 8], [63, 150, 8], [60, 300, 8], [60, 150, -1]])
+        results = scenarios.solve_bounds(bounds)
+        assert_same_results(results, [solve_from_scratch(bounds=b) for b in bounds], "bounds")
+        assert list(results.reoptimized) == [False, False, True, True], "only the scenarios breaking the feasibility of the basis should be reoptimized"
+        assert list(results.is_feasible) == [True, True, True, False], "x1 <= -1 should make the model unfeasible"
+
+        factors = np.array([[5, 4.5, 6], [5, 4.6, 6], [1, 9, 1]])
+        results = scenarios.solve_objectives(factors)
+        assert_same_results(results, [solve_from_scratch(factors=f) for f in factors], "objective")
+        assert list(results.reoptimized) == [False, False, True], "only the scenarios breaking the optimality of the basis should be reoptimized"
+
+    model = Model("example_18_unbounded_scenario")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(x1 - x2 <= 3)
+    model.add_constraint(x1 <= 4)
+    model.maximize(x1)
+    results = ScenarioSolver(model.solve()).solve_objectives([[1, 0], [-1, -1], [0, 1]])
+    assert list(results.is_bounded) == [True, True, False], "x2 can grow without any limit"
+    assert list(results.objective_values[:2]) == [4.0, 0.0], "objective values should be computed for the new objectives"
+
+    # the second presolve removes only the unused variable, the constraints stay the same
+    model = Model("example_18_unused")
+    x, y, unused = model.create_variable("x"), model.create_variable("y"), model.create_variable("unused")
+    model.add_constraint(x + 2*y <= 9)
+    model.add_constraint(3*x + y <= 14)
+    model.maximize(2*x + 3*y - unused)
+    for solution in [cost_sensitivity_07().solve(Solver(presolver=Presolver())), model.solve(Solver(presolver=Presolver()))]:
+        message = None
+        try:
+            ScenarioSolver(solution)
+        except Exception as e:
+            message = str(e)
+        assert message != None and "presolved" in message, "presolved solution shouldn't be accepted"
+
+    logging.info("Congratulations! The scenarios are solved correctly from the final basis :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,60 @@
+import logging
+import math
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.presolve import Presolver
+from saport.simplex.analyser import Analyser
+from saport.simplex.analysis_tools.rhs_sensitivity import RHSSensitivityAnalyser
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from . import example_models
+
+def run():
+    model = example_models.cost_sensitivity_07()
+    solution = model.solve()
+    analyser = Analyser()
+    analysis_results = analyser.analyse(solution)
+    analyser.interpret_results(solution, analysis_results, logging.info)
+
+    rhs_analysis_results = analysis_results[RHSSensitivityAnalyser.name()]
+    expected_results = [(0.786, 37.5, 65.5), (0.029, 128.0, 240.0), (0.0, 6.429, float("inf"))]
+    tolerance = 0.001
+    for (i, result) in enumerate(rhs_analysis_results):
+        for (value, expected, what) in zip(result, expected_results[i], ["shadow price", "lower bound", "upper bound"]):
+            assert math.isclose(value, expected, abs_tol=tolerance), f"{what} of the constraint {i} seems to be incorrect, expected {expected}, got {value}"
+
+    # shadow prices should predict the objective after a small change of any bound (also for min models and equality constraints)
+    delta = 0.01
+    for create_model in example_models.ALL:
+        solution = create_model().solve()
+        if solution.assignment == None:
+            continue
+        for (i, (shadow_price, lower, upper)) in enumerate(RHSSensitivityAnalyser().analyse(solution)):
+            changed_model = create_model()
+            changed_model.constraints[i].bound = min(changed_model.constraints[i].bound + delta, upper)
+            changed_model.invalidate()
+            expected = solution.objective_value() + shadow_price * (changed_model.constraints[i].bound - solution.model.constraints[i].bound)
+            assert math.isclose(changed_model.solve().objective_value(), expected, abs_tol=1e-6), f"shadow price of the constraint {i} in {solution.model.name} seems to be incorrect"
+
+    # the tableaux of a presolved solution refers to the reduced model, the tools relying on its rows or columns are skipped
+    for create_model in [example_models.solvable_01, example_models.cost_sensitivity_07]:
+        results = Analyser().analyse(create_model().solve(Solver(presolver=Presolver())))
+        expected = Analyser().analyse(create_model().solve())
+        assert results[RHSSensitivityAnalyser.name()] == None, f"right hand side ranges of the presolved {create_model.__name__} should be skipped"
+        assert np.allclose(results[ObjectiveSensitivityAnalyser.name()], expected[ObjectiveSensitivityAnalyser.name()]), "removed constraints shouldn't change the cost ranges"
+
+    model = Model("example_19_unused")
+    x, y, unused = model.create_variable("x"), model.create_variable("y"), model.create_variable("unused")
+    model.add_constraint(x + 2*y <= 9)
+    model.add_constraint(3*x + y <= 14)
+    model.maximize(2*x + 3*y - unused)
+    solution = model.solve(Solver(presolver=Presolver()))
+    results = Analyser().analyse(solution)
+    assert all(result == None for result in results.values()), "columns of the tableaux don't correspond to the variables after the presolve"
+    Analyser().interpret_results(solution, results, logging.info)
+
+    logging.info("Congratulations! This right hand side analysis look alright :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,66 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.expressions.expression import Expression
+from saport.simplex.parametric import ParametricAnalyser, SweepEnd
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.presolve import Presolver
+from .example_models import cost_sensitivity_07
+
+def solve_from_scratch(bound = None, factor = None):
+    model = cost_sensitivity_07()
+    if bound is not None:
+        model.constraints[bound[0]].bound = float(bound[1])
+    if factor is not None:
+        factors = model.objective.expression.factors(model)
+        factors[factor[0]] = float(factor[1])
+        model.maximize(Expression.from_vectors(model.variables, factors))
+    model.invalidate()
+    return model.solve()
+
+def run():
+    for solver in [Solver, RevisedSolver]:
+        solution = cost_sensitivity_07().solve(solver())
+        analyser = ParametricAnalyser()
+
+        result = analyser.bound_sweep(solution, 0, -10, 200)
+        logging.info(f"objective as a function of the first bound:\n{result}")
+        assert np.allclose(result.breakpoints, [0, 37.5, 65.5, 104, 120, 200]), "breakpoints of the first bound seem to be incorrect"
+        assert np.allclose(result.slopes, [0.9, 0.786, 0.682, 0.5, 0.0], atol=0.001), "slopes of the first bound seem to be incorrect"
+        assert result.lower_end == SweepEnd.UNFEASIBLE and result.upper_end == SweepEnd.REACHED, "negative bound should make the model unfeasible"
+        assert analyser.iterations == 4, "every breakpoint should cost a single pivot"
+        for bound in np.linspace(0, 200, 41):
+            expected = solve_from_scratch(bound=(0, bound)).objective_value()
+            assert np.isclose(result.value(bound), expected), f"objective for the first bound {bound} seems to be incorrect"
+        assert np.isnan(result.value(-5)), "there is no objective value for the unfeasible model"
+
+        result = analyser.objective_sweep(solution, solution.model.variables[1], -20, 30)
+        logging.info(f"objective as a function of the x2 factor:\n{result}")
+        assert np.allclose(result.breakpoints, [-20, 3.75, 4.167, 6.5, 12, 30], atol=0.001), "breakpoints of the x2 factor seem to be incorrect"
+        assert np.allclose(result.slopes, [0.0, 2.4, 4.286, 5.455, 7.5], atol=0.001), "slopes of the x2 factor (i.e. values of x2) seem to be incorrect"
+        for factor in np.linspace(-20, 30, 51):
+            expected = solve_from_scratch(factor=(1, factor)).objective_value()
+            assert np.isclose(result.value(factor), expected), f"objective for the x2 factor {factor} seems to be incorrect"
+
+    model = Model("example_20_unbounded_sweep")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(x1 - x2 <= 3)
+    model.add_constraint(x1 <= 4)
+    model.maximize(x1 - x2)
+    result = ParametricAnalyser().objective_sweep(model.solve(), x2, -3, 3)
+    assert np.allclose(result.breakpoints, [-3, -1, 0]) and np.allclose(result.values, [3, 3, 4]), "x2 should enter the basis at the factor -1"
+    assert result.upper_end == SweepEnd.UNBOUNDED, "positive x2 factor should make the model unbounded"
+
+    try:
+        ParametricAnalyser().bound_sweep(cost_sensitivity_07().solve(Solver(presolver=Presolver())), 0, 0, 100)
+        assert False, "presolved solution shouldn't be accepted"
+    except Exception as e:
+        assert "presolved" in str(e), "wrong exception raised for the presolved solution"
+
+    logging.info("Congratulations! The parametric sweeps find the right breakpoints :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,66 @@
+import io
+import json
+import logging
+import os
+import tempfile
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.dual_solver import DualSimplexSolver
+from saport.simplex.statistics import JSONLTraceWriter
+from .example_models import solvable_artificial_vars_04, cost_sensitivity_07
+
+def knapsack_relaxation():
+    model = Model("example_21_knapsack_relaxation")
+    xs = [model.create_variable(f"x{i}", upper=1) for i in range(4)]
+    model.add_constraint(5*xs[0] + 4*xs[1] + 3*xs[2] + 2*xs[3] <= 10)
+    model.maximize(10*xs[0] + 7*xs[1] + 4*xs[2] + 2*xs[3])
+    return model
+
+def run():
+    assert solvable_artificial_vars_04().solve().statistics == None, "statistics should be collected only on demand"
+
+    for solver_class in [Solver, RevisedSolver]:
+        events = []
+        solver = solver_class(statistics=True, hooks=[events.append])
+        solution = solver.solve(solvable_artificial_vars_04())
+        statistics = solution.statistics
+        logging.info(f"{solver_class.__name__} statistics:\n{statistics}")
+
+        assert np.allclose(solution.assignment, [0.0, 3.0]), "collecting the statistics shouldn't change the solution"
+        assert statistics.phase_one_iterations > 0, "artificial variables should require the first phase"
+        assert statistics.iterations() == len(events), "every iteration should be passed to the hooks"
+        assert [e.phase for e in events] == sorted([e.phase for e in events]), "phase one iterations should come first"
+        phase_two = [e.objective for e in events if e.phase == "phase two"]
+        assert phase_two == sorted(phase_two), "objective shouldn't decrease during the second phase"
+        assert np.isclose(statistics.objective_values[-1], solution.objective_value()), "the last iteration should reach the optimal objective"
+        assert statistics.solve_time >= statistics.pricing_time + statistics.ratio_test_time + statistics.pivot_time, "parts can't take longer than the solve"
+
+        statistics = solver_class(statistics=True).solve(knapsack_relaxation()).statistics
+        assert statistics.bound_flips > 0, "boxed variables should be moved to their upper bounds without pivots"
+
+    model = cost_sensitivity_07()
+    solver = DualSimplexSolver(statistics=True)
+    solution = solver.reoptimize(model.solve(), model.variables[2] >= 1)
+    assert solution.statistics.phase_one_iterations == solution.statistics.phase_two_iterations == 0, "optimal tableaux doesn't need the phases of the primal simplex"
+    assert solution.statistics.dual_iterations == solver.iterations > 0, "all the pivots should be reported in the dual phase"
+
+    trace = io.StringIO()
+    events = []
+    Solver(hooks=[JSONLTraceWriter(trace), events.append]).solve(cost_sensitivity_07())
+    lines = [json.loads(line) for line in trace.getvalue().splitlines()]
+    assert lines == [event.to_dict() for event in events], "trace should contain every event, one per line"
+    assert all(line["leaving"] != None and line["row"] != None for line in lines), "only bound flips have no leaving variable"
+
+    path = os.path.join(tempfile.mkdtemp(), "trace.jsonl")
+    with JSONLTraceWriter(path) as writer:
+        RevisedSolver(hooks=[writer]).solve(knapsack_relaxation())
+    with open(path) as file:
+        assert any(json.loads(line)["is_bound_flip"] for line in file), "bound flips should be traced too"
+
+    logging.info("Congratulations! The solves are instrumented correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,51 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.tableaux import Tableaux
+from saport.simplex.degeneracy import AntiDegeneracy
+from .benchmark_models import random_assignment_model, network_test_models
+from .example_models import ALL
+
+def run():
+    # among the rows tied in the ratio test the Harris test picks the largest pivot
+    model = Model("example_22_harris")
+    for name in ["x1", "x2", "s1", "s2", "s3"]:
+        model.create_variable(name)
+    table = [[-1, -1, 0, 0, 0, 0],
+             [4, 1, 1, 0, 0, 8],
+             [1, 1, 0, 1, 0, 2],
+             [1, 3, 0, 0, 1, 9]]
+    tableaux = Tableaux(model, table, [2, 3, 4])
+    anti_degeneracy = AntiDegeneracy()
+    anti_degeneracy.reset(tableaux)
+    assert tableaux.choose_leaving_variable(0) == 2, "the textbook ratio test takes the last of the tied rows"
+    assert anti_degeneracy.ratio_test(tableaux, 0) == (1, 2.0), "Harris ratio test should take the tied row with the largest pivot"
+
+    for create_model in ALL:
+        expected = create_model().solve()
+        solution = create_model().solve(Solver(anti_degeneracy=AntiDegeneracy(degenerate_pivots_trigger=1)))
+        assert (solution.is_feasible, solution.is_bounded) == (expected.is_feasible, expected.is_bounded), f"anti-degeneracy changed the result of {expected.model.name}"
+        if expected.assignment != None:
+            assert np.allclose(solution.assignment, expected.assignment), f"anti-degeneracy changed the solution of {expected.model.name}"
+
+    for model in [random_assignment_model(20)] + network_test_models():
+        plain = model.solve(Solver(statistics=True))
+        anti_degeneracy = AntiDegeneracy()
+        solution = model.solve(Solver(statistics=True, anti_degeneracy=anti_degeneracy))
+        assert np.isclose(solution.objective_value(), plain.objective_value()), f"anti-degeneracy changed the objective of {model.name}"
+        assert solution.statistics.degenerate_pivots <= plain.statistics.degenerate_pivots, f"anti-degeneracy shouldn't add degenerate pivots on {model.name}"
+        assert not anti_degeneracy.is_modified(), "perturbations should be removed from the final tableaux"
+        values = solution.tableaux.table[1:, -1]
+        assert (values >= 0).all() and np.allclose(solution.tableaux.extract_assignment()[:len(model.variables)], solution.assignment), "final tableaux should hold the exact values"
+        logging.info(f"{model.name}: degenerate pivots {plain.statistics.degenerate_pivots} -> {solution.statistics.degenerate_pivots}")
+
+    plain = random_assignment_model(20).solve(Solver(statistics=True)).statistics
+    guarded = random_assignment_model(20).solve(Solver(statistics=True, anti_degeneracy=AntiDegeneracy())).statistics
+    assert guarded.degenerate_pivots < plain.degenerate_pivots / 4, "perturbation should remove most of the degenerate pivots of the assignment problem"
+
+    logging.info("Congratulations! The degenerate pivots are avoided :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
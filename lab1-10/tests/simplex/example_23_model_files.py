@@ -0,0 +1,119 @@
+import io
+import logging
+import os
+import tempfile
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.formats import MPSFormat, LPFormat
+from .benchmark_models import random_sparse_model
+from .example_models import ALL
+
+MPS = """* fixed MPS with ranges, integer markers, an objective constant and a negative upper bound
+NAME          RANGED
+OBJSENSE
+    MAX
+ROWS
+ N  COST
+ L  LIM1
+ E  MYEQN
+COLUMNS
+    MARKER                 'MARKER'                 'INTORG'
+    X ONE     COST                 1   LIM1                 1
+    MARKER                 'MARKER'                 'INTEND'
+    Y         COST                 2   LIM1                 1
+    Y         MYEQN               -1
+    Z         COST                -1   MYEQN                1
+RHS
+    RHS       COST                10   LIM1                 4
+    RHS       MYEQN                1
+    OTHER     LIM1               100
+RANGES
+    RNG       LIM1               2.5   MYEQN               -3
+BOUNDS
+ UP BND       X ONE                4
+ LO BND       Y                   -5
+ UP BND       Y                   -1
+ BV BND       Z
+ENDATA
+"""
+
+LP = r"""\ Problem name: example_23_lp
+Maximize
+ obj: 3 x + 2 y
+   - z + 5
+Subject To
+ c1: x + y
+     + z <= 10
+ c2: 2 x - 3 >= -1
+ -x + 2y <= 8
+ c4: x - z = 0 c5: y >= 1
+Bounds
+ x <= 6
+ -2 <= z <= 3
+ 7 >= y
+Generals
+ x
+End
+"""
+
+def expected_lp():
+    model = Model("example_23_lp")
+    x = model.create_variable("x", upper=6)
+    y = model.create_variable("y", upper=7)
+    z = model.create_variable("z", lower=-2, upper=3)
+    model.add_constraint(x + y + z <= 10)
+    model.add_constraint(2*x >= 2)
+    model.add_constraint(-1*x + 2*y <= 8)
+    model.add_constraint(x - z == 0)
+    model.add_constraint(y >= 1)
+    model.maximize(3*x + 2*y - z)
+    return model
+
+def expected_mps():
+    model = Model("RANGED")
+    x = model.create_variable("X ONE", upper=4)
+    y = model.create_variable("Y", lower=-5, upper=-1)
+    z = model.create_variable("Z", upper=1)
+    model.add_constraint(x + y <= 4)
+    model.add_constraint(-1*y + z <= 1)
+    model.add_constraint(x + y >= 1.5)
+    model.add_constraint(-1*y + z >= -2)
+    model.maximize(x + 2*y - z)
+    return model
+
+def run():
+    formats = [MPSFormat(), MPSFormat(fixed=True), LPFormat()]
+    for create_model in ALL + [expected_lp]:
+        for model_format in formats:
+            file = io.StringIO()
+            model_format.write(create_model(), file)
+            file.seek(0)
+            assert create_model().is_equivalent(model_format.read(file)), f"{type(model_format).__name__} should store {create_model().name} without any change"
+
+    model = MPSFormat(fixed=True).read(io.StringIO(MPS))
+    assert model.is_equivalent(expected_mps()) and model.name == "RANGED", "ranges should become pairs of constraints, the constant and markers should be ignored"
+    assert np.isclose(model.solve().objective_value(), expected_mps().solve().objective_value()), "read model should be solvable"
+    model = LPFormat().read(io.StringIO(LP))
+    assert model.is_equivalent(expected_lp()) and model.name == "example_23_lp", "labels, constants and multiline constraints should be read correctly"
+
+    for (text, model_format) in [(MPS.replace(" UP BND       X ONE", " MI BND       X ONE"), MPSFormat(fixed=True)),
+                                 (LP.replace(" x <= 6", " x free"), LPFormat())]:
+        try:
+            model_format.read(io.StringIO(text))
+            assert False, "free variables should be rejected, the model needs finite lower bounds"
+        except Exception as e:
+            assert "finite" in str(e), f"unexpected error: {e}"
+
+    directory = tempfile.mkdtemp()
+    model = random_sparse_model(200, 400, 2000)
+    for (name, fixed) in [("sparse.mps", False), ("sparse.mps.gz", False), ("sparse_fixed.mps", True), ("sparse.lp.gz", False)]:
+        path = os.path.join(directory, name)
+        model.to_file(path, fixed)
+        assert model.is_equivalent(Model.from_file(path, fixed)), f"{name} should store the model without any change"
+    assert np.isclose(Model.from_file(path).solve().objective_value(), model.solve().objective_value()), "read model should have the same optimum"
+
+    logging.info("Congratulations! The models are read and written correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
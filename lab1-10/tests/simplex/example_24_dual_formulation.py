@@ -0,0 +1,67 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver, Formulation
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.expressions.expression import Expression
+from .example_models import ALL
+
+def equality_model():
+    model = Model("example_24_equality")
+    x0 = model.create_variable("x0")
+    x1 = model.create_variable("x1", upper=3)
+    x2 = model.create_variable("x2")
+    model.add_constraint(x0 + x1 + x2 == 10)
+    model.add_constraint(2*x0 - x1 >= 2)
+    model.maximize(3*x0 + 5*x1 - x2)
+    return model
+
+def expected_equality_dual():
+    dual = Model("example_24_equality (expected dual)")
+    y0 = dual.create_variable("y0")
+    y1 = dual.create_variable("y1")
+    y2 = dual.create_variable("y2")
+    y3 = dual.create_variable("y3")
+    dual.add_constraint(y0 - 2*y1 - y3 >= 3)
+    dual.add_constraint(y0 + y1 + y2 - y3 >= 5)
+    dual.add_constraint(y0 - y3 >= -1)
+    dual.minimize(10*y0 - 2*y1 + 3*y2 - 10*y3)
+    return dual
+
+def tall_model(rows_n, cols_n, seed = 0):
+    # e.g. a game with many more actions of the opponent: a constraint per action, a few variables
+    generator = np.random.default_rng(seed)
+    model = Model(f"example_24_tall_{rows_n}x{cols_n}")
+    variables = [model.create_variable(f"x{j}", lower=float(generator.integers(0, 2))) for j in range(cols_n)]
+    model.add_constraint(Expression.from_vectors(variables, [1.0] * cols_n) == 2 * cols_n)
+    for _ in range(rows_n):
+        model.add_constraint(Expression.from_vectors(variables, generator.integers(1, 10, cols_n)) <= float(generator.integers(100, 1000)))
+    model.maximize(Expression.from_vectors(variables, generator.integers(1, 10, cols_n)))
+    return model
+
+def run():
+    dual = equality_model().dual()
+    assert dual.is_equivalent(expected_equality_dual()), "equality should be split into two inequalities with a dual variable each"
+    assert np.isclose(dual.solve().objective_value(), equality_model().solve().objective_value()), "dual and primal should have the same value at optimum"
+
+    for create_model in ALL + [equality_model]:
+        expected = create_model().solve()
+        solution = create_model().solve(Solver(formulation=Formulation.DUAL))
+        assert (solution.is_feasible, solution.is_bounded) == (expected.is_feasible, expected.is_bounded), f"dual formulation changed the result of {expected.model.name}"
+        if expected.assignment != None:
+            assert np.isclose(solution.objective_value(), expected.objective_value()), f"dual formulation changed the objective of {expected.model.name}"
+            assert solution.tableaux == None and solution.dual_solution.model.name.endswith("(dual)"), "the tableaux belongs to the dual"
+
+    for solver_class in [Solver, RevisedSolver]:
+        model = tall_model(300, 5)
+        expected = model.solve(solver_class())
+        solution = model.solve(solver_class(formulation=Formulation.AUTO))
+        assert solution.dual_solution != None, "much smaller dual should be solved"
+        assert np.allclose(solution.assignment, expected.assignment), "assignment should be recovered from the final dual basis"
+        assert tall_model(5, 300).solve(solver_class(formulation=Formulation.AUTO)).dual_solution == None, "wide models should be solved directly"
+
+    logging.info("Congratulations! The cheaper formulation is solved correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
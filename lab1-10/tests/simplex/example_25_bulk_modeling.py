@@ -0,0 +1,64 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.sparse import CSCMatrix
+from saport.simplex.expressions.expression import Expression
+from saport.assignment.model import AssignmentProblem
+from saport.assignment.simplex_solver import Solver as AssignmentSolver
+from saport.assignment.hungarian_solver import Solver as HungarianSolver
+from saport.minimax.model import Game
+from saport.minimax.solvers.mixed import MixedSolver
+
+def scalar_model(A, b, c, upper):
+    model = Model("example_25")
+    xs = [model.create_variable(f"x{i}", upper=u) for (i, u) in enumerate(upper)]
+    for (row, bound) in zip(A, b):
+        model.add_constraint(Expression.from_vectors(xs, list(row)) <= bound)
+    model.maximize(Expression.from_vectors(xs, list(c)))
+    return model
+
+def run():
+    rng = np.random.default_rng(25)
+    A = rng.integers(0, 4, (6, 8)).astype(float)
+    b = rng.integers(5, 20, 6).astype(float)
+    c = rng.integers(1, 10, 8).astype(float)
+    upper = [3.0, np.inf] * 4
+
+    bulk = Model("example_25")
+    xs = bulk.create_variables(8, upper=upper)
+    bulk.add_constraints(A[:3] @ xs <= b[:3])
+    bulk.add_constraints(CSCMatrix.from_dense(A[3:]) @ xs <= b[3:])
+    bulk.maximize(c @ xs)
+    expected = scalar_model(A, b, c, upper)
+    assert bulk.is_equivalent(expected), "bulk constraints should build the same model as the scalar ones"
+
+    compiled = bulk.compile()
+    bulk.invalidate()
+    recompiled = bulk.compile()
+    assert np.array_equal(compiled.A, recompiled.A) and np.array_equal(compiled.b, recompiled.b) and np.array_equal(compiled.c, recompiled.c), "bulk constraints should extend the matrix form consistently with the constraints"
+    assert np.allclose(xs.values(bulk.solve().assignment), expected.solve().assignment), "bulk model should have the same solution"
+
+    assert bulk.variable("x5") is xs[5] and xs[2:4].indexes.tolist() == [2, 3], "variables should be found by their name and position"
+    for create in [lambda: bulk.create_variable("x3"), lambda: bulk.create_variables(2, ["y", "x0"]), lambda: bulk.variable("z")]:
+        try:
+            create()
+            assert False, "clashing or missing names should be reported"
+        except Exception as e:
+            assert "named" in str(e), str(e)
+
+    doubled = (A[:1] @ xs + A[:1] @ xs - A[:1] @ xs * 0.5 == 1).constraints()[0]
+    assert doubled.expression.coefficients == {i: 1.5 * A[0, i] for i in np.flatnonzero(A[0]).tolist()}, "the repeated factors should be summed up"
+
+    # more than 10 workers, so the names of the variables have to separate the indexes
+    problem = AssignmentProblem("example_25_assignment", rng.integers(1, 50, (12, 12)), True)
+    assert AssignmentSolver(problem).solve().objective == HungarianSolver(problem).solve().objective, "vectorized assignment model should find the optimal assignment"
+
+    game = Game(np.array([[3.0, -1.0, 2.0], [0.0, 4.0, -2.0]]))
+    equilibrium = MixedSolver(game).solve()
+    assert np.isclose(sum(equilibrium.strategy_a.probabilities), 1.0) and np.isclose(sum(equilibrium.strategy_b.probabilities), 1.0), "vectorized game models should give probabilities"
+
+    logging.info("Congratulations! The models are built in bulk :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
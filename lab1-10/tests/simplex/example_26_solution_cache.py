@@ -0,0 +1,89 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.cache import SolutionCache
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.solver import Solver
+from saport.simplex.presolve import Presolver
+from saport.simplex.limits import SolveLimits
+from saport.simplex.solution import Status
+from saport.simplex.analyser import Analyser
+from .example_models import unfeasible_05
+from .benchmark_models import random_sparse_model
+
+def production_model(order, prefix = "x", extra_zero = False):
+    model = Model("example_26")
+    x1 = model.create_variable(f"{prefix}1")
+    x2 = model.create_variable(f"{prefix}2", upper=3)
+    constraints = [x1 + x2 <= 4, 2*x1 + x2 <= 6, x1 + 0*x2 >= 0.5 if extra_zero else x1 >= 0.5]
+    for i in order:
+        model.add_constraint(constraints[i])
+    model.maximize(3*x1 + 2*x2)
+    return model
+
+def run():
+    cache = SolutionCache()
+    expected = production_model([0, 1, 2]).solve(cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1), "the first solve should miss and be cached"
+
+    for model in [production_model([2, 0, 1]), production_model([1, 2, 0], prefix="y"), production_model([0, 1, 2], extra_zero=True)]:
+        solution = model.solve(cache=cache)
+        assert solution.model is model and solution.assignment == expected.assignment, "identical models should get the cached solution"
+        assert np.isclose(solution.objective_value(), expected.objective_value()), "cached solution should evaluate the model's own objective"
+    assert (cache.hits, cache.misses) == (3, 1), "permuted constraints, renamed variables and zero atoms shouldn't change the fingerprint"
+
+    # the basis of the cached solution follows the permuted constraints, so the analysis refers to the right ones
+    for solver in [Solver(), Solver(keep_tableaux=False)]:
+        permuted_cache = SolutionCache()
+        production_model([0, 1, 2]).solve(solver, cache=permuted_cache)
+        for order in [[2, 0, 1], [1, 2, 0]]:
+            solution = production_model(order).solve(solver, cache=permuted_cache)
+            results, direct = Analyser().analyse(solution), Analyser().analyse(production_model(order).solve())
+            for name in direct:
+                assert np.allclose(np.array(results[name], dtype=float), np.array(direct[name], dtype=float)), f"{name} of the cached solution should follow the order of the constraints"
+        assert permuted_cache.hits == 2
+
+    changed = production_model([0, 1, 2])
+    changed.constraints[1].bound = 7
+    changed.invalidate()
+    assert changed.compile().fingerprint != production_model([0, 1, 2]).compile().fingerprint, "changed bound should change the fingerprint"
+    assert not np.isclose(changed.solve(cache=cache).objective_value(), expected.objective_value())
+    assert unfeasible_05().solve(cache=cache).is_feasible == False and unfeasible_05().solve(cache=cache).is_feasible == False
+    assert (cache.hits, cache.misses) == (4, 3), "unfeasible results should be cached too"
+
+    limited = SolutionCache()
+    model = production_model([0, 1, 2])
+    assert model.solve(Solver(limits=SolveLimits(iteration_limit=0)), cache=limited).status == Status.ITERATION_LIMIT
+    assert len(limited) == 0 and model.solve(cache=limited).status == Status.OPTIMAL, "interrupted solutions shouldn't be cached"
+    assert (len(limited), limited.hits) == (1, 0) and model.solve(cache=limited).status == Status.OPTIMAL and limited.hits == 1
+
+    small = SolutionCache(max_entries=2)
+    models = [random_sparse_model(10, 15, 40, seed) for seed in range(3)]
+    for model in models + models[:1]:
+        model.solve(RevisedSolver(), cache=small)
+    assert (len(small), small.evictions, small.hits) == (2, 2, 0), "the least recently used solutions should be evicted"
+    models[0].solve(RevisedSolver(), cache=small)
+    assert small.hits == 1, "the most recently solved model should stay in the cache"
+
+    # a presolved solution is cached separately and its tableaux of the reduced model isn't permuted
+    presolved_cache = SolutionCache()
+    presolved = production_model([0, 1, 2]).solve(Solver(presolver=Presolver()), cache=presolved_cache)
+    assert presolved.is_reduced() and production_model([0, 1, 2]).solve(cache=presolved_cache).presolve_report == None, "solution of another solver configuration shouldn't be returned"
+    for order in [[2, 0, 1], [1, 2, 0]]:
+        solution = production_model(order).solve(Solver(presolver=Presolver()), cache=presolved_cache)
+        assert solution.assignment == presolved.assignment and solution.tableaux == None, "tableaux of the reduced model can't follow the permuted constraints"
+    assert (presolved_cache.hits, presolved_cache.misses) == (2, 2)
+
+    tiny = SolutionCache(max_bytes=1024)
+    models[1].solve(cache=tiny)
+    assert len(tiny) == 0 and tiny.nbytes == 0, "solutions larger than the memory limit shouldn't be cached"
+
+    lean = SolutionCache()
+    solution = models[1].solve(Solver(keep_tableaux=False), cache=lean)
+    assert not solution.keeps_tableaux() and lean.nbytes > 24 * 40, "compiled normal model of the released tableaux should be counted"
+
+    logging.info(f"Congratulations! The solutions are reused: {cache}")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,63 @@
+import logging
+import math
+import warnings
+import numpy as np
+from saport.simplex.solver import Solver
+from saport.simplex.interior_point import InteriorPointSolver
+from saport.simplex.analysis_tools.rhs_sensitivity import RHSSensitivityAnalyser
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from saport.simplex.dual_solver import DualSimplexSolver
+from saport.integer.model import Model as IntegerModel
+from saport.minimax.model import Game
+from saport.minimax.solvers.mixed import MixedSolver
+from . import example_models
+from .benchmark_models import random_model
+
+def run():
+    for create_model in example_models.ALL:
+        expected = create_model().solve()
+        solver = InteriorPointSolver()
+        solution = create_model().solve(solver)
+        assert (solution.is_feasible, solution.is_bounded) == (expected.is_feasible, expected.is_bounded), f"interior point changed the result of {expected.model.name}"
+        if expected.assignment == None:
+            assert solver.used_simplex, "unfeasible and unbounded models should be left to the simplex"
+            continue
+        assert math.isclose(solution.objective_value(), expected.objective_value(), abs_tol=1e-6), f"interior point found a wrong objective of {expected.model.name}"
+        assert solution.tableaux.is_optimal() and solution.tableaux.check_basis(), f"crossover should end with an optimal basis of {expected.model.name}"
+
+    # the basic solution of the crossover supports the sensitivity analysis and the reoptimization
+    model = example_models.cost_sensitivity_07()
+    solution = model.solve(InteriorPointSolver())
+    expected = example_models.cost_sensitivity_07().solve()
+    assert np.allclose(RHSSensitivityAnalyser().analyse(solution), RHSSensitivityAnalyser().analyse(expected)), "right hand side ranges should match the simplex ones"
+    assert np.allclose(ObjectiveSensitivityAnalyser().analyse(solution), ObjectiveSensitivityAnalyser().analyse(expected)), "cost ranges should match the simplex ones"
+    reoptimized = DualSimplexSolver().reoptimize(solution, model.variables[2] >= 1)
+    assert math.isclose(reoptimized.objective_value(), DualSimplexSolver().reoptimize(expected, expected.model.variables[2] >= 1).objective_value()), "crossover tableaux should be reoptimized like the simplex one"
+
+    integer_model = IntegerModel("example_27_integer")
+    x1, x2 = integer_model.create_variable("x1"), integer_model.create_variable("x2")
+    integer_model.add_constraint(x1 + x2 <= 6)
+    integer_model.add_constraint(5*x1 + 9*x2 <= 45)
+    integer_model.maximize(5*x1 + 8*x2)
+    assert integer_model.solve(relaxation_solver=InteriorPointSolver()).assignment == [0, 5], "branch and bound should start from the interior point relaxation"
+
+    game = Game(np.random.default_rng(27).integers(0, 100, (60, 60)).astype(float))
+    game_model = MixedSolver(game).create_max_model(game)
+    solver = InteriorPointSolver()
+    solution = game_model.solve(solver)
+    assert math.isclose(solution.objective_value(), game_model.solve(Solver()).objective_value(), abs_tol=1e-6), "interior point should find the game value"
+    assert not solver.used_simplex and solver.interior_iterations < 30, "interior point should converge in a few dozens of iterations"
+    logging.info(f"{game_model.name}: {solver.interior_iterations} interior point iterations, {solver.crossover_pivots} crossover pivots")
+
+    # the tight tolerance takes the iterations close to the optimum, where the weights of the normal equations blow up
+    model = random_model(30, 40, 9)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        solution = model.solve(InteriorPointSolver(tolerance=1e-13))
+    assert math.isclose(solution.objective_value(), model.solve().objective_value(), rel_tol=1e-9), "interior point should stay accurate near the optimum"
+
+    logging.info("Congratulations! The interior point solutions are basic and optimal :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,90 @@
+import logging
+import threading
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver, Formulation
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.dual_solver import DualSimplexSolver
+from saport.simplex.interior_point import InteriorPointSolver
+from saport.simplex.presolve import Presolver
+from saport.simplex.limits import SolveLimits, CancellationToken
+from saport.simplex.solution import Status
+from saport.integer.model import Model as IntegerModel
+from . import example_models
+
+def random_model(size, seed):
+    rng = np.random.default_rng(seed)
+    model = Model(f"example_28_random_{size}")
+    x = model.create_variables(size)
+    model.add_constraints(rng.uniform(1, 10, (size, size)) @ x <= rng.uniform(50, 100, size))
+    model.maximize(rng.uniform(1, 10, size) @ x)
+    return model, x
+
+def is_feasible(model, assignment):
+    compiled = model.compile()
+    assignment = np.array(assignment)
+    return bool(np.all(compiled.sparse_A.matvec(assignment) <= compiled.b + 1e-7) and np.all(assignment >= -1e-9))
+
+def run():
+    for create_model in example_models.ALL:
+        solution = create_model().solve()
+        expected = Status.OPTIMAL if solution.assignment != None else Status.UNBOUNDED if not solution.is_bounded else Status.UNFEASIBLE
+        assert solution.status == expected and not solution.is_interrupted(), f"finished solve of {solution.model.name} should have its status"
+
+    model, x = random_model(40, 28)
+    optimum = model.solve().objective_value()
+    for solver in [Solver(limits=SolveLimits(iteration_limit=3)), RevisedSolver(limits=SolveLimits(iteration_limit=3))]:
+        solution = model.solve(solver)
+        assert solution.status == Status.ITERATION_LIMIT and solver.iterations == 3, "solve should stop after the given number of pivots"
+        assert is_feasible(model, solution.assignment) and solution.objective_value() <= optimum + 1e-9, "basis of the second phase should give a feasible assignment"
+        assert solution.tableaux != None, "interrupted solution should keep the last basis"
+        assert len(solution.assignment) == len(model.variables) and all(type(value) == float for value in solution.assignment), "interrupted assignment should hold only the model variables"
+
+    # the first phase basis isn't feasible, so there is no assignment
+    solution = example_models.solvable_artificial_vars_04().solve(Solver(limits=SolveLimits(iteration_limit=0)))
+    assert solution.status == Status.ITERATION_LIMIT and solution.assignment == None and solution.tableaux != None, "first phase basis should be kept without an assignment"
+
+    solution = model.solve(Solver(presolver=Presolver(), limits=SolveLimits(iteration_limit=2)))
+    assert solution.status == Status.ITERATION_LIMIT and is_feasible(model, solution.assignment), "interrupted assignment should be postsolved"
+    solution = model.solve(Solver(formulation=Formulation.DUAL, limits=SolveLimits(iteration_limit=2)))
+    assert solution.status == Status.ITERATION_LIMIT and solution.assignment == None, "interrupted dual gives no assignment"
+
+    solution = model.solve(InteriorPointSolver(limits=SolveLimits(time_limit=0.0)))
+    assert solution.status == Status.TIME_LIMIT and solution.tableaux == None, "interior point stopped before the crossover has no basis"
+    solution = model.solve(Solver(limits=SolveLimits(time_limit=60.0)))
+    assert solution.status == Status.OPTIMAL and abs(solution.objective_value() - optimum) < 1e-9, "limits that aren't reached shouldn't change the solution"
+
+    # the token is cancelled by another thread, the solve stops at the next iteration
+    token = CancellationToken()
+    def cancel_after_five(event):
+        if event.iteration == 5:
+            canceller = threading.Thread(target=token.cancel)
+            canceller.start()
+            canceller.join()
+    solver = Solver(hooks=[cancel_after_five], limits=SolveLimits(cancellation=token))
+    solution = model.solve(solver)
+    assert solution.status == Status.CANCELLED and solver.iterations == 5, "cancelled solve should stop right after the cancellation"
+    token.reset()
+    assert model.solve(Solver(limits=SolveLimits(cancellation=token))).status == Status.OPTIMAL, "reset token shouldn't stop the solve"
+
+    reoptimized = DualSimplexSolver(limits=SolveLimits(iteration_limit=0)).reoptimize(model.solve(), x.sum() <= 1)
+    assert reoptimized.status == Status.ITERATION_LIMIT and reoptimized.assignment == None, "interrupted reoptimization has no feasible assignment"
+
+    integer_model = IntegerModel("example_28_integer")
+    ys = integer_model.create_variables(12, name="y")
+    integer_model.add_constraint(np.arange(3, 15, dtype=float) @ ys <= 43.5)
+    integer_model.add_constraints(np.eye(12) @ ys <= 1)
+    integer_model.maximize(np.arange(5, 17, dtype=float) @ ys)
+    solution = integer_model.solve(timelimit=0.0)
+    assert integer_model.solver.interrupted and solution.status == Status.TIME_LIMIT, "integer solve should pass its deadline to the relaxations"
+    cancelled = CancellationToken()
+    cancelled.cancel()
+    assert integer_model.solve(cancellation=cancelled).status == Status.CANCELLED, "cancelled integer solve should be marked"
+    solution = integer_model.solve()
+    assert solution.status == Status.OPTIMAL and all(abs(value - round(value)) < 1e-7 for value in solution.assignment), "unlimited integer solve should finish"
+
+    logging.info("Congratulations! The solves stop at their limits and keep the last basis :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
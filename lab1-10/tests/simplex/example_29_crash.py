@@ -0,0 +1,52 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.crash import TriangularCrash
+from .benchmark_models import random_assignment_model, network_test_models
+from .example_models import ALL
+
+def run():
+    for create_model in ALL:
+        expected = create_model().solve()
+        solution = create_model().solve(Solver(crash=TriangularCrash()))
+        assert (solution.is_feasible, solution.is_bounded) == (expected.is_feasible, expected.is_bounded), f"crash changed the result of {expected.model.name}"
+        if expected.assignment != None:
+            assert np.isclose(solution.objective_value(), expected.objective_value()), f"crash changed the objective of {expected.model.name}"
+
+    # x1 can't take the whole right hand side within its upper bound, so x2 covers the row
+    model = Model("example_29_bounds")
+    x1 = model.create_variable("x1", upper=1)
+    x2 = model.create_variable("x2")
+    model.add_constraint(x1 + x2 == 4)
+    model.add_constraint(x1 - x2 <= 1)
+    model.maximize(x1)
+    crash = TriangularCrash()
+    solver = Solver(statistics=True, crash=crash)
+    solution = model.solve(solver)
+    assert (crash.covered_rows, crash.artificial_rows) == (1, 0), "the equality should be covered by a structural column"
+    assert solution.statistics.phase_one_iterations == 0 and np.allclose(solution.assignment, [1.0, 3.0]), "crash basis should be feasible and lead to the optimum"
+    assert solution.initial_tableaux.check_basis(), "first basis of the second phase should be consistent"
+
+    # the uncovered rows keep the artificial variables and the unfeasibility is still detected
+    model = Model("example_29_unfeasible")
+    x1, x2 = model.create_variable("x1"), model.create_variable("x2")
+    model.add_constraint(x1 + x2 == 4)
+    model.add_constraint(x1 + x2 >= 5)
+    model.maximize(x1)
+    assert not model.solve(Solver(crash=TriangularCrash())).is_feasible, "crash shouldn't hide the unfeasibility"
+
+    for model in [random_assignment_model(20)] + network_test_models():
+        plain = model.solve(Solver(statistics=True))
+        crash = TriangularCrash()
+        solution = model.solve(Solver(statistics=True, crash=crash))
+        assert np.isclose(solution.objective_value(), plain.objective_value()), f"crash changed the objective of {model.name}"
+        assert solution.statistics.phase_one_iterations < plain.statistics.phase_one_iterations, f"crash should shorten the first phase of {model.name}"
+        assert crash.covered_rows > crash.artificial_rows, f"crash should cover most of the equalities of {model.name}"
+        logging.info(f"{model.name}: phase one {plain.statistics.phase_one_iterations} -> {solution.statistics.phase_one_iterations} pivots, {crash.artificial_rows} artificial rows left")
+
+    logging.info("Congratulations! The crash basis shortens the first phase :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,60 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver, Formulation
+from saport.simplex.revised_solver import RevisedSolver
+from saport.simplex.dual_solver import DualSimplexSolver
+from saport.simplex.analysis_tools.rhs_sensitivity import RHSSensitivityAnalyser
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from .benchmark_models import random_model
+from . import example_models
+
+def run():
+    for create_model in example_models.ALL:
+        for solver, lean_solver in [(Solver(), Solver(keep_tableaux=False)), (RevisedSolver(keep_tableaux=True), RevisedSolver())]:
+            expected = create_model().solve(solver)
+            solution = create_model().solve(lean_solver)
+            assert solution.status == expected.status and solution.assignment == expected.assignment, f"lean mode changed the solution of {expected.model.name}"
+            assert solution.initial_tableaux == None and not solution.keeps_tableaux(), "lean solution shouldn't hold any tableaux"
+            if expected.tableaux.model is not expected.normal_model:
+                # the first phase tableaux (with the artificial columns) of the unfeasible model isn't kept
+                assert solution.tableaux == None, "first phase tableaux can't be rebuilt"
+                continue
+            assert np.array_equal(solution.basis, expected.tableaux.basis), f"lean solution should keep the basis of {expected.model.name}"
+            assert np.allclose(solution.tableaux.table, expected.tableaux.table) and solution.keeps_tableaux(), f"tableaux of {expected.model.name} should be rebuilt on demand"
+
+    # the sensitivity analysis rebuilds the tableaux (with the variables at their upper bounds) and gets the same ranges
+    model = Model("example_30_bounded")
+    x1, x2, x3 = model.create_variable("x1", upper=2), model.create_variable("x2"), model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+    expected = model.solve()
+    solution = model.solve(Solver(keep_tableaux=False))
+    assert solution.tableaux.complemented.any() and np.array_equal(solution.tableaux.complemented, expected.tableaux.complemented), "variables at their upper bounds should be restored"
+    solution.release_tableaux()
+    assert np.allclose(RHSSensitivityAnalyser().analyse(solution), RHSSensitivityAnalyser().analyse(expected)), "right hand side ranges should match"
+    assert np.allclose(ObjectiveSensitivityAnalyser().analyse(solution), ObjectiveSensitivityAnalyser().analyse(expected)), "cost ranges should match"
+
+    # reoptimization starts from the rebuilt tableaux, the appended rows keep the shifted bounds in the normal model
+    model = Model("example_30_reoptimize")
+    x, y, z = model.create_variable("x", lower=1, upper=6), model.create_variable("y", lower=2), model.create_variable("z")
+    model.add_constraint(x + y + z <= 10)
+    model.add_constraint(2*x + y - z >= 3)
+    model.add_constraint(x - z == 1)
+    model.maximize(3*x + 2*y + z)
+    expected = DualSimplexSolver().reoptimize(model.solve(), x + y >= 8)
+    solution = DualSimplexSolver(keep_tableaux=False).reoptimize(model.solve(Solver(keep_tableaux=False)), x + y >= 8)
+    assert solution.assignment == expected.assignment and not solution.keeps_tableaux(), "lean reoptimization should give the same solution"
+    assert np.allclose(solution.tableaux.table, expected.tableaux.table), "reoptimized tableaux should be rebuilt from the extended normal model"
+
+    model = random_model(30, 40)
+    solution = model.solve(Solver(formulation=Formulation.DUAL, keep_tableaux=False))
+    assert not solution.dual_solution.keeps_tableaux(), "solution of the dual should be released as well"
+    assert np.isclose(solution.objective_value(), model.solve().objective_value()), "lean dual formulation should find the optimum"
+
+    logging.info("Congratulations! The lean solutions rebuild their tableaux when needed :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,85 @@
+"""
+Models from the simplex examples, shared by the tests comparing various solvers with each other.
+Every function returns a fresh model.
+"""
+from saport.simplex.model import Model
+
+
+def solvable_01():
+    model = Model("example_01_solvable")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(x1 <= 150)
+    model.add_constraint(x2 <= 250)
+    model.add_constraint(2*x1 + x2 <= 500)
+    model.maximize(8 * x1 + 5 * x2)
+    return model
+
+
+def solvable_02():
+    model = Model("example_02_solvable")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + 3*x2 + 2*x3 <= 10)
+    model.add_constraint(-1*x1 - 5*x2 - 1*x3 >= -8)
+    model.minimize(-8 * x1 - 10 * x2 - 7 * x3)
+    return model
+
+
+def unbounded_03():
+    model = Model("example_03_unbounded")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + 3*x2 + 2*x3 >= 10)
+    model.add_constraint(x1 + 5*x2 + 1*x3 >= -7)
+    model.maximize(5 * x1 + 8 * x2)
+    return model
+
+
+def solvable_artificial_vars_04():
+    model = Model("example_04_solvable_artificial_vars")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(2*x1 - x2 <= -1)
+    model.add_constraint(x1 + x2 == 3)
+    model.maximize(x1 + 3 * x2)
+    return model
+
+
+def unfeasible_05():
+    model = Model("example_05_unfeasible")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(2*x1 - x2 <= -1)
+    model.add_constraint(x1 + x2 == 3)
+    model.add_constraint(x1 + x2 >= 4)
+    model.maximize(x1 + 3 * x2)
+    return model
+
+
+def dual_06():
+    model = Model("example_06_dual")
+    x0 = model.create_variable("x0")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    model.add_constraint(4*x0 + 8*x1 - x2 <= 5)
+    model.add_constraint(7*x0 - 2*x1 + 2*x2 >= 4)
+    model.maximize(3*x0 + 2*x1 - 6*x2)
+    return model
+
+
+def cost_sensitivity_07():
+    model = Model("example_07_cost_sensitivity")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.add_constraint(x1 <= 8)
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+    return model
+
+
+ALL = [solvable_01, solvable_02, unbounded_03, solvable_artificial_vars_04, unfeasible_05, dual_06, cost_sensitivity_07]
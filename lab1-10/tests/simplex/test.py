@@ -1,6 +1,6 @@
 import importlib
 import os
-test_modules = ['example_01_solvable', 'example_02_solvable', 'example_03_unbounded', 'example_04_solvable_artificial_vars', 'example_05_unfeasible', 'example_06_dual', 'example_07_cost_sensitivity']
+test_modules = ['example_01_solvable', 'example_02_solvable', 'example_03_unbounded', 'example_04_solvable_artificial_vars', 'example_05_unfeasible', 'example_06_dual', 'example_07_cost_sensitivity', 'example_08_revised_solver', 'example_09_sparse_matrix', 'example_10_pricing_rules', 'example_11_basis_bookkeeping', 'example_12_dual_simplex', 'example_13_compiled_model', 'example_14_expressions', 'example_15_copy_free_solve', 'example_16_presolve', 'example_17_bounded_variables', 'example_18_scenarios', 'example_19_rhs_sensitivity', 'example_20_parametric', 'example_21_statistics', 'example_22_degeneracy', 'example_23_model_files', 'example_24_dual_formulation', 'example_25_bulk_modeling', 'example_26_solution_cache', 'example_27_interior_point', 'example_28_limits', 'example_29_crash', 'example_30_lean_solutions']
 test_dir = 'tests.simplex'
 print("Running tests...")
 success = True